@@ -0,0 +1,55 @@
+"""Compute PostGIS location as a generated column
+
+Revision ID: 003_generated_location_column
+Revises: 002_add_postgis_geometry
+Create Date: 2025-10-16 12:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "003_generated_location_column"
+down_revision = "002_add_postgis_geometry"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Replace the application-maintained column with a stored generated column.
+    # Existing rows are populated once by the ADD COLUMN rewrite, and new rows
+    # get their geometry at INSERT time without a follow-up UPDATE.
+    op.execute("DROP INDEX IF EXISTS ix_earthquakes_location_gist;")
+    op.drop_column("earthquakes", "location")
+    op.execute(
+        """
+        ALTER TABLE earthquakes
+        ADD COLUMN location geometry(Point, 4326)
+        GENERATED ALWAYS AS (
+            ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)
+        ) STORED;
+    """
+    )
+
+    # Recreate spatial index
+    op.execute(
+        "CREATE INDEX ix_earthquakes_location_gist ON earthquakes USING GIST (location);"
+    )
+
+
+def downgrade() -> None:
+    # Drop spatial index and generated column
+    op.execute("DROP INDEX IF EXISTS ix_earthquakes_location_gist;")
+    op.drop_column("earthquakes", "location")
+
+    # Restore the plain geometry column from migration 002
+    op.execute("ALTER TABLE earthquakes ADD COLUMN location geometry(Point, 4326);")
+    op.execute(
+        "CREATE INDEX ix_earthquakes_location_gist ON earthquakes USING GIST (location);"
+    )
+    op.execute(
+        """
+        UPDATE earthquakes
+        SET location = ST_SetSRID(ST_MakePoint(longitude, latitude), 4326);
+    """
+    )
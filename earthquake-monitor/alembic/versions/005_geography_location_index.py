@@ -0,0 +1,30 @@
+"""Index location as geography for radius searches
+
+Revision ID: 005_geography_location_index
+Revises: 004_cluster_earthquakes_by_location
+Create Date: 2026-10-16 12:00:00.000000
+
+Radius searches compare distances in meters with
+``ST_DWithin(location::geography, ...)``. The planner can only use a GiST
+index for that predicate if it is built on the same geography expression.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "005_geography_location_index"
+down_revision = "004_cluster_earthquakes_by_location"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_earthquakes_location_geography_gist "
+        "ON earthquakes USING GIST ((location::geography));"
+    )
+    op.execute("ANALYZE earthquakes;")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_earthquakes_location_geography_gist;")
@@ -6,15 +6,39 @@ This script fetches earthquake data from the USGS API and ingests it into the sy
 """
 
 import asyncio
+import dbm
+import hashlib
+import logging
 import os
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import httpx
+import orjson
 
 from src.application.dto.create_earthquake_request import CreateEarthquakeRequest
+from src.application.events.event_publisher import InMemoryEventPublisher
+from src.application.services.earthquake_event_orchestrator import (
+    EarthquakeEventOrchestrator,
+)
 from src.application.use_cases.create_earthquake import CreateEarthquakeUseCase
-from src.presentation.dependencies import get_earthquake_repository
+from src.domain.exceptions import DomainException
+from src.domain.services.earthquake_factory_service import EarthquakeFactoryService
+from src.domain.services.earthquake_validation_service import (
+    EarthquakeValidationService,
+)
+from src.infrastructure.database.config import get_async_session_for_background
+from src.infrastructure.external.usgs_service import (
+    magnitude_scale_from_usgs,
+    usgs_timestamp_to_datetime,
+)
+from src.infrastructure.factory import create_earthquake_repository
+
+logger = logging.getLogger(__name__)
+
+# Requests handed to the bulk insert path at a time
+INGESTION_CHUNK_SIZE = 500
 
 
 class USGSClient:
@@ -24,6 +48,22 @@ class USGSClient:
         self.base_url = base_url or os.getenv(
             "USGS_API_BASE_URL", "https://earthquake.usgs.gov/fdsnws/event/1"
         )
+        # One client per USGSClient so connections are kept alive between calls
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "USGSClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
 
     async def fetch_earthquakes(
         self,
@@ -32,6 +72,20 @@ class USGSClient:
         min_magnitude: float = 2.5,
     ) -> list[dict[str, Any]]:
         """Fetch earthquakes from USGS API."""
+        return [
+            feature
+            async for feature in self.iter_earthquakes(
+                start_time, end_time, min_magnitude
+            )
+        ]
+
+    async def iter_earthquakes(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        min_magnitude: float = 2.5,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield earthquake features from USGS API one at a time."""
         params = {
             "format": "geojson",
             "starttime": start_time.isoformat(),
@@ -39,84 +93,263 @@ class USGSClient:
             "minmagnitude": min_magnitude,
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{self.base_url}/query", params=params)
-            response.raise_for_status()
-            data = response.json()
+        response = await self._client.get("/query", params=params)
+        response.raise_for_status()
+
+        # Decode the raw bytes with orjson instead of response.json()
+        for feature in orjson.loads(response.content).get("features", []):
+            yield feature
 
-        return data.get("features", [])
+
+class FeatureCache:
+    """Persistent record of already-ingested USGS features (stdlib dbm).
+
+    Policies:
+        enabled: skip known features and record newly ingested ones
+        replay: skip known features, never record (read-only)
+        write-only: record ingested features, never skip
+        disabled: no cache at all
+    """
+
+    POLICIES = ("enabled", "replay", "write-only", "disabled")
+
+    def __init__(self, path: str, policy: str = "enabled"):
+        if policy not in self.POLICIES:
+            raise ValueError(
+                f"Invalid cache policy: {policy}. "
+                f"Valid policies: {', '.join(self.POLICIES)}"
+            )
+        self.policy = policy
+        self._db = dbm.open(path, "c") if policy != "disabled" else None
+
+    @staticmethod
+    def key_for(feature: dict[str, Any]) -> bytes:
+        """Key a feature by its USGS id, origin time and magnitude."""
+        properties = feature["properties"]
+        raw = f"{feature.get('id')}|{properties['time']}|{properties['mag']}"
+        return hashlib.sha256(raw.encode()).digest()[:16]
+
+    def contains(self, key: bytes) -> bool:
+        """Whether the feature was ingested before (always False if not read)."""
+        if self.policy not in ("enabled", "replay"):
+            return False
+        return key in self._db
+
+    def add_many(self, keys: list[bytes]) -> None:
+        """Record successfully ingested features."""
+        if self.policy not in ("enabled", "write-only"):
+            return
+        for key in keys:
+            self._db[key] = b""
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
 
 
 class EarthquakeIngestionService:
     """Service for ingesting earthquake data."""
 
-    def __init__(self, use_case: CreateEarthquakeUseCase):
+    def __init__(
+        self,
+        use_case: CreateEarthquakeUseCase,
+        feature_cache: FeatureCache | None = None,
+    ):
         self.use_case = use_case
+        self.feature_cache = feature_cache
 
     async def ingest_earthquakes(
-        self, earthquakes_data: list[dict[str, Any]]
+        self,
+        earthquakes_data: Iterable[dict[str, Any]] | AsyncIterable[dict[str, Any]],
     ) -> dict[str, int]:
-        """Ingest earthquake data into the system."""
+        """Ingest earthquake data into the system.
+
+        Features are consumed as they arrive and written in chunks, so a
+        streamed source never has to be materialized in full.
+        """
         created = 0
+        existing = 0
         errors = 0
+        parse_errors = 0
+        skipped = 0
 
-        for feature in earthquakes_data:
+        # (cache key, request) pairs waiting to be written
+        pending = []
+        async for feature in _iterate(earthquakes_data):
             try:
-                properties = feature["properties"]
-                geometry = feature["geometry"]
-                coordinates = geometry["coordinates"]
-
-                request = CreateEarthquakeRequest(
-                    latitude=coordinates[1],
-                    longitude=coordinates[0],
-                    depth=coordinates[2],
-                    magnitude_value=properties["mag"],
-                    magnitude_scale=properties.get("magType", "unknown"),
-                    occurred_at=datetime.fromtimestamp(properties["time"] / 1000),
-                    source="USGS",
+                cache_key = None
+                if self.feature_cache is not None:
+                    cache_key = self.feature_cache.key_for(feature)
+                    if self.feature_cache.contains(cache_key):
+                        skipped += 1
+                        continue
+                pending.append((cache_key, self._feature_to_request(feature)))
+            except Exception:
+                logger.debug("Error parsing earthquake feature", exc_info=True)
+                parse_errors += 1
+
+            if len(pending) >= INGESTION_CHUNK_SIZE:
+                chunk_created, chunk_existing, chunk_errors = await self._ingest_chunk(
+                    pending
                 )
+                created += chunk_created
+                existing += chunk_existing
+                errors += chunk_errors
+                pending = []
+
+        if pending:
+            chunk_created, chunk_existing, chunk_errors = await self._ingest_chunk(
+                pending
+            )
+            created += chunk_created
+            existing += chunk_existing
+            errors += chunk_errors
+
+        # One summary instead of a line per bad row
+        if parse_errors:
+            logger.warning("Skipped %d malformed earthquake features", parse_errors)
+        if errors:
+            logger.warning("Failed to ingest %d earthquakes", errors)
+        if skipped:
+            logger.info("Skipped %d features already in the feature cache", skipped)
+
+        return {
+            "created": created,
+            "existing": existing,
+            "errors": errors + parse_errors,
+            "skipped": skipped,
+        }
+
+    async def _ingest_chunk(
+        self, pending: list[tuple[bytes | None, CreateEarthquakeRequest]]
+    ) -> tuple[int, int, int]:
+        """Bulk insert one chunk, retrying row by row if it fails.
 
-                await self.use_case.execute(request)
-                created += 1
+        Returns the number of earthquakes created, already stored and failed.
+        Only validation and write failures are retried; a failure while
+        publishing events for committed rows propagates.
+        """
+        try:
+            created_ids = await self.use_case.execute_many(
+                [request for _, request in pending]
+            )
+        except DomainException as e:
+            # One bad row fails the whole multi-row INSERT, so retry the
+            # chunk row by row to keep the good ones
+            logger.warning("Bulk insert failed, retrying chunk per row: %s", e)
+            return await self._ingest_one_by_one(pending)
 
-            except Exception as e:
-                print(f"Error ingesting earthquake: {e}")
+        # Rows already stored were skipped by the insert but are known too
+        self._remember([cache_key for cache_key, _ in pending])
+        return len(created_ids), len(pending) - len(created_ids), 0
+
+    async def _ingest_one_by_one(
+        self, pending: list[tuple[bytes | None, CreateEarthquakeRequest]]
+    ) -> tuple[int, int, int]:
+        """Fallback path: create each earthquake on its own.
+
+        Rows go through the bulk path one at a time, so rows committed before
+        the chunk failed are reported as already stored, not published again.
+        """
+        ingested_keys = []
+        created = 0
+        errors = 0
+        for cache_key, request in pending:
+            try:
+                created += len(await self.use_case.execute_many([request]))
+                ingested_keys.append(cache_key)
+            except DomainException:
+                logger.debug("Error ingesting earthquake", exc_info=True)
                 errors += 1
 
-        return {"created": created, "errors": errors}
+        self._remember(ingested_keys)
+        return created, len(ingested_keys) - created, errors
+
+    def _remember(self, cache_keys: list[bytes | None]) -> None:
+        """Record ingested features in the feature cache, if any."""
+        if self.feature_cache is not None:
+            self.feature_cache.add_many(cache_keys)
+
+    @staticmethod
+    def _feature_to_request(feature: dict[str, Any]) -> CreateEarthquakeRequest:
+        """Convert a USGS GeoJSON feature into a create request."""
+        properties = feature["properties"]
+        geometry = feature["geometry"]
+        coordinates = geometry["coordinates"]
+
+        return CreateEarthquakeRequest(
+            latitude=coordinates[1],
+            longitude=coordinates[0],
+            depth=coordinates[2],
+            magnitude_value=properties["mag"],
+            magnitude_scale=magnitude_scale_from_usgs(properties.get("magType")).value,
+            occurred_at=usgs_timestamp_to_datetime(properties["time"]),
+            source="USGS",
+            # USGS event id lets the repository skip already stored events
+            external_id=feature.get("id"),
+            title=properties.get("title"),
+        )
+
+
+async def _iterate(
+    items: Iterable[dict[str, Any]] | AsyncIterable[dict[str, Any]],
+) -> AsyncIterator[dict[str, Any]]:
+    """Iterate plain and async iterables alike."""
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
 
 
 async def main():
     """Main ingestion function."""
-    print("Starting USGS earthquake data ingestion...")
-
-    # Initialize services
-    repository = get_earthquake_repository()
-    use_case = CreateEarthquakeUseCase(repository)
-    usgs_client = USGSClient()
-    ingestion_service = EarthquakeIngestionService(use_case)
+    logging.basicConfig(level=logging.INFO)
+    logger.info("Starting USGS earthquake data ingestion...")
 
     # Fetch data from last 24 hours
     end_time = datetime.now(UTC)
     start_time = end_time - timedelta(hours=24)
 
-    print(f"Fetching earthquakes from {start_time} to {end_time}")
+    logger.info("Fetching earthquakes from %s to %s", start_time, end_time)
 
-    try:
-        earthquakes_data = await usgs_client.fetch_earthquakes(
-            start_time=start_time,
-            end_time=end_time,
-            min_magnitude=2.5,
-        )
+    # Local record of ingested features so re-polls skip known windows
+    feature_cache = FeatureCache(
+        os.getenv("USGS_FEATURE_CACHE_PATH", ".usgs_feature_cache"),
+        policy=os.getenv("CACHE_POLICY", "enabled"),
+    )
+
+    async with USGSClient() as usgs_client:
+        try:
+            earthquakes_data = usgs_client.iter_earthquakes(
+                start_time=start_time,
+                end_time=end_time,
+                min_magnitude=2.5,
+            )
 
-        print(f"Found {len(earthquakes_data)} earthquakes to process")
+            async with get_async_session_for_background() as session:
+                # Initialize services
+                repository = await create_earthquake_repository(session)
+                use_case = CreateEarthquakeUseCase(
+                    repository,
+                    EarthquakeEventOrchestrator(InMemoryEventPublisher()),
+                    EarthquakeValidationService(),
+                    EarthquakeFactoryService(),
+                )
+                ingestion_service = EarthquakeIngestionService(use_case, feature_cache)
+                result = await ingestion_service.ingest_earthquakes(
+                    earthquakes_data
+                )
 
-        result = await ingestion_service.ingest_earthquakes(earthquakes_data)
+            logger.info("Ingestion completed: %s", result)
 
-        print(f"Ingestion completed: {result}")
+        except Exception as e:
+            logger.error("Ingestion failed: %s", e)
 
-    except Exception as e:
-        print(f"Ingestion failed: {e}")
+        finally:
+            feature_cache.close()
 
 
 if __name__ == "__main__":
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from datetime import UTC, datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class CreateEarthquakeRequest:
     """Request object for creating an earthquake."""
 
@@ -1,8 +1,10 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
 
+__all__ = ["EarthquakeFilters", "PaginationParams", "PaginatedResponse"]
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class EarthquakeFilters:
     min_magnitude: float | None = None
     max_magnitude: float | None = None
@@ -14,8 +16,20 @@ class EarthquakeFilters:
     is_reviewed: bool | None = None
     source: str | None = None
 
+    def to_repository_dict(self) -> dict | None:
+        """Return the filters that are set, or None when no filter is set."""
+        filter_dict = {
+            name: value
+            for name in _FILTER_FIELDS
+            if (value := getattr(self, name)) is not None
+        }
+        return filter_dict or None
+
+
+_FILTER_FIELDS = tuple(field.name for field in fields(EarthquakeFilters))
+
 
-@dataclass
+@dataclass(slots=True)
 class PaginationParams:
     page: int = 1
     size: int = 50
@@ -33,7 +47,7 @@ class PaginationParams:
         return (self.page - 1) * self.size
 
 
-@dataclass
+@dataclass(slots=True)
 class PaginatedResponse:
     items: list
     total: int
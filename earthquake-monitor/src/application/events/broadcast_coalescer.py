@@ -0,0 +1,69 @@
+"""Coalesces earthquake broadcasts into batched WebSocket frames."""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.infrastructure.external.websocket_manager import WebSocketManager
+
+logger = logging.getLogger(__name__)
+
+
+class BroadcastCoalescer:
+    """Buffers earthquake updates and sends them as one frame per flush.
+
+    Updates are flushed when the buffer reaches ``max_items`` or
+    ``flush_interval`` seconds after the first buffered update, whichever
+    comes first.
+    """
+
+    def __init__(
+        self,
+        websocket_manager: "WebSocketManager",
+        flush_interval: float = 0.2,
+        max_items: int = 64,
+    ):
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be positive")
+        if max_items < 1:
+            raise ValueError("max_items must be at least 1")
+
+        self._websocket_manager = websocket_manager
+        self._flush_interval = flush_interval
+        self._max_items = max_items
+        self._pending: list[tuple[dict, Any]] = []
+        self._flush_task: asyncio.Task | None = None
+
+    async def enqueue(self, message: dict, earthquake: Any = None) -> None:
+        """Buffer an update, flushing immediately if the buffer is full."""
+        self._pending.append((message, earthquake))
+
+        if len(self._pending) >= self._max_items:
+            await self.flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def flush(self) -> None:
+        """Send all buffered updates now."""
+        # Cancel the pending timer unless it is the one running this flush
+        task, self._flush_task = self._flush_task, None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+
+        if not self._pending:
+            return
+
+        items, self._pending = self._pending, []
+        try:
+            await self._websocket_manager.broadcast_earthquake_batch(items)
+        except Exception as e:
+            logger.error("Error flushing %d coalesced broadcasts: %s", len(items), e)
+
+    async def close(self) -> None:
+        """Flush whatever is still buffered."""
+        await self.flush()
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._flush_interval)
+        await self.flush()
@@ -1,204 +1,267 @@
-import asyncio
 import logging
-from datetime import UTC, datetime
+import os
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from typing import TYPE_CHECKING
 
+from src.application.cache import TTLCache
+from src.application.events.broadcast_coalescer import BroadcastCoalescer
+from src.application.events.id_batch_fetcher import IdBatchFetcher
+from src.application.events.token_bucket import TokenBucket
 from src.domain.events.earthquake_detected import EarthquakeDetected
 from src.domain.events.high_magnitude_alert import HighMagnitudeAlert
 
 if TYPE_CHECKING:
+    from src.domain.entities.earthquake import Earthquake
     from src.domain.repositories.earthquake_repository import EarthquakeRepository
     from src.infrastructure.external.websocket_manager import WebSocketManager
 
 logger = logging.getLogger(__name__)
 
+# Opens a repository for the duration of an ``async with`` block
+RepositoryProvider = Callable[[], AbstractAsyncContextManager["EarthquakeRepository"]]
+
+# Short-lived cache of earthquakes looked up by the handlers, so that repeated
+# events for the same id do not each cost a database round-trip
+EARTHQUAKE_CACHE_MAXSIZE = 4096
+EARTHQUAKE_CACHE_TTL_SECONDS = 30
+
+# Broadcast rate limit: bursts of up to 20 pass immediately, sustained load is
+# held to 10 broadcasts per second
+BROADCAST_BURST_CAPACITY = 20
+BROADCAST_REFILL_PER_SECOND = 10
+
+# Largest number of earthquake updates sent in one coalesced frame
+COALESCE_MAX_ITEMS = 64
+
 
 class EarthquakeEventHandlers:
+    __slots__ = (
+        "_websocket_manager",
+        "_earthquake_repository",
+        "_repository_provider",
+        "_earthquake_cache",
+        "_verify_alerts_against_db",
+        "_broadcast_bucket",
+        "_coalescer",
+        "_id_fetcher",
+    )
+
     def __init__(
         self,
         websocket_manager: "WebSocketManager",
         earthquake_repository: "EarthquakeRepository" = None,
         filter_service=None,
+        repository_provider: RepositoryProvider | None = None,
     ):
         self._websocket_manager = websocket_manager
         self._earthquake_repository = earthquake_repository
+        self._repository_provider = repository_provider
+        self._earthquake_cache = TTLCache(
+            maxsize=EARTHQUAKE_CACHE_MAXSIZE, ttl=EARTHQUAKE_CACHE_TTL_SECONDS
+        )
+
+        # Alerts carry everything needed for the broadcast; only re-read the
+        # earthquake from the database when explicitly asked to
+        self._verify_alerts_against_db = (
+            os.getenv("VERIFY_ALERTS_AGAINST_DB", "false").lower() == "true"
+        )
+        self._broadcast_bucket = TokenBucket(
+            capacity=BROADCAST_BURST_CAPACITY,
+            refill_rate=BROADCAST_REFILL_PER_SECOND,
+        )
+
+        # Optionally batch earthquake updates into one frame per window
+        coalesce_ms = float(os.getenv("WEBSOCKET_COALESCE_MS", "0"))
+        self._coalescer = (
+            BroadcastCoalescer(
+                websocket_manager,
+                flush_interval=coalesce_ms / 1000,
+                max_items=COALESCE_MAX_ITEMS,
+            )
+            if coalesce_ms > 0
+            else None
+        )
+
+        # Optionally merge lookups arriving within a window into one query
+        lookup_batch_ms = float(os.getenv("EVENT_LOOKUP_BATCH_MS", "0"))
+        self._id_fetcher = (
+            IdBatchFetcher(self._repository_scope, window=lookup_batch_ms / 1000)
+            if lookup_batch_ms > 0
+            else None
+        )
 
         # Set up filtering if provided
         if filter_service:
             self._websocket_manager.set_filter_service(filter_service)
 
-    async def _get_repository(self):
-        """Get earthquake repository instance."""
-        if self._earthquake_repository is None:
-            # Dynamic import to get repository factory
-            from src.infrastructure.database.config import (
-                get_async_session_for_background,
-            )
-            from src.infrastructure.factory import create_earthquake_repository
+    @asynccontextmanager
+    async def _repository_scope(self) -> AsyncIterator["EarthquakeRepository"]:
+        """Yield a repository whose session lives only for this block."""
+        if self._earthquake_repository is not None:
+            yield self._earthquake_repository
+            return
 
-            async with get_async_session_for_background() as session:
-                self._earthquake_repository = await create_earthquake_repository(
-                    session
-                )
+        if self._repository_provider is None:
+            raise RuntimeError("No earthquake repository or provider configured")
+
+        async with self._repository_provider() as repository:
+            yield repository
+
+    async def _find_earthquake(self, earthquake_id: str) -> "Earthquake | None":
+        """Look up an earthquake, serving recent lookups from the cache."""
+        earthquake = self._earthquake_cache.get(earthquake_id)
+        if earthquake is not None:
+            return earthquake
+
+        if self._id_fetcher is not None:
+            earthquake = await self._id_fetcher.get(earthquake_id)
+        else:
+            async with self._repository_scope() as repository:
+                earthquake = await repository.find_by_id(earthquake_id)
 
-        return self._earthquake_repository
+        if earthquake is not None:
+            self._earthquake_cache.set(earthquake_id, earthquake)
+        return earthquake
+
+    async def close(self) -> None:
+        """Send any coalesced earthquake updates that are still buffered."""
+        if self._coalescer is not None:
+            await self._coalescer.close()
 
     async def handle_earthquake_detected(self, event: EarthquakeDetected) -> None:
         logger.info(
-            f"Earthquake detected: {event.earthquake_id} with magnitude {event.magnitude}"
+            "Earthquake detected: %s with magnitude %s",
+            event.earthquake_id,
+            event.magnitude,
         )
 
-        try:
-            # Get repository and query database to get the actual earthquake with current state
-            repository = await self._get_repository()
-            earthquake = await repository.find_by_id(event.earthquake_id)
-
-            if earthquake:
-                # Send actual database data (ensures no duplicates/stale data)
-                earthquake_data = {
-                    "type": "earthquake_detected",
-                    "data": {
-                        "id": earthquake.id,
-                        "magnitude": earthquake.magnitude.value,
-                        "latitude": earthquake.location.latitude,
-                        "longitude": earthquake.location.longitude,
-                        "depth": earthquake.location.depth,
-                        "occurred_at": earthquake.occurred_at.isoformat(),
-                        "source": earthquake.source,
-                        "title": earthquake.title,
-                        "timestamp": datetime.now(UTC).isoformat(),
-                        "alert_level": earthquake.magnitude.get_alert_level(),
-                    },
-                }
-
-                await self._websocket_manager.broadcast_earthquake_update(
-                    earthquake_data, earthquake
-                )
-                # Add small delay to prevent burst sending when multiple earthquakes are processed
-                await asyncio.sleep(0.15)  # 150ms delay between earthquake broadcasts
+        earthquake = event.earthquake
+        if earthquake is not None:
+            # The publisher attached the entity it just stored, no need to
+            # read it back
+            self._earthquake_cache.set(event.earthquake_id, earthquake)
+        else:
+            try:
+                # Query database to get the actual earthquake with current state
+                earthquake = await self._find_earthquake(event.earthquake_id)
+                if earthquake is None:
+                    logger.warning(
+                        "Earthquake %s not found in database", event.earthquake_id
+                    )
+            except Exception as e:
+                logger.error("Error handling earthquake detected event: %s", e)
 
-                # Only send recent earthquakes update occasionally to avoid message size issues
-                # This prevents sending large lists with every single earthquake
+        # Send actual database data when available, otherwise fall back to
+        # the event data
+        payload = self._build_detected_payload(event, earthquake)
+        if self._coalescer is not None:
+            await self._coalescer.enqueue(payload, earthquake)
+            return
 
-            else:
-                logger.warning(
-                    f"Earthquake {event.earthquake_id} not found in database"
-                )
-                # Fallback to event data if not found in database
-                await self._websocket_manager.broadcast_earthquake_update(
-                    {
-                        "type": "earthquake_detected",
-                        "data": {
-                            "id": event.earthquake_id,
-                            "magnitude": event.magnitude,
-                            "latitude": event.latitude,
-                            "longitude": event.longitude,
-                            "depth": event.depth,
-                            "occurred_at": event.occurred_at.isoformat(),
-                            "source": event.source,
-                            "title": event.title,
-                            "timestamp": event.timestamp.isoformat(),
-                        },
-                    }
-                )
-                # Add small delay to prevent burst sending when multiple earthquakes are processed
-                await asyncio.sleep(0.15)  # 150ms delay between earthquake broadcasts
+        await self._broadcast_bucket.acquire()
+        await self._websocket_manager.broadcast_earthquake_update(payload, earthquake)
 
-        except Exception as e:
-            logger.error(f"Error handling earthquake detected event: {e}")
-            # Fallback to event data if database query fails
-            await self._websocket_manager.broadcast_earthquake_update(
-                {
-                    "type": "earthquake_detected",
-                    "data": {
-                        "id": event.earthquake_id,
-                        "magnitude": event.magnitude,
-                        "latitude": event.latitude,
-                        "longitude": event.longitude,
-                        "depth": event.depth,
-                        "occurred_at": event.occurred_at.isoformat(),
-                        "source": event.source,
-                        "title": event.title,
-                        "timestamp": event.timestamp.isoformat(),
-                    },
-                }
-            )
-            # Add small delay to prevent burst sending when multiple earthquakes are processed
-            await asyncio.sleep(0.15)  # 150ms delay between earthquake broadcasts
+    @staticmethod
+    def _build_detected_payload(
+        event: EarthquakeDetected, earthquake: "Earthquake | None" = None
+    ) -> dict:
+        """Build the earthquake_detected message from stored data or the event."""
+        if earthquake is None:
+            data = {
+                "id": event.earthquake_id,
+                "magnitude": event.magnitude,
+                "latitude": event.latitude,
+                "longitude": event.longitude,
+                "depth": event.depth,
+                "occurred_at": event.occurred_at.isoformat(),
+                "source": event.source,
+                "title": event.title,
+                "timestamp": event.timestamp.isoformat(),
+            }
+        else:
+            data = {
+                "id": earthquake.id,
+                "magnitude": earthquake.magnitude.value,
+                "latitude": earthquake.location.latitude,
+                "longitude": earthquake.location.longitude,
+                "depth": earthquake.location.depth,
+                "occurred_at": earthquake.occurred_at.isoformat(),
+                "source": earthquake.source,
+                "title": earthquake.title,
+                "timestamp": event.timestamp.isoformat(),
+                "alert_level": earthquake.magnitude.get_alert_level(),
+            }
+        return {"type": "earthquake_detected", "data": data}
 
     async def handle_high_magnitude_alert(self, event: HighMagnitudeAlert) -> None:
         logger.warning(
-            f"High magnitude alert: {event.earthquake_id} with magnitude {event.magnitude}"
+            "High magnitude alert: %s with magnitude %s",
+            event.earthquake_id,
+            event.magnitude,
         )
 
+        if not self._verify_alerts_against_db:
+            await self._websocket_manager.broadcast_alert(
+                self._build_alert_payload(event), alert=event
+            )
+            return
+
+        earthquake = None
         try:
-            # Get repository and query database to get the actual high-magnitude earthquake
-            repository = await self._get_repository()
-            earthquake = await repository.find_by_id(event.earthquake_id)
-
-            if earthquake and earthquake.magnitude.is_significant():
-                # Send actual database data with calculated values
-                alert_data = {
-                    "type": "high_magnitude_alert",
-                    "data": {
-                        "earthquake_id": earthquake.id,
-                        "magnitude": earthquake.magnitude.value,
-                        "alert_level": earthquake.magnitude.get_alert_level(),
-                        "latitude": earthquake.location.latitude,
-                        "longitude": earthquake.location.longitude,
-                        "depth": earthquake.location.depth,
-                        "affected_radius_km": earthquake.calculate_affected_radius_km(),
-                        "requires_immediate_response": earthquake.requires_immediate_alert(),
-                        "occurred_at": earthquake.occurred_at.isoformat(),
-                        "source": earthquake.source,
-                        "timestamp": datetime.now(UTC).isoformat(),
-                    },
-                }
-
-                await self._websocket_manager.broadcast_alert(alert_data, earthquake)
-
-                # Only send high magnitude earthquakes update occasionally to avoid message size issues
-                # This prevents sending large lists with every alert
-
-            else:
+            # Query database to get the actual high-magnitude earthquake
+            earthquake = await self._find_earthquake(event.earthquake_id)
+            if earthquake is None or not earthquake.magnitude.is_significant():
                 logger.warning(
-                    f"High magnitude earthquake {event.earthquake_id} not found or not significant"
-                )
-                # Fallback to event data if not found in database
-                await self._websocket_manager.broadcast_alert(
-                    {
-                        "type": "high_magnitude_alert",
-                        "data": {
-                            "earthquake_id": event.earthquake_id,
-                            "magnitude": event.magnitude,
-                            "alert_level": event.alert_level,
-                            "latitude": event.latitude,
-                            "longitude": event.longitude,
-                            "affected_radius_km": event.affected_radius_km,
-                            "requires_immediate_response": event.requires_immediate_response,
-                            "timestamp": event.timestamp.isoformat(),
-                        },
-                    }
+                    "High magnitude earthquake %s not found or not significant",
+                    event.earthquake_id,
                 )
-
+                earthquake = None
         except Exception as e:
-            logger.error(f"Error handling high magnitude alert event: {e}")
-            # Fallback to event data if database query fails
-            await self._websocket_manager.broadcast_alert(
-                {
-                    "type": "high_magnitude_alert",
-                    "data": {
-                        "earthquake_id": event.earthquake_id,
-                        "magnitude": event.magnitude,
-                        "alert_level": event.alert_level,
-                        "latitude": event.latitude,
-                        "longitude": event.longitude,
-                        "affected_radius_km": event.affected_radius_km,
-                        "requires_immediate_response": event.requires_immediate_response,
-                        "timestamp": event.timestamp.isoformat(),
-                    },
-                }
-            )
+            logger.error("Error handling high magnitude alert event: %s", e)
+
+        await self._websocket_manager.broadcast_alert(
+            self._build_alert_payload(event, earthquake), earthquake, alert=event
+        )
+
+    @staticmethod
+    def _build_alert_payload(
+        event: HighMagnitudeAlert, earthquake: "Earthquake | None" = None
+    ) -> dict:
+        """Build the high_magnitude_alert message from stored data or the event."""
+        if earthquake is None:
+            data = {
+                "earthquake_id": event.earthquake_id,
+                "magnitude": event.magnitude,
+                "alert_level": event.alert_level,
+                "latitude": event.latitude,
+                "longitude": event.longitude,
+                "affected_radius_km": event.affected_radius_km,
+                "requires_immediate_response": event.requires_immediate_response,
+                "timestamp": event.timestamp.isoformat(),
+            }
+            # Newer events also carry the remaining earthquake details
+            if event.depth is not None:
+                data["depth"] = event.depth
+            if event.occurred_at is not None:
+                data["occurred_at"] = event.occurred_at.isoformat()
+            if event.source is not None:
+                data["source"] = event.source
+        else:
+            data = {
+                "earthquake_id": earthquake.id,
+                "magnitude": earthquake.magnitude.value,
+                "alert_level": earthquake.magnitude.get_alert_level(),
+                "latitude": earthquake.location.latitude,
+                "longitude": earthquake.location.longitude,
+                "depth": earthquake.location.depth,
+                "affected_radius_km": earthquake.calculate_affected_radius_km(),
+                "requires_immediate_response": earthquake.requires_immediate_alert(),
+                "occurred_at": earthquake.occurred_at.isoformat(),
+                "source": earthquake.source,
+                "timestamp": event.timestamp.isoformat(),
+            }
+        return {"type": "high_magnitude_alert", "data": data}
 
     async def _send_recent_earthquakes_update(self) -> None:
         """Send recent earthquakes list to WebSocket clients with filtering."""
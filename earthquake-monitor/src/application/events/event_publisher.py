@@ -1,24 +1,94 @@
+import asyncio
+import logging
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from typing import Any
 
+logger = logging.getLogger(__name__)
+
 
 class EventPublisher(ABC):
     @abstractmethod
     async def publish(self, event: Any) -> None:
         pass
 
+    async def publish_many(self, events: Iterable[Any]) -> None:
+        """Publish several events; transports that can batch should override."""
+        for event in events:
+            await self.publish(event)
+
 
 class InMemoryEventPublisher(EventPublisher):
     def __init__(self):
-        self._handlers = {}
+        self._handlers: dict[type, tuple] = {}
 
     def subscribe(self, event_type: type, handler):
-        if event_type not in self._handlers:
-            self._handlers[event_type] = []
-        self._handlers[event_type].append(handler)
+        # Handlers are stored as tuples, rebuilt here so publish never copies
+        self._handlers[event_type] = self._handlers.get(event_type, ()) + (handler,)
 
     async def publish(self, event: Any) -> None:
-        event_type = type(event)
-        if event_type in self._handlers:
-            for handler in self._handlers[event_type]:
-                await handler(event)
+        handlers = self._handlers.get(event.__class__)
+        if not handlers:
+            return
+
+        if len(handlers) == 1:
+            await handlers[0](event)
+        else:
+            # Handlers are independent of each other, so run them together
+            await asyncio.gather(*(handler(event) for handler in handlers))
+
+    async def publish_many(self, events: Iterable[Any]) -> None:
+        # Dispatch every event's handlers in one gather instead of one per event
+        await asyncio.gather(*(self.publish(event) for event in events))
+
+
+class QueuedEventPublisher(InMemoryEventPublisher):
+    """In-memory publisher that hands events to a background worker.
+
+    ``publish`` returns once the event is queued, so publishers do not wait
+    for handlers to finish; it only blocks while the queue is full. Events
+    are dispatched in the order they were published.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        super().__init__()
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._worker: asyncio.Task | None = None
+
+    async def publish(self, event: Any) -> None:
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._dispatch_queued())
+        await self._queue.put(event)
+
+    async def publish_many(self, events: Iterable[Any]) -> None:
+        # Queue sequentially to keep the published order
+        for event in events:
+            await self.publish(event)
+
+    async def join(self) -> None:
+        """Wait until every queued event has been handled."""
+        await self._queue.join()
+
+    async def close(self) -> None:
+        """Handle the remaining events, then stop the worker."""
+        if self._worker is None:
+            return
+
+        await self.join()
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+    async def _dispatch_queued(self) -> None:
+        while True:
+            event = await self._queue.get()
+            try:
+                await super().publish(event)
+            except Exception as e:
+                # Keep the worker alive for the events behind this one
+                logger.error("Error handling %s: %s", type(event).__name__, e)
+            finally:
+                self._queue.task_done()
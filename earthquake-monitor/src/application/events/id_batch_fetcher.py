@@ -0,0 +1,90 @@
+"""Coalesces earthquake lookups into batched repository queries."""
+
+import asyncio
+import logging
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.domain.entities.earthquake import Earthquake
+    from src.domain.repositories.earthquake_repository import EarthquakeRepository
+
+logger = logging.getLogger(__name__)
+
+
+class IdBatchFetcher:
+    """Collects earthquake IDs requested within a short window and loads them
+    with one ``find_by_ids`` query.
+
+    Concurrent requests for the same ID share a single lookup.
+    """
+
+    def __init__(
+        self,
+        repository_scope: Callable[
+            [], AbstractAsyncContextManager["EarthquakeRepository"]
+        ],
+        window: float = 0.02,
+        max_batch: int = 256,
+    ):
+        if window <= 0:
+            raise ValueError("window must be positive")
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+
+        self._repository_scope = repository_scope
+        self._window = window
+        self._max_batch = max_batch
+        self._pending: dict[str, asyncio.Future] = {}
+        self._flush_task: asyncio.Task | None = None
+
+    async def get(self, earthquake_id: str) -> "Earthquake | None":
+        """Return the earthquake with this ID once the current batch is loaded."""
+        future = self._pending.get(earthquake_id)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[earthquake_id] = future
+
+            if len(self._pending) >= self._max_batch:
+                await self.flush()
+            elif self._flush_task is None:
+                self._flush_task = asyncio.create_task(self._flush_later())
+
+        # Shield the shared future so one cancelled caller does not fail the rest
+        return await asyncio.shield(future)
+
+    async def flush(self) -> None:
+        """Load every pending ID now."""
+        # Cancel the pending timer unless it is the one running this flush
+        task, self._flush_task = self._flush_task, None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, {}
+        try:
+            async with self._repository_scope() as repository:
+                found = await repository.find_by_ids(list(batch))
+        except Exception as e:
+            logger.error("Error loading %d earthquakes: %s", len(batch), e)
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        except BaseException:
+            # Cancelled mid-query: fail the batch so no caller waits forever
+            for future in batch.values():
+                if not future.done():
+                    future.cancel()
+            raise
+
+        for earthquake_id, future in batch.items():
+            if not future.done():
+                future.set_result(found.get(earthquake_id))
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._window)
+        await self.flush()
@@ -0,0 +1,42 @@
+"""Token bucket rate limiter for event broadcasting."""
+
+import asyncio
+
+
+class TokenBucket:
+    """Async token bucket: allows bursts up to capacity, refills at a fixed rate."""
+
+    def __init__(self, capacity: float, refill_rate: float):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if refill_rate <= 0:
+            raise ValueError("refill_rate must be positive")
+
+        self._capacity = capacity
+        self._refill_rate = refill_rate
+        self._tokens = capacity
+        self._updated_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: float = 1) -> None:
+        """Take tokens from the bucket, sleeping only while it is empty."""
+        if tokens > self._capacity:
+            raise ValueError("cannot acquire more tokens than the bucket capacity")
+
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            while True:
+                self._refill(loop.time())
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self._refill_rate)
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accumulated since the last refill."""
+        if self._updated_at is not None:
+            elapsed = now - self._updated_at
+            self._tokens = min(
+                self._capacity, self._tokens + elapsed * self._refill_rate
+            )
+        self._updated_at = now
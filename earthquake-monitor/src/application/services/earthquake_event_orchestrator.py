@@ -1,5 +1,8 @@
 """Application service for orchestrating earthquake-related events."""
 
+import asyncio
+from collections.abc import Iterable
+
 from src.application.events.event_publisher import EventPublisher
 from src.domain.entities.earthquake import Earthquake
 from src.domain.events.earthquake_detected import EarthquakeDetected
@@ -14,37 +17,72 @@ class EarthquakeEventOrchestrator:
 
     async def publish_earthquake_events(self, earthquake: Earthquake) -> None:
         """Publish all relevant events for an earthquake."""
+        # The events go to independent handlers, so fan them out together
+        await asyncio.gather(
+            *(
+                self._event_publisher.publish(event)
+                for event in self._build_events(earthquake)
+            )
+        )
+
+    async def publish_events_for_earthquakes(
+        self, earthquakes: Iterable[Earthquake]
+    ) -> None:
+        """Publish the events of several earthquakes with one publish_many."""
+        events = [
+            event
+            for earthquake in earthquakes
+            for event in self._build_events(earthquake)
+        ]
+        if events:
+            await self._event_publisher.publish_many(events)
+
+    def _build_events(self, earthquake: Earthquake) -> list:
+        """Build all relevant events for an earthquake."""
         # Always publish earthquake detected event
-        await self._publish_earthquake_detected(earthquake)
+        events = [self._earthquake_detected_event(earthquake)]
 
         # Publish high magnitude alert if needed
         if earthquake.requires_immediate_alert():
-            await self._publish_high_magnitude_alert(earthquake)
+            events.append(self._high_magnitude_alert_event(earthquake))
+
+        return events
 
-    async def _publish_earthquake_detected(self, earthquake: Earthquake) -> None:
-        """Publish earthquake detected event."""
-        earthquake_detected = EarthquakeDetected(
+    def _earthquake_detected_event(self, earthquake: Earthquake) -> EarthquakeDetected:
+        """Build earthquake detected event."""
+        location = earthquake.location
+        return EarthquakeDetected(
             earthquake_id=earthquake.id,
             occurred_at=earthquake.occurred_at,
             magnitude=earthquake.magnitude.value,
-            latitude=earthquake.location.latitude,
-            longitude=earthquake.location.longitude,
-            depth=earthquake.location.depth,
+            latitude=location.latitude,
+            longitude=location.longitude,
+            depth=location.depth,
             source=earthquake.source,
             title=earthquake.title,
+            earthquake=earthquake,
         )
-        await self._event_publisher.publish(earthquake_detected)
 
-    async def _publish_high_magnitude_alert(self, earthquake: Earthquake) -> None:
-        """Publish high magnitude alert event."""
-        impact_assessment = earthquake.get_impact_assessment()
-        high_magnitude_alert = HighMagnitudeAlert(
+    def _high_magnitude_alert_event(
+        self, earthquake: Earthquake
+    ) -> HighMagnitudeAlert:
+        """Build high magnitude alert event.
+
+        Only called once requires_immediate_alert() has returned True, so the
+        full impact assessment (and its repeated population-area scans) is not
+        needed here.
+        """
+        magnitude = earthquake.magnitude
+        location = earthquake.location
+        return HighMagnitudeAlert(
             earthquake_id=earthquake.id,
-            magnitude=earthquake.magnitude.value,
-            alert_level=earthquake.magnitude.get_alert_level(),
-            latitude=earthquake.location.latitude,
-            longitude=earthquake.location.longitude,
-            affected_radius_km=impact_assessment["affected_radius_km"],
-            requires_immediate_response=impact_assessment["requires_immediate_alert"],
+            magnitude=magnitude.value,
+            alert_level=magnitude.get_alert_level(),
+            latitude=location.latitude,
+            longitude=location.longitude,
+            affected_radius_km=earthquake.calculate_affected_radius_km(),
+            requires_immediate_response=True,
+            depth=location.depth,
+            occurred_at=earthquake.occurred_at,
+            source=earthquake.source,
         )
-        await self._event_publisher.publish(high_magnitude_alert)
@@ -31,10 +31,13 @@ class ErrorHandlerService:
     """Service for handling and transforming exceptions across layers."""
 
     def __init__(self):
-        self._error_mappings = {
-            EarthquakeNotFoundError: self._handle_not_found_error,
-            EarthquakeAlreadyExistsError: self._handle_conflict_error,
-        }
+        # Checked in order with isinstance, so subclasses map like their base
+        self._error_mappings: tuple[tuple[type, Callable], ...] = (
+            (EarthquakeNotFoundError, self._handle_not_found_error),
+            (EarthquakeAlreadyExistsError, self._handle_conflict_error),
+        )
+        # Handler resolved for each concrete exception type seen so far
+        self._handler_cache: dict[type, Callable] = {}
 
     async def execute_use_case(
         self, use_case_func: Callable[P, T], *args: P.args, **kwargs: P.kwargs
@@ -43,17 +46,17 @@ class ErrorHandlerService:
         try:
             return await use_case_func(*args, **kwargs)
         except DomainException as e:
-            logger.warning(f"Domain exception in use case: {e.message}")
+            logger.warning("Domain exception in use case: %s", e.message)
             mapped_exception = self._map_domain_exception(e)
             raise mapped_exception from e
         except InfrastructureException as e:
-            logger.error(f"Infrastructure exception in use case: {e.message}")
+            logger.error("Infrastructure exception in use case: %s", e.message)
             raise UseCaseExecutionError(
                 f"Use case execution failed due to infrastructure error: {e.message}",
                 original_exception=e,
             ) from e
         except Exception as e:
-            logger.error(f"Unexpected exception in use case: {str(e)}")
+            logger.error("Unexpected exception in use case: %s", e)
             raise UseCaseExecutionError(
                 "An unexpected error occurred during use case execution",
                 original_exception=e,
@@ -64,11 +67,24 @@ class ErrorHandlerService:
     ) -> ApplicationException:
         """Map domain exceptions to appropriate application exceptions."""
         exception_type = type(domain_exception)
+        handler = self._handler_cache.get(exception_type)
+        if handler is None:
+            handler = self._resolve_handler(exception_type)
+            self._handler_cache[exception_type] = handler
+
+        return handler(domain_exception)
 
-        if exception_type in self._error_mappings:
-            return self._error_mappings[exception_type](domain_exception)
+    def _resolve_handler(self, exception_type: type) -> Callable:
+        """Find the mapping for an exception type, falling back to the default."""
+        for mapped_type, handler in self._error_mappings:
+            if issubclass(exception_type, mapped_type):
+                return handler
+        return self._handle_unmapped_error
 
-        # Default mapping for unmapped domain exceptions
+    def _handle_unmapped_error(
+        self, domain_exception: DomainException
+    ) -> UseCaseExecutionError:
+        """Default mapping for unmapped domain exceptions."""
         return UseCaseExecutionError(
             f"Domain validation failed: {domain_exception.message}",
             original_exception=domain_exception,
@@ -93,14 +109,18 @@ class ErrorHandlerService:
         if isinstance(exception, InfrastructureException):
             return exception
 
-        if "database" in operation.lower() or "sql" in str(exception).lower():
+        # Stringify and lowercase once for all the keyword checks below
+        exception_message = str(exception)
+        exception_text = exception_message.lower()
+
+        if "database" in operation.lower() or "sql" in exception_text:
             return DatabaseOperationError(operation, exception)
 
-        if "http" in str(exception).lower() or "network" in str(exception).lower():
+        if "http" in exception_text or "network" in exception_text:
             return ExternalServiceError(operation, exception)
 
         # Default infrastructure error
         return InfrastructureException(
-            f"Infrastructure operation '{operation}' failed: {str(exception)}",
+            f"Infrastructure operation '{operation}' failed: {exception_message}",
             "INFRASTRUCTURE_ERROR",
         )
@@ -30,18 +30,24 @@ class ScheduledJobService:
         """
         self._scheduler = job_scheduler
         self._ingestion_use_case = scheduled_ingestion_use_case
-        self._jobs_added = False
 
     async def setup_earthquake_ingestion_job(self) -> None:
-        """Set up the scheduled earthquake ingestion job."""
-        if self._jobs_added:
-            logger.warning("Earthquake ingestion job already added")
-            return
+        """Set up the scheduled earthquake ingestion job.
 
+        Safe to call repeatedly: the job is replaced rather than duplicated.
+        """
         interval_minutes = float(os.getenv("USGS_INGESTION_INTERVAL_MINUTES", "30"))
 
+        # Read the ingestion settings once here rather than on every tick
+        request = IngestionRequest(
+            source="USGS",
+            period=os.getenv("USGS_INGESTION_PERIOD", "hour"),
+            magnitude_filter=os.getenv("USGS_INGESTION_MIN_MAGNITUDE", "2.5"),
+            limit=int(os.getenv("USGS_INGESTION_MAX_EARTHQUAKES", "100")),
+        )
+
         # Create the job function with proper dependency injection
-        job_func = self._create_ingestion_job_func()
+        job_func = self._create_ingestion_job_func(request)
 
         self._scheduler.add_job(
             func=job_func,
@@ -52,14 +58,14 @@ class ScheduledJobService:
             max_instances=1,
             coalesce=True,
             misfire_grace_time=300,
+            replace_existing=True,
         )
 
-        self._jobs_added = True
         logger.info(
-            f"Added earthquake ingestion job with {interval_minutes}-minute interval"
+            "Added earthquake ingestion job with %s-minute interval", interval_minutes
         )
 
-    def _create_ingestion_job_func(self) -> Callable:
+    def _create_ingestion_job_func(self, request: IngestionRequest) -> Callable:
         """Create the ingestion job function with injected dependencies."""
 
         async def earthquake_ingestion_job() -> None:
@@ -67,31 +73,18 @@ class ScheduledJobService:
             try:
                 logger.info("Starting scheduled earthquake data ingestion")
 
-                # Get configuration from environment
-                period = os.getenv("USGS_INGESTION_PERIOD", "hour")
-                magnitude = os.getenv("USGS_INGESTION_MIN_MAGNITUDE", "2.5")
-                max_earthquakes = int(
-                    os.getenv("USGS_INGESTION_MAX_EARTHQUAKES", "100")
-                )
-
-                # Create ingestion request
-                request = IngestionRequest(
-                    source="USGS",
-                    period=period,
-                    magnitude_filter=magnitude,
-                    limit=max_earthquakes,
-                )
-
                 # Execute via application layer
                 result = await self._ingestion_use_case.execute(request)
 
                 logger.info(
-                    f"Earthquake ingestion completed: {result.new_earthquakes} new, "
-                    f"{result.updated_earthquakes} updated, {result.errors} errors"
+                    "Earthquake ingestion completed: %s new, %s updated, %s errors",
+                    result.new_earthquakes,
+                    result.updated_earthquakes,
+                    result.errors,
                 )
 
             except Exception as e:
-                logger.error(f"Earthquake data ingestion failed: {e}")
+                logger.error("Earthquake data ingestion failed: %s", e)
                 # Don't re-raise to prevent scheduler from stopping
 
         return earthquake_ingestion_job
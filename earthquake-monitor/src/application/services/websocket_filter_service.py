@@ -3,12 +3,70 @@
 import logging
 import os
 import time
-from datetime import UTC, datetime, timedelta
+from collections.abc import Iterable
 
 from src.domain.entities.earthquake import Earthquake
 
 logger = logging.getLogger(__name__)
 
+# Minutes of per-client broadcast counts kept in each rate limit ring
+RATE_LIMIT_WINDOW_MINUTES = 3
+
+# Client tracking only matters for the current rate limit minute and the
+# throttle interval, so state untouched for longer than this can be dropped
+CLIENT_STATE_MIN_LIFETIME_SECONDS = 60.0
+
+_MISSING = object()
+
+
+class _TwoGenerationMap:
+    """Dict-like map that forgets entries left untouched for a while.
+
+    Writes go to the current generation and reads promote entries from the
+    previous one. ``rotate`` drops the previous generation wholesale, so an
+    entry lives between one and two intervals after its last use without any
+    scan over the keys.
+    """
+
+    __slots__ = ("_current", "_previous", "_interval", "_rotated_at")
+
+    def __init__(self, interval: float):
+        self._current: dict = {}
+        self._previous: dict = {}
+        self._interval = interval
+        self._rotated_at: float | None = None
+
+    def get(self, key, default=None):
+        value = self._current.get(key, _MISSING)
+        if value is _MISSING:
+            value = self._previous.pop(key, _MISSING)
+            if value is _MISSING:
+                return default
+            self._current[key] = value
+        return value
+
+    def __setitem__(self, key, value) -> None:
+        self._current[key] = value
+
+    def __len__(self) -> int:
+        return len(self._current.keys() | self._previous.keys())
+
+    def values(self):
+        return {**self._previous, **self._current}.values()
+
+    def rotate(self, now: float) -> None:
+        """Start a new generation once the interval has passed."""
+        if self._rotated_at is None:
+            self._rotated_at = now
+        elif now - self._rotated_at >= self._interval:
+            self._previous = self._current
+            self._current = {}
+            self._rotated_at = now
+
+    def clear(self) -> None:
+        self._current.clear()
+        self._previous.clear()
+
 
 class WebSocketFilterService:
     """Service for filtering earthquake events before WebSocket broadcast."""
@@ -25,23 +83,32 @@ class WebSocketFilterService:
             os.getenv("WEBSOCKET_THROTTLE_SECONDS", "5.0")
         )
         self.max_age_minutes = int(os.getenv("WEBSOCKET_MAX_AGE_MINUTES", "60"))
+        self._max_age_seconds = self.max_age_minutes * 60.0
 
-        # Client tracking
-        self._client_last_broadcast: dict[str, float] = {}
-        self._client_earthquake_count: dict[
-            str, dict[str, int]
-        ] = {}  # client_id -> {minute_key: count}
+        # Client tracking, forgotten for clients that stop receiving broadcasts
+        state_lifetime = max(
+            CLIENT_STATE_MIN_LIFETIME_SECONDS, self.throttle_interval_seconds
+        )
+        self._client_last_broadcast = _TwoGenerationMap(state_lifetime)
+        # client_id -> ring of [minute, count] cells, indexed by minute % size
+        self._client_earthquake_count = _TwoGenerationMap(state_lifetime)
+        # client_id -> time of the last alert; kept apart from the maps above
+        # so alerts never use up a client's earthquake throttle or rate limit
+        self._alert_client_state = _TwoGenerationMap(state_lifetime)
 
         logger.info(
-            f"WebSocket filter initialized - min_magnitude: {self.min_magnitude_threshold}, "
-            f"max_per_minute: {self.max_earthquakes_per_minute}, "
-            f"throttle_seconds: {self.throttle_interval_seconds}"
+            "WebSocket filter initialized - min_magnitude: %s, "
+            "max_per_minute: %s, throttle_seconds: %s",
+            self.min_magnitude_threshold,
+            self.max_earthquakes_per_minute,
+            self.throttle_interval_seconds,
         )
 
     def clear_cache(self) -> None:
         """Clear all cached filter state - useful for testing."""
         self._client_last_broadcast.clear()
         self._client_earthquake_count.clear()
+        self._alert_client_state.clear()
         logger.info("WebSocket filter cache cleared")
 
     def should_broadcast_earthquake(
@@ -59,39 +126,100 @@ class WebSocketFilterService:
         """
         current_time = time.time()
 
-        # 1. Magnitude filtering
-        if not self._passes_magnitude_filter(earthquake):
-            logger.debug(
-                f"Earthquake {earthquake.id} filtered out: magnitude {earthquake.magnitude.value} < {self.min_magnitude_threshold}"
-            )
-            return False
-
-        # 2. Age filtering - only recent earthquakes
-        if not self._passes_age_filter(earthquake):
-            logger.debug(f"Earthquake {earthquake.id} filtered out: too old")
+        # 1-2. Magnitude and age filtering
+        if not self._passes_global_filters(earthquake, current_time):
             return False
 
         # 3. Time-based throttling per client
-        if not self._passes_throttle_filter(client_id, current_time):
+        last_broadcast = self._client_last_broadcast.get(client_id, 0)
+        if current_time - last_broadcast < self.throttle_interval_seconds:
             logger.debug(
-                f"Earthquake {earthquake.id} filtered out: client {client_id} throttled"
+                "Earthquake %s filtered out: client %s throttled",
+                earthquake.id,
+                client_id,
             )
             return False
 
         # 4. Rate limiting per client
         if not self._passes_rate_limit_filter(client_id, current_time):
             logger.debug(
-                f"Earthquake {earthquake.id} filtered out: client {client_id} rate limited"
+                "Earthquake %s filtered out: client %s rate limited",
+                earthquake.id,
+                client_id,
             )
             return False
 
         # If passes all filters, update client tracking
         self._update_client_tracking(client_id, current_time)
         logger.debug(
-            f"Earthquake {earthquake.id} approved for broadcast to client {client_id}"
+            "Earthquake %s approved for broadcast to client %s",
+            earthquake.id,
+            client_id,
         )
         return True
 
+    def filter_for_clients(
+        self, earthquake: Earthquake, client_ids: Iterable[str]
+    ) -> list[str]:
+        """
+        Select the clients an earthquake should be broadcasted to.
+
+        Gives the same answers as calling should_broadcast_earthquake for each
+        client, but runs the client-independent magnitude and age checks once.
+
+        Args:
+            earthquake: Earthquake entity to evaluate
+            client_ids: WebSocket client identifiers to consider
+
+        Returns:
+            The client IDs that passed, in the order given
+        """
+        current_time = time.time()
+        if not self._passes_global_filters(earthquake, current_time):
+            return []
+
+        selected = []
+        for client_id in client_ids:
+            if self._passes_client_filters(client_id, current_time):
+                self._update_client_tracking(client_id, current_time)
+                selected.append(client_id)
+        return selected
+
+    def should_broadcast_batch(
+        self, earthquakes: list[Earthquake], client_id: str = "default"
+    ) -> list[bool]:
+        """
+        Evaluate several earthquakes for one client in a single pass.
+
+        Gives the same answers as calling should_broadcast_earthquake for each
+        earthquake in order, but reads the clock once and runs the per-client
+        throttle and rate limit checks only for earthquakes that pass the
+        magnitude and age filters.
+
+        Args:
+            earthquakes: Earthquake entities to evaluate, in broadcast order
+            client_id: WebSocket client identifier
+
+        Returns:
+            One flag per earthquake, True where it should be broadcasted
+        """
+        current_time = time.time()
+        min_magnitude = self.min_magnitude_threshold
+        oldest_ts = current_time - self._max_age_seconds
+
+        results = [
+            earthquake.magnitude.value >= min_magnitude
+            and earthquake.occurred_ts >= oldest_ts
+            for earthquake in earthquakes
+        ]
+        for index, passed in enumerate(results):
+            if passed:
+                if self._passes_client_filters(client_id, current_time):
+                    self._update_client_tracking(client_id, current_time)
+                else:
+                    results[index] = False
+        return results
+
     def should_broadcast_alert(
         self, earthquake: Earthquake, client_id: str = "default"
     ) -> bool:
@@ -103,69 +231,106 @@ class WebSocketFilterService:
             earthquake: Earthquake entity to evaluate
             client_id: WebSocket client identifier
 
+        Returns:
+            True if alert should be broadcasted, False otherwise
+        """
+        return self.should_broadcast_alert_magnitude(
+            earthquake.id, earthquake.magnitude.value, client_id
+        )
+
+    def should_broadcast_alert_magnitude(
+        self, earthquake_id: str, magnitude: float, client_id: str = "default"
+    ) -> bool:
+        """
+        Alert filtering for callers that only have the alert event's data.
+
+        Args:
+            earthquake_id: Identifier of the earthquake behind the alert
+            magnitude: Magnitude value carried by the alert
+            client_id: WebSocket client identifier
+
         Returns:
             True if alert should be broadcasted, False otherwise
         """
         # Only filter by minimum significant magnitude for alerts
-        if earthquake.magnitude.value < 4.0:  # Lower threshold for alerts
+        if magnitude < 4.0:  # Lower threshold for alerts
             logger.debug(
-                f"Alert for earthquake {earthquake.id} filtered out: magnitude {earthquake.magnitude.value} < 4.0"
+                "Alert for earthquake %s filtered out: magnitude %s < 4.0",
+                earthquake_id,
+                magnitude,
             )
             return False
 
-        self._update_client_tracking(client_id, time.time())
+        current_time = time.time()
+        self._alert_client_state.rotate(current_time)
+        self._alert_client_state[client_id] = current_time
         logger.info(
-            f"High magnitude alert approved for earthquake {earthquake.id} to client {client_id}"
+            "High magnitude alert approved for earthquake %s to client %s",
+            earthquake_id,
+            client_id,
         )
         return True
 
-    def _passes_magnitude_filter(self, earthquake: Earthquake) -> bool:
-        """Check if earthquake meets minimum magnitude threshold."""
-        return earthquake.magnitude.value >= self.min_magnitude_threshold
+    def _passes_global_filters(
+        self, earthquake: Earthquake, current_time: float
+    ) -> bool:
+        """Check the client-independent magnitude threshold and maximum age."""
+        magnitude = earthquake.magnitude.value
+        if magnitude < self.min_magnitude_threshold:
+            logger.debug(
+                "Earthquake %s filtered out: magnitude %s < %s",
+                earthquake.id,
+                magnitude,
+                self.min_magnitude_threshold,
+            )
+            return False
+
+        # Only recent earthquakes
+        if current_time - earthquake.occurred_ts > self._max_age_seconds:
+            logger.debug("Earthquake %s filtered out: too old", earthquake.id)
+            return False
 
-    def _passes_age_filter(self, earthquake: Earthquake) -> bool:
-        """Check if earthquake is recent enough to be relevant."""
-        max_age = timedelta(minutes=self.max_age_minutes)
-        age = datetime.now(UTC) - earthquake.occurred_at.replace(tzinfo=UTC)
-        return age <= max_age
+        return True
 
-    def _passes_throttle_filter(self, client_id: str, current_time: float) -> bool:
-        """Check if enough time has passed since last broadcast to this client."""
+    def _passes_client_filters(self, client_id: str, current_time: float) -> bool:
+        """Check the client's throttle interval and per-minute rate limit."""
         last_broadcast = self._client_last_broadcast.get(client_id, 0)
-        return (current_time - last_broadcast) >= self.throttle_interval_seconds
+        if current_time - last_broadcast < self.throttle_interval_seconds:
+            return False
+        return self._passes_rate_limit_filter(client_id, current_time)
 
     def _passes_rate_limit_filter(self, client_id: str, current_time: float) -> bool:
         """Check if client hasn't exceeded rate limit for this minute."""
-        minute_key = str(int(current_time // 60))  # Current minute as key
-
-        # Initialize client tracking if needed
-        if client_id not in self._client_earthquake_count:
-            self._client_earthquake_count[client_id] = {}
-
-        client_counts = self._client_earthquake_count[client_id]
-
-        # Clean old minute entries
-        current_minute = int(current_time // 60)
-        old_minutes = [k for k in client_counts.keys() if int(k) < current_minute - 2]
-        for old_minute in old_minutes:
-            del client_counts[old_minute]
-
-        # Check current minute count
-        current_count = client_counts.get(minute_key, 0)
+        current_count = 0
+        counts = self._client_earthquake_count.get(client_id)
+        if counts is not None:
+            minute = int(current_time // 60)
+            # A cell left over from an earlier minute counts as empty
+            cell = counts[minute % RATE_LIMIT_WINDOW_MINUTES]
+            if cell[0] == minute:
+                current_count = cell[1]
         return current_count < self.max_earthquakes_per_minute
 
     def _update_client_tracking(self, client_id: str, current_time: float) -> None:
         """Update client tracking for rate limiting and throttling."""
+        self._client_last_broadcast.rotate(current_time)
+        self._client_earthquake_count.rotate(current_time)
+
         # Update client last broadcast time
         self._client_last_broadcast[client_id] = current_time
 
-        # Update client rate limit counter
-        minute_key = str(int(current_time // 60))
-        if client_id not in self._client_earthquake_count:
-            self._client_earthquake_count[client_id] = {}
-        self._client_earthquake_count[client_id][minute_key] = (
-            self._client_earthquake_count[client_id].get(minute_key, 0) + 1
-        )
+        # Update client rate limit counter, reusing the cell of an old minute
+        counts = self._client_earthquake_count.get(client_id)
+        if counts is None:
+            counts = [[-1, 0] for _ in range(RATE_LIMIT_WINDOW_MINUTES)]
+            self._client_earthquake_count[client_id] = counts
+        minute = int(current_time // 60)
+        cell = counts[minute % RATE_LIMIT_WINDOW_MINUTES]
+        if cell[0] == minute:
+            cell[1] += 1
+        else:
+            cell[0] = minute
+            cell[1] = 1
 
     def get_filter_stats(self) -> dict:
         """Get current filter statistics for monitoring."""
@@ -178,8 +343,12 @@ class WebSocketFilterService:
             },
             "stats": {
                 "active_clients": len(self._client_last_broadcast),
+                "alert_clients": len(self._alert_client_state),
                 "client_rate_limit_entries": sum(
-                    len(counts) for counts in self._client_earthquake_count.values()
+                    1
+                    for counts in self._client_earthquake_count.values()
+                    for _, count in counts
+                    if count
                 ),
             },
         }
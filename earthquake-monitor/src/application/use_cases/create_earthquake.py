@@ -2,6 +2,7 @@ from src.application.dto.create_earthquake_request import CreateEarthquakeReques
 from src.application.services.earthquake_event_orchestrator import (
     EarthquakeEventOrchestrator,
 )
+from src.domain.exceptions import EarthquakeBatchWriteError
 from src.domain.repositories.earthquake_writer import EarthquakeWriter
 from src.domain.services.earthquake_factory_service import EarthquakeFactoryService
 from src.domain.services.earthquake_validation_service import (
@@ -24,6 +25,49 @@ class CreateEarthquakeUseCase:
 
     async def execute(self, request: CreateEarthquakeRequest) -> str:
         """Execute the create earthquake use case."""
+        earthquake = self._build_earthquake(request)
+
+        # Save to repository (commit happens here)
+        await self._earthquake_writer.save(earthquake)
+
+        # Publish events AFTER database commit to ensure data consistency
+        await self._event_orchestrator.publish_earthquake_events(earthquake)
+
+        return earthquake.id
+
+    async def execute_many(self, requests: list[CreateEarthquakeRequest]) -> list[str]:
+        """Create a batch of earthquakes with a single bulk write.
+
+        Returns the IDs of the earthquakes actually inserted; requests whose
+        external ID is already stored are skipped by the writer. Invalid
+        requests raise a DomainException and a failed write raises
+        EarthquakeBatchWriteError; errors raised while publishing the events
+        of committed rows propagate unchanged.
+        """
+        earthquakes = [self._build_earthquake(request) for request in requests]
+        if not earthquakes:
+            return []
+
+        # Bulk save (commits per chunk inside the writer)
+        try:
+            saved_ids = await self._earthquake_writer.save_many(earthquakes)
+        except Exception as e:
+            raise EarthquakeBatchWriteError(f"Bulk save failed: {e}") from e
+
+        # A conflicting row comes back with the ID it is already stored under
+        inserted = [
+            earthquake
+            for earthquake, saved_id in zip(earthquakes, saved_ids, strict=True)
+            if saved_id == earthquake.id
+        ]
+
+        # Publish events AFTER database commit to ensure data consistency
+        await self._event_orchestrator.publish_events_for_earthquakes(inserted)
+
+        return [earthquake.id for earthquake in inserted]
+
+    def _build_earthquake(self, request: CreateEarthquakeRequest):
+        """Validate request data and build the earthquake entity."""
         # Validate request data using domain service
         self._validation_service.validate_earthquake_data(
             magnitude_value=request.magnitude_value,
@@ -37,7 +81,7 @@ class CreateEarthquakeUseCase:
         )
 
         # Create earthquake entity using factory service
-        earthquake = self._factory_service.create_earthquake(
+        return self._factory_service.create_earthquake(
             latitude=request.latitude,
             longitude=request.longitude,
             depth=request.depth,
@@ -49,11 +93,3 @@ class CreateEarthquakeUseCase:
             raw_data=request.raw_data,
             title=request.title,
         )
-
-        # Save to repository (commit happens here)
-        await self._earthquake_writer.save(earthquake)
-
-        # Publish events AFTER database commit to ensure data consistency
-        await self._event_orchestrator.publish_earthquake_events(earthquake)
-
-        return earthquake.id
@@ -18,28 +18,11 @@ class GetEarthquakesUseCase:
         if pagination is None:
             pagination = PaginationParams()
 
-        # Convert filters to dict for repository
-        filter_dict = {}
-        if filters:
-            if filters.min_magnitude is not None:
-                filter_dict["min_magnitude"] = filters.min_magnitude
-            if filters.max_magnitude is not None:
-                filter_dict["max_magnitude"] = filters.max_magnitude
-            if filters.start_time is not None:
-                filter_dict["start_time"] = filters.start_time
-            if filters.end_time is not None:
-                filter_dict["end_time"] = filters.end_time
-            if filters.is_reviewed is not None:
-                filter_dict["is_reviewed"] = filters.is_reviewed
-            if filters.source is not None:
-                filter_dict["source"] = filters.source
+        filter_dict = filters.to_repository_dict() if filters else None
 
-        # Get total count for pagination
-        total = await self._earthquake_search.count_with_filters(filter_dict or None)
-
-        # Get paginated results
-        earthquakes = await self._earthquake_search.find_with_filters(
-            filters=filter_dict or None, limit=pagination.size, offset=pagination.offset
+        # Get the requested page and the total count for pagination together
+        earthquakes, total = await self._earthquake_search.find_with_filters_and_count(
+            filters=filter_dict, limit=pagination.size, offset=pagination.offset
         )
 
         return PaginatedResponse.create(earthquakes, total, pagination)
@@ -2,6 +2,7 @@
 
 import logging
 from dataclasses import dataclass
+from datetime import UTC, datetime
 
 from src.application.events.event_publisher import EventPublisher
 from src.domain.entities.earthquake import Earthquake
@@ -12,7 +13,7 @@ from src.domain.repositories.earthquake_repository import EarthquakeRepository
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class IngestionRequest:
     """Request for earthquake data ingestion."""
 
@@ -22,7 +23,7 @@ class IngestionRequest:
     limit: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IngestionResult:
     """Result of earthquake data ingestion."""
 
@@ -59,38 +60,56 @@ class IngestEarthquakeDataUseCase:
             f"Starting ingestion of {len(earthquakes)} earthquakes from {source}"
         )
 
+        # One query for the whole batch instead of a lookup per earthquake
+        existing_ids = await self._find_existing_ids(earthquakes)
+
         new_earthquakes = 0
         updated_earthquakes = 0
         errors = 0
         earthquake_ids = []
+        ingested = []
+        pending = []
 
         for earthquake in earthquakes:
-            try:
-                # Save earthquake (repository handles duplicate checking by external_id)
-                earthquake_id = await self.repository.save(earthquake)
-
-                # Check if this was a new earthquake or existing one
-                if str(earthquake_id) == str(earthquake.id):
-                    # New earthquake was created
-                    earthquake_ids.append(earthquake_id)
-                    new_earthquakes += 1
-
-                    # Publish domain events only for new earthquakes
-                    await self._publish_events(earthquake)
-
-                    logger.debug(
-                        f"Successfully ingested new earthquake {earthquake_id}"
-                    )
-                else:
-                    # Existing earthquake was found (repository returned existing ID)
-                    updated_earthquakes += 1
-                    logger.debug(
-                        f"Earthquake with external_id {earthquake.external_id} already exists with ID {earthquake_id}"
-                    )
+            existing_id = (
+                existing_ids.get(earthquake.external_id)
+                if earthquake.external_id
+                else None
+            )
+            if existing_id is not None:
+                updated_earthquakes += 1
+                logger.debug(
+                    f"Earthquake with external_id {earthquake.external_id} "
+                    f"already exists with ID {existing_id}"
+                )
+            else:
+                pending.append(earthquake)
 
-            except Exception as e:
+        # One bulk INSERT for everything not already stored (the repository
+        # still skips duplicates inserted since the existence check)
+        saved_ids = await self._save_pending(pending)
+
+        for earthquake, earthquake_id in zip(pending, saved_ids, strict=True):
+            if earthquake_id is None:
                 errors += 1
-                logger.error(f"Error ingesting earthquake {earthquake.id}: {e}")
+            elif str(earthquake_id) == str(earthquake.id):
+                # New earthquake was created
+                earthquake_ids.append(earthquake_id)
+                new_earthquakes += 1
+                ingested.append(earthquake)
+
+                logger.debug(f"Successfully ingested new earthquake {earthquake_id}")
+            else:
+                # Existing earthquake was found (repository returned existing ID)
+                updated_earthquakes += 1
+                logger.debug(
+                    f"Earthquake with external_id {earthquake.external_id} "
+                    f"already exists with ID {earthquake_id}"
+                )
+
+        # Publish domain events only for new earthquakes, in one batch
+        if ingested:
+            await self._publish_events(ingested)
 
         result = IngestionResult(
             total_fetched=len(earthquakes),
@@ -107,11 +126,69 @@ class IngestEarthquakeDataUseCase:
 
         return result
 
-    async def _publish_events(self, earthquake: Earthquake) -> None:
-        """Publish domain events for an ingested earthquake."""
+    async def _find_existing_ids(self, earthquakes: list[Earthquake]) -> dict[str, str]:
+        """Map already stored external IDs in the batch to their earthquake IDs."""
+        external_ids = list(
+            {
+                earthquake.external_id
+                for earthquake in earthquakes
+                if earthquake.external_id
+            }
+        )
+        if not external_ids:
+            return {}
+
+        try:
+            return await self.repository.find_ids_by_external_ids(external_ids)
+        except Exception as e:
+            # save() deduplicates on its own, so ingestion can still proceed
+            logger.warning(f"Batch existence check failed, checking per row: {e}")
+            return {}
+
+    async def _save_pending(self, earthquakes: list[Earthquake]) -> list[str | None]:
+        """Save earthquakes in bulk; return their IDs, or None where saving failed."""
+        if not earthquakes:
+            return []
+
         try:
-            # Always publish earthquake detected event
-            earthquake_detected = EarthquakeDetected(
+            return await self.repository.save_many(earthquakes)
+        except Exception as e:
+            logger.warning(f"Bulk save failed, retrying row by row: {e}")
+
+        saved_ids: list[str | None] = []
+        for earthquake in earthquakes:
+            try:
+                saved_ids.append(await self.repository.save(earthquake))
+            except Exception as e:
+                logger.error(f"Error ingesting earthquake {earthquake.id}: {e}")
+                saved_ids.append(None)
+        return saved_ids
+
+    async def _publish_events(self, earthquakes: list[Earthquake]) -> None:
+        """Publish domain events for ingested earthquakes with one publish_many."""
+        # Events from one ingestion pass share the instant they were raised
+        timestamp = datetime.now(UTC)
+        events = []
+        for earthquake in earthquakes:
+            try:
+                events.extend(self._build_events(earthquake, timestamp))
+            except Exception as e:
+                logger.error(
+                    f"Error building events for earthquake {earthquake.id}: {e}"
+                )
+
+        try:
+            await self.event_publisher.publish_many(events)
+        except Exception as e:
+            logger.error(
+                f"Error publishing events for {len(earthquakes)} earthquakes: {e}"
+            )
+
+    def _build_events(self, earthquake: Earthquake, timestamp: datetime) -> list:
+        """Build the domain events for an ingested earthquake."""
+        # Always publish earthquake detected event
+        events = [
+            EarthquakeDetected(
                 earthquake_id=earthquake.id,
                 magnitude=earthquake.magnitude.value,
                 latitude=earthquake.location.latitude,
@@ -120,24 +197,29 @@ class IngestEarthquakeDataUseCase:
                 occurred_at=earthquake.occurred_at,
                 source=earthquake.source,
                 title=earthquake.title,
+                earthquake=earthquake,
+                timestamp=timestamp,
             )
-            await self.event_publisher.publish(earthquake_detected)
-
-            # Publish high magnitude alert if significant
-            if earthquake.magnitude.is_significant():
-                high_magnitude_alert = HighMagnitudeAlert(
+        ]
+
+        # Publish high magnitude alert if significant; the alert context is
+        # only worth computing (populated-area scan included) in that case
+        if earthquake.magnitude.is_significant():
+            context = earthquake.compute_alert_context()
+            events.append(
+                HighMagnitudeAlert(
                     earthquake_id=earthquake.id,
                     magnitude=earthquake.magnitude.value,
                     latitude=earthquake.location.latitude,
                     longitude=earthquake.location.longitude,
                     affected_radius_km=50.0,  # Default radius
-                    alert_level=earthquake.magnitude.get_alert_level(),
-                    requires_immediate_response=earthquake.requires_immediate_alert(),
+                    alert_level=context.alert_level,
+                    requires_immediate_response=context.requires_alert,
+                    timestamp=timestamp,
                 )
-                await self.event_publisher.publish(high_magnitude_alert)
+            )
 
-        except Exception as e:
-            logger.error(f"Error publishing events for earthquake {earthquake.id}: {e}")
+        return events
 
 
 class ScheduledIngestionUseCase:
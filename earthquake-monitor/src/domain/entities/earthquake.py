@@ -1,23 +1,48 @@
+import time
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from uuid import uuid4
+from os import urandom
 
 from ..exceptions import InvalidDateTimeError
 from .location import Location
 from .magnitude import Magnitude
 
 
-@dataclass
+def _new_earthquake_id() -> str:
+    """Random UUID4 string, formatted directly instead of via uuid.UUID."""
+    raw = bytearray(urandom(16))
+    raw[6] = raw[6] & 0x0F | 0x40  # version 4
+    raw[8] = raw[8] & 0x3F | 0x80  # RFC 4122 variant
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+@dataclass(frozen=True, slots=True)
+class AlertContext:
+    """Alert-related facts about an earthquake, evaluated together."""
+
+    is_significant: bool
+    near_populated_area: bool
+    requires_alert: bool
+    alert_level: str
+    affected_radius_km: float
+
+
+@dataclass(slots=True)
 class Earthquake:
     location: Location
     magnitude: Magnitude
     occurred_at: datetime
     source: str = "USGS"
-    earthquake_id: str = field(default_factory=lambda: str(uuid4()))
+    earthquake_id: str = field(default_factory=_new_earthquake_id)
     external_id: str | None = field(default=None)
     raw_data: str | None = field(default=None)
     title: str | None = field(default=None)
     _is_reviewed: bool = field(default=False, init=False)
+    _occurred_ts: float = field(init=False, repr=False, compare=False)
+    _alert_context: tuple | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         # Convert naive datetime to UTC if needed
@@ -27,8 +52,9 @@ class Earthquake:
                 self, "occurred_at", self.occurred_at.replace(tzinfo=UTC)
             )
 
-        current_time = datetime.now(UTC)
-        if self.occurred_at > current_time:
+        # Compare POSIX timestamps rather than building a datetime for "now"
+        self._occurred_ts = self.occurred_at.timestamp()
+        if self._occurred_ts > time.time():
             raise InvalidDateTimeError(
                 "Earthquake occurrence time cannot be in the future"
             )
@@ -37,6 +63,11 @@ class Earthquake:
     def id(self) -> str:
         return self.earthquake_id
 
+    @property
+    def occurred_ts(self) -> float:
+        """Occurrence time as a POSIX timestamp, for cheap age comparisons."""
+        return self._occurred_ts
+
     @property
     def is_reviewed(self) -> bool:
         return self._is_reviewed
@@ -60,13 +91,40 @@ class Earthquake:
 
         return base_radius * depth_factor
 
+    def compute_alert_context(self) -> AlertContext:
+        """Evaluate the alert predicates once, sharing the populated-area scan.
+
+        The result is cached for as long as magnitude and location are the same
+        objects; both are immutable, so replacing either one invalidates it.
+        """
+        cached = self._alert_context
+        if (
+            cached is not None
+            and cached[0] is self.magnitude
+            and cached[1] is self.location
+        ):
+            return cached[2]
+
+        is_significant = self.magnitude.is_significant()
+        near_populated_area = self.location.is_near_populated_area()
+        context = AlertContext(
+            is_significant=is_significant,
+            near_populated_area=near_populated_area,
+            requires_alert=is_significant and near_populated_area,
+            alert_level=self.magnitude.get_alert_level(),
+            affected_radius_km=self.calculate_affected_radius_km(),
+        )
+        self._alert_context = (self.magnitude, self.location, context)
+        return context
+
     def get_impact_assessment(self) -> dict:
         """Get comprehensive impact assessment."""
+        context = self.compute_alert_context()
         return {
-            "alert_level": self.magnitude.get_alert_level(),
-            "affected_radius_km": self.calculate_affected_radius_km(),
-            "requires_immediate_alert": self.requires_immediate_alert(),
+            "alert_level": context.alert_level,
+            "affected_radius_km": context.affected_radius_km,
+            "requires_immediate_alert": context.requires_alert,
             "magnitude_description": self.magnitude.get_description(),
-            "near_populated_area": self.location.is_near_populated_area(),
-            "is_significant": self.magnitude.is_significant(),
+            "near_populated_area": context.near_populated_area,
+            "is_significant": context.is_significant,
         }
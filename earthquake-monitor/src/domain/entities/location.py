@@ -1,14 +1,103 @@
 import math
-from dataclasses import dataclass
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 
 from ..exceptions import InvalidLocationError
 
+EARTH_RADIUS_KM = 6371
 
-@dataclass(frozen=True)
+# Simplified set of well-known major population centers: (lat, lng, radius_km)
+MAJOR_POPULATION_CENTERS = (
+    (40.7128, -74.0060, 50),  # New York City (50km radius)
+    (34.0522, -118.2437, 40),  # Los Angeles (40km radius)
+    (41.8781, -87.6298, 35),  # Chicago (35km radius)
+    (29.7604, -95.3698, 30),  # Houston (30km radius)
+    (33.4484, -112.0740, 25),  # Phoenix (25km radius)
+    (39.9526, -75.1652, 30),  # Philadelphia (30km radius)
+    (29.4241, -98.4936, 25),  # San Antonio (25km radius)
+    (32.7767, -96.7970, 30),  # Dallas (30km radius)
+    (37.7749, -122.4194, 35),  # San Francisco (35km radius)
+    (47.6062, -122.3321, 25),  # Seattle (25km radius)
+)
+
+# Per center: the latitude and longitude half-extents in degrees of the circle
+# of radius r around it (used as a bounding box), latitude and longitude in
+# radians, cos(latitude), and the haversine term sin²(r / 2R) that distance r
+# maps to. Haversine distance grows monotonically with that term, so comparing
+# it avoids sqrt and atan2.
+_POPULATION_CENTERS_RAD = tuple(
+    (
+        lat,
+        lng,
+        math.degrees(radius_km / EARTH_RADIUS_KM),
+        math.degrees(
+            math.asin(
+                min(
+                    1.0,
+                    math.sin(radius_km / EARTH_RADIUS_KM) / math.cos(math.radians(lat)),
+                )
+            )
+        ),
+        math.radians(lat),
+        math.radians(lng),
+        math.cos(math.radians(lat)),
+        math.sin(radius_km / (2 * EARTH_RADIUS_KM)) ** 2,
+    )
+    for lat, lng, radius_km in MAJOR_POPULATION_CENTERS
+)
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in kilometers between two points given in degrees."""
+    lat1_rad = math.radians(lat1)
+    lat2_rad = math.radians(lat2)
+    a = (
+        math.sin((lat2_rad - lat1_rad) / 2) ** 2
+        + math.cos(lat1_rad)
+        * math.cos(lat2_rad)
+        * math.sin(math.radians(lon2 - lon1) / 2) ** 2
+    )
+    # Rounding can push a marginally above 1 for antipodal points
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(a, 1.0)))
+
+
+def haversine_km_batch(
+    lat0: float, lon0: float, lats: Sequence[float], lons: Sequence[float]
+) -> list[float]:
+    """Distances in kilometers from one origin to many points, all in degrees.
+
+    Equivalent to calling haversine_km per point, but the origin's radians and
+    cosine are computed once for the whole batch.
+    """
+    lat0_rad = math.radians(lat0)
+    lon0_rad = math.radians(lon0)
+    cos_lat0 = math.cos(lat0_rad)
+    diameter = 2 * EARTH_RADIUS_KM
+    sin, cos, radians = math.sin, math.cos, math.radians
+
+    distances = []
+    for lat, lon in zip(lats, lons, strict=True):
+        lat_rad = radians(lat)
+        a = (
+            sin((lat_rad - lat0_rad) / 2) ** 2
+            + cos_lat0 * cos(lat_rad) * sin((radians(lon) - lon0_rad) / 2) ** 2
+        )
+        distances.append(diameter * math.asin(math.sqrt(min(a, 1.0))))
+    return distances
+
+
+@dataclass(frozen=True, slots=True)
 class Location:
     latitude: float
     longitude: float
     depth: float
+    # Lazily computed caches; excluded from __init__, equality and repr
+    _terms: tuple[float, float, float] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _near_populated_area: bool | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         if not -90 <= self.latitude <= 90:
@@ -18,22 +107,29 @@ class Location:
         if self.depth < 0:
             raise InvalidLocationError("Depth must be non-negative")
 
-    def distance_to(self, other: "Location") -> float:
-        """Calculate distance to another location using Haversine formula."""
-        R = 6371  # Earth's radius in kilometers
+    def _haversine_terms(self) -> tuple[float, float, float]:
+        """Latitude and longitude in radians plus cos(latitude), cached on first use.
 
-        lat1_rad = math.radians(self.latitude)
-        lat2_rad = math.radians(other.latitude)
-        delta_lat = math.radians(other.latitude - self.latitude)
-        delta_lon = math.radians(other.longitude - self.longitude)
+        Computed lazily so that locations which never take part in a distance
+        calculation (most rows loaded from the database) do not pay for them.
+        """
+        terms = self._terms
+        if terms is None:
+            lat_rad = math.radians(self.latitude)
+            terms = (lat_rad, math.radians(self.longitude), math.cos(lat_rad))
+            object.__setattr__(self, "_terms", terms)
+        return terms
 
+    def distance_to(self, other: "Location") -> float:
+        """Calculate distance to another location using Haversine formula."""
+        lat1, lon1, cos_lat1 = self._haversine_terms()
+        lat2, lon2, cos_lat2 = other._haversine_terms()
         a = (
-            math.sin(delta_lat / 2) ** 2
-            + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lon / 2) ** 2
+            math.sin((lat2 - lat1) / 2) ** 2
+            + cos_lat1 * cos_lat2 * math.sin((lon2 - lon1) / 2) ** 2
         )
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-
-        return R * c
+        # Rounding can push a marginally above 1 for antipodal points
+        return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(a, 1.0)))
 
     def is_near_populated_area(self) -> bool:
         """Check if location is near a populated area.
@@ -43,23 +139,46 @@ class Location:
 
         This method uses basic heuristics based on proximity to major population centers.
         """
+        # The centers are fixed and a location is immutable, so the answer is
+        # computed once per instance
+        near = self._near_populated_area
+        if near is None:
+            near = self._check_population_centers()
+            object.__setattr__(self, "_near_populated_area", near)
+        return near
+
+    def _check_population_centers(self) -> bool:
         # Simplified implementation using well-known major population center coordinates
         # This removes the dependency on infrastructure layer
-        major_population_centers = [
-            (40.7128, -74.0060, 50),  # New York City (50km radius)
-            (34.0522, -118.2437, 40),  # Los Angeles (40km radius)
-            (41.8781, -87.6298, 35),  # Chicago (35km radius)
-            (29.7604, -95.3698, 30),  # Houston (30km radius)
-            (33.4484, -112.0740, 25),  # Phoenix (25km radius)
-            (39.9526, -75.1652, 30),  # Philadelphia (30km radius)
-            (29.4241, -98.4936, 25),  # San Antonio (25km radius)
-            (32.7767, -96.7970, 30),  # Dallas (30km radius)
-            (37.7749, -122.4194, 35),  # San Francisco (35km radius)
-            (47.6062, -122.3321, 25),  # Seattle (25km radius)
-        ]
-
-        for lat, lng, radius_km in major_population_centers:
-            center_location = Location(lat, lng, 0)
-            if self.distance_to(center_location) < radius_km:
+        latitude = self.latitude
+        longitude = self.longitude
+        terms = None
+
+        for (
+            lat,
+            lng,
+            max_dlat,
+            max_dlon,
+            center_lat,
+            center_lon,
+            center_cos_lat,
+            limit,
+        ) in _POPULATION_CENTERS_RAD:
+            # Points outside the circle's bounding box cannot be in range, and
+            # most locations are far from every center, so skip the trig
+            if abs(latitude - lat) > max_dlat:
+                continue
+            dlon = abs(longitude - lng)
+            if min(dlon, 360 - dlon) > max_dlon:
+                continue
+
+            if terms is None:
+                terms = self._haversine_terms()
+            lat_rad, lon_rad, cos_lat = terms
+            a = (
+                math.sin((center_lat - lat_rad) / 2) ** 2
+                + cos_lat * center_cos_lat * math.sin((center_lon - lon_rad) / 2) ** 2
+            )
+            if a < limit:
                 return True
         return False
@@ -1,17 +1,23 @@
 from dataclasses import dataclass
-from enum import Enum
+from enum import StrEnum
 
 from ..exceptions import InvalidMagnitudeError
 
 
-class MagnitudeScale(Enum):
+class MagnitudeScale(StrEnum):
     RICHTER = "richter"
     MOMENT = "moment"
     BODY_WAVE = "body_wave"
     SURFACE_WAVE = "surface_wave"
 
 
-@dataclass(frozen=True)
+# Plain dict lookup for parsing scale strings without going through Enum.__call__
+MAGNITUDE_SCALES_BY_VALUE: dict[str, MagnitudeScale] = {
+    scale.value: scale for scale in MagnitudeScale
+}
+
+
+@dataclass(frozen=True, slots=True)
 class Magnitude:
     value: float
     scale: MagnitudeScale = MagnitudeScale.MOMENT
@@ -1,8 +1,12 @@
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from src.domain.entities.earthquake import Earthquake
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class EarthquakeDetected:
     earthquake_id: str
     occurred_at: datetime
@@ -13,3 +17,7 @@ class EarthquakeDetected:
     source: str
     title: str | None = None
     timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
+    # Entity the event was raised for, when the publisher already holds it
+    earthquake: "Earthquake | None" = field(
+        default=None, compare=False, repr=False, kw_only=True
+    )
@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from datetime import UTC, datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HighMagnitudeAlert:
     earthquake_id: str
     magnitude: float
@@ -11,4 +11,7 @@ class HighMagnitudeAlert:
     longitude: float
     affected_radius_km: float
     requires_immediate_response: bool
+    depth: float | None = None
+    occurred_at: datetime | None = None
+    source: str | None = None
     timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
@@ -39,6 +39,12 @@ class EarthquakeAlreadyExistsError(DomainException):
     pass
 
 
+class EarthquakeBatchWriteError(DomainException):
+    """Raised when a batch of earthquakes cannot be written."""
+
+    pass
+
+
 class InvalidDateTimeError(DomainException):
     """Raised when datetime values are invalid."""
 
@@ -13,6 +13,18 @@ class EarthquakeReader(ABC):
         """Find an earthquake by its ID."""
         pass
 
+    @abstractmethod
+    async def find_by_ids(self, earthquake_ids: list[str]) -> dict[str, Earthquake]:
+        """Find several earthquakes by ID; IDs that are not found are omitted."""
+        pass
+
+    @abstractmethod
+    async def find_ids_by_external_ids(
+        self, external_ids: list[str]
+    ) -> dict[str, str]:
+        """Map the given external IDs that are already stored to their IDs."""
+        pass
+
     @abstractmethod
     async def exists(self, earthquake_id: str) -> bool:
         """Check if an earthquake exists in the repository."""
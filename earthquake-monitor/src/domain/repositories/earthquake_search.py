@@ -22,3 +22,13 @@ class EarthquakeSearch(ABC):
     async def count_with_filters(self, filters: dict | None = None) -> int:
         """Count earthquakes matching the given filters."""
         pass
+
+    @abstractmethod
+    async def find_with_filters_and_count(
+        self,
+        filters: dict | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> tuple[list[Earthquake], int]:
+        """Find a page of matching earthquakes together with the total count."""
+        pass
@@ -12,3 +12,8 @@ class EarthquakeWriter(ABC):
     async def save(self, earthquake: Earthquake) -> str:
         """Save an earthquake to the repository and return its ID."""
         pass
+
+    @abstractmethod
+    async def save_many(self, earthquakes: list[Earthquake]) -> list[str]:
+        """Save a batch of earthquakes and return their IDs in input order."""
+        pass
@@ -4,7 +4,8 @@ from datetime import datetime
 
 from ..entities.earthquake import Earthquake
 from ..entities.location import Location
-from ..entities.magnitude import Magnitude, MagnitudeScale
+from ..entities.magnitude import MAGNITUDE_SCALES_BY_VALUE, Magnitude
+from ..exceptions import InvalidEarthquakeDataError
 
 
 class EarthquakeFactoryService:
@@ -31,7 +32,12 @@ class EarthquakeFactoryService:
             depth=depth,
         )
 
-        magnitude_scale_enum = MagnitudeScale(magnitude_scale)
+        try:
+            magnitude_scale_enum = MAGNITUDE_SCALES_BY_VALUE[magnitude_scale]
+        except KeyError:
+            raise InvalidEarthquakeDataError(
+                f"Invalid magnitude scale: {magnitude_scale}"
+            ) from None
         magnitude = Magnitude(value=magnitude_value, scale=magnitude_scale_enum)
 
         # Create earthquake entity
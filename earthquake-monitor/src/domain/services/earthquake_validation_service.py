@@ -1,9 +1,14 @@
 """Domain service for earthquake validation business rules."""
 
+import time
 from datetime import UTC, datetime
 
+from ..entities.magnitude import MagnitudeScale
 from ..exceptions import InvalidEarthquakeDataError
 
+# Scale members are strings, so plain scale names are found in this set
+VALID_MAGNITUDE_SCALES = frozenset(MagnitudeScale)
+
 
 class EarthquakeValidationService:
     """Domain service responsible for earthquake validation business rules."""
@@ -34,11 +39,10 @@ class EarthquakeValidationService:
 
     def _validate_magnitude_scale(self, magnitude_scale: str) -> None:
         """Validate magnitude scale."""
-        valid_scales = {"richter", "moment", "body_wave", "surface_wave"}
-        if magnitude_scale not in valid_scales:
+        if magnitude_scale not in VALID_MAGNITUDE_SCALES:
             raise InvalidEarthquakeDataError(
                 f"Invalid magnitude scale: {magnitude_scale}. "
-                f"Valid scales: {', '.join(valid_scales)}"
+                f"Valid scales: {', '.join(sorted(VALID_MAGNITUDE_SCALES))}"
             )
 
     def _validate_external_id(self, external_id: str | None) -> None:
@@ -48,13 +52,11 @@ class EarthquakeValidationService:
 
     def _validate_occurrence_time(self, occurred_at: datetime) -> None:
         """Validate earthquake occurrence time."""
-        current_time = datetime.now(UTC)
-
         # Ensure we have timezone info
         if occurred_at.tzinfo is None:
             occurred_at = occurred_at.replace(tzinfo=UTC)
 
-        if occurred_at > current_time:
+        if occurred_at.timestamp() > time.time():
             raise InvalidEarthquakeDataError(
                 "Earthquake occurrence time cannot be in the future"
             )
@@ -1,20 +1,52 @@
+import math
 import os
 from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
 
-from ..entities.location import Location
+from ..entities.location import EARTH_RADIUS_KM, Location, haversine_km_batch
 from .population_config import PopulationCenter, PopulationCenterConfig
 
+# Estimated base populations for major cities; other centers count as 1M
+BASE_POPULATIONS = {
+    "Tokyo": 37_400_000,
+    "New York": 8_400_000,
+    "Los Angeles": 4_000_000,
+    "San Francisco": 880_000,
+    "London": 9_000_000,
+    "Moscow": 12_500_000,
+    "Mexico City": 21_800_000,
+    "Beijing": 21_500_000,
+    "Mumbai": 20_400_000,
+    "São Paulo": 12_300_000,
+}
+DEFAULT_BASE_POPULATION = 1_000_000
+
+
+def _haversine_center_terms(
+    latitude: float, longitude: float, threshold_km: float
+) -> tuple[float, float, float, float]:
+    """A center's radians, cos(latitude) and the haversine term of its threshold.
+
+    Haversine distance grows monotonically with the term a, so d < threshold
+    is checked as a < sin²(threshold / 2R) without asin and sqrt.
+    """
+    lat_rad = math.radians(latitude)
+    half_angle = threshold_km / (2 * EARTH_RADIUS_KM)
+    # Thresholds beyond half the circumference cover the whole globe
+    limit = math.sin(half_angle) ** 2 if half_angle < math.pi / 2 else math.inf
+    return lat_rad, math.radians(longitude), math.cos(lat_rad), limit
+
 
 class PopulationService(ABC):
     """Abstract service for population-related operations."""
 
     @abstractmethod
-    async def is_near_populated_area(self, location: Location) -> bool:
+    def is_near_populated_area(self, location: Location) -> bool:
         """Check if a location is near a populated area."""
         pass
 
     @abstractmethod
-    async def get_affected_population_estimate(
+    def get_affected_population_estimate(
         self, center: Location, radius_km: float
     ) -> int:
         """Estimate population affected within a radius."""
@@ -39,42 +71,76 @@ class PopulationServiceImpl(PopulationService):
         else:
             self._population_centers = population_centers
 
-    async def is_near_populated_area(self, location: Location) -> bool:
+        # Centers sorted by latitude and stored column-wise, plus their
+        # haversine terms. A point within d km of a center is at most d / R
+        # radians of latitude away, so a query bisects that band and measures
+        # distances to the centers in it only.
+        self._columns = PopulationCenterConfig.as_columns(
+            sorted(self._population_centers, key=lambda c: c.latitude)
+        )
+        self._center_terms = list(
+            map(
+                _haversine_center_terms,
+                self._columns.latitudes,
+                self._columns.longitudes,
+                self._columns.thresholds_km,
+            )
+        )
+        self._max_threshold_km = max(self._columns.thresholds_km, default=0.0)
+        self._base_populations = tuple(
+            BASE_POPULATIONS.get(name, DEFAULT_BASE_POPULATION)
+            for name in self._columns.names
+        )
+
+    def _latitude_band(self, latitude: float, radius_km: float) -> tuple[int, int]:
+        """Slice bounds of the centers within radius_km of a latitude."""
+        band = math.degrees(radius_km / EARTH_RADIUS_KM)
+        return (
+            bisect_left(self._columns.latitudes, latitude - band),
+            bisect_right(self._columns.latitudes, latitude + band),
+        )
+
+    def _distances_to_centers(
+        self, location: Location, start: int, stop: int
+    ) -> list[float]:
+        """Distances in kilometers from a location to a slice of the centers."""
+        return haversine_km_batch(
+            location.latitude,
+            location.longitude,
+            self._columns.latitudes[start:stop],
+            self._columns.longitudes[start:stop],
+        )
+
+    def is_near_populated_area(self, location: Location) -> bool:
         """Check if location is within threshold distance of any populated area."""
-        for center in self._population_centers:
-            center_location = Location(center.latitude, center.longitude, 0)
-            if location.distance_to(center_location) < center.proximity_threshold_km:
+        start, stop = self._latitude_band(location.latitude, self._max_threshold_km)
+        lat_rad = math.radians(location.latitude)
+        lon_rad = math.radians(location.longitude)
+        cos_lat = math.cos(lat_rad)
+        sin = math.sin
+
+        candidates = self._center_terms[start:stop]
+        for center_lat, center_lon, center_cos_lat, limit in candidates:
+            a = (
+                sin((center_lat - lat_rad) / 2) ** 2
+                + cos_lat * center_cos_lat * sin((center_lon - lon_rad) / 2) ** 2
+            )
+            if a < limit:
                 return True
         return False
 
-    async def get_affected_population_estimate(
+    def get_affected_population_estimate(
         self, center: Location, radius_km: float
     ) -> int:
         """Estimate population based on proximity to known populated centers."""
         total_population = 0
-        for pop_center in self._population_centers:
-            center_location = Location(pop_center.latitude, pop_center.longitude, 0)
-            distance = center.distance_to(center_location)
+        start, stop = self._latitude_band(center.latitude, radius_km)
+        distances = self._distances_to_centers(center, start, stop)
+        # Use different base populations for different cities
+        base_populations = self._base_populations[start:stop]
+        for base_population, distance in zip(base_populations, distances, strict=True):
             if distance < radius_km:
                 # Simple calculation: closer areas contribute more
                 factor = max(0, 1 - (distance / radius_km))
-                # Use different base populations for different cities
-                base_population = self._get_base_population(pop_center.name)
                 total_population += int(base_population * factor)
         return total_population
-
-    def _get_base_population(self, city_name: str) -> int:
-        """Get estimated base population for major cities."""
-        population_estimates = {
-            "Tokyo": 37_400_000,
-            "New York": 8_400_000,
-            "Los Angeles": 4_000_000,
-            "San Francisco": 880_000,
-            "London": 9_000_000,
-            "Moscow": 12_500_000,
-            "Mexico City": 21_800_000,
-            "Beijing": 21_500_000,
-            "Mumbai": 20_400_000,
-            "São Paulo": 12_300_000,
-        }
-        return population_estimates.get(city_name, 1_000_000)  # Default 1M
@@ -1,6 +1,6 @@
 """Implementation of population service using configuration."""
 
-from ..entities.location import Location
+from ..entities.location import Location, haversine_km
 from .population_config import PopulationCenterConfig
 from .population_service_interface import PopulationServiceInterface
 
@@ -15,11 +15,17 @@ class ConfigurablePopulationService(PopulationServiceInterface):
             if population_centers is not None
             else PopulationCenterConfig.get_default_population_centers()
         )
+        # Plain coordinates, so the check needs no Location per center
+        self._center_coords = [
+            (c.latitude, c.longitude, c.proximity_threshold_km)
+            for c in self._population_centers
+        ]
 
     def is_location_near_populated_area(self, location: Location) -> bool:
         """Check if a location is near a populated area using configured centers."""
-        for center in self._population_centers:
-            center_location = Location(center.latitude, center.longitude, 0)
-            if location.distance_to(center_location) < center.proximity_threshold_km:
+        latitude = location.latitude
+        longitude = location.longitude
+        for center_lat, center_lon, threshold in self._center_coords:
+            if haversine_km(latitude, longitude, center_lat, center_lon) < threshold:
                 return True
         return False
@@ -16,15 +16,29 @@ def create_async_engine(database_url: str, **kwargs):
     """Create async engine with consistent configuration."""
     import os
 
+    statement_cache_size = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "500"))
+    # SQL logging is off unless explicitly requested for debugging
+    echo = os.getenv("SQLALCHEMY_ECHO", "0") == "1"
+
     # Default configuration for Docker/CI compatibility
     default_kwargs = {
-        "echo": True,
-        "pool_recycle": 300,
+        "echo": echo,
+        "echo_pool": echo,
+        # Shared connection pool; event handlers and requests borrow from it
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "20")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "300")),
         "connect_args": {
             "server_settings": {
                 "jit": "off",
             },
             "command_timeout": 60,
+            # Prepared statements kept per connection, by SQLAlchemy and by
+            # asyncpg itself; IN lists of different lengths are distinct
+            # statements, so the defaults of 100 churn under batch ingestion.
+            # Set to 0 behind a transaction-pooling pgbouncer.
+            "prepared_statement_cache_size": statement_cache_size,
+            "statement_cache_size": statement_cache_size,
         },
     }
 
@@ -4,7 +4,7 @@ import uuid
 from datetime import UTC, datetime
 
 from geoalchemy2 import Geometry
-from sqlalchemy import Boolean, Column, DateTime, Float, String, Text
+from sqlalchemy import Boolean, Column, Computed, DateTime, Float, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import declarative_base
 
@@ -23,8 +23,13 @@ class EarthquakeModel(Base):
     longitude = Column(Float, nullable=False, index=True)
     depth = Column(Float, nullable=False)
 
-    # PostGIS geometry column (POINT with SRID 4326 for WGS84)
-    location = Column(Geometry("POINT", srid=4326), index=True)
+    # PostGIS geometry column (POINT with SRID 4326 for WGS84), generated by the
+    # database from latitude/longitude so it never needs to be written directly
+    location = Column(
+        Geometry("POINT", srid=4326),
+        Computed("ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)", persisted=True),
+        index=True,
+    )
 
     # Magnitude data
     magnitude_value = Column(Float, nullable=False, index=True)
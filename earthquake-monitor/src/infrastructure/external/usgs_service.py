@@ -3,7 +3,7 @@
 import json
 import logging
 import os
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 
 import httpx
 
@@ -13,6 +13,25 @@ from src.domain.entities.magnitude import Magnitude, MagnitudeScale
 
 logger = logging.getLogger(__name__)
 
+# USGS timestamps are milliseconds since the Unix epoch (UTC)
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+_RICHTER_MAG_TYPES = frozenset({"ml", "ml_"})
+
+
+def usgs_timestamp_to_datetime(timestamp_ms: int | float) -> datetime:
+    """Convert a USGS millisecond timestamp to an aware UTC datetime."""
+    return _EPOCH + timedelta(milliseconds=timestamp_ms)
+
+
+def magnitude_scale_from_usgs(magnitude_type: str | None) -> MagnitudeScale:
+    """Map a USGS magType code to a MagnitudeScale (moment by default)."""
+    magnitude_type = (magnitude_type or "").lower()
+    if magnitude_type in _RICHTER_MAG_TYPES:
+        return MagnitudeScale.RICHTER
+    # USGS typically uses moment magnitude
+    return MagnitudeScale.MOMENT
+
 
 class USGSService:
     """Service for fetching earthquake data from USGS GeoJSON feeds."""
@@ -104,11 +123,8 @@ class USGSService:
                 logger.warning(f"Invalid negative depth: {depth}, setting to 0")
                 depth = 0.0
 
-            # Convert timestamp to datetime
-            occurred_at = datetime.fromtimestamp(
-                occurred_at_timestamp / 1000,
-                UTC,  # USGS uses milliseconds
-            )
+            # Convert timestamp to datetime (USGS uses milliseconds)
+            occurred_at = usgs_timestamp_to_datetime(occurred_at_timestamp)
 
             # Create domain entities
             location = Location(
@@ -118,13 +134,7 @@ class USGSService:
             )
 
             # Determine magnitude scale (USGS typically uses moment magnitude)
-            magnitude_type = properties.get("magType", "mw")
-            if magnitude_type.lower() in ["mw", "mww", "mwc", "mwr"]:
-                scale = MagnitudeScale.MOMENT
-            elif magnitude_type.lower() in ["ml", "ml_"]:
-                scale = MagnitudeScale.RICHTER
-            else:
-                scale = MagnitudeScale.MOMENT  # Default
+            scale = magnitude_scale_from_usgs(properties.get("magType"))
 
             magnitude = Magnitude(value=float(magnitude_value), scale=scale)
 
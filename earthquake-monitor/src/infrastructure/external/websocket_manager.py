@@ -1,11 +1,15 @@
-import json
+import asyncio
 import logging
 from typing import Optional
 
+import orjson
 from fastapi import WebSocket
 
 logger = logging.getLogger(__name__)
 
+# Check message size (1MB = 1,048,576 bytes, use conservative 100KB limit for safety)
+MAX_MESSAGE_SIZE = 100 * 1024  # 100KB - very conservative for individual earthquake events
+
 
 class WebSocketManager:
     def __init__(self):
@@ -26,8 +30,7 @@ class WebSocketManager:
         logger.info(f"WebSocket client {client_id} connected")
 
     def disconnect(self, client_id: str) -> None:
-        if client_id in self._connections:
-            del self._connections[client_id]
+        self._connections.pop(client_id, None)
         self._earthquake_subscribers.discard(client_id)
         self._alert_subscribers.discard(client_id)
         logger.info(f"WebSocket client {client_id} disconnected")
@@ -49,14 +52,14 @@ class WebSocketManager:
 
     async def broadcast_earthquake_update(self, message: dict, earthquake=None) -> None:
         """Broadcast earthquake update with optional filtering."""
+        if not self._earthquake_subscribers:
+            return
+
         if earthquake and self._filter_service:
-            # Filter per client
-            filtered_subscribers = []
-            for client_id in self._earthquake_subscribers:
-                if self._filter_service.should_broadcast_earthquake(
-                    earthquake, client_id
-                ):
-                    filtered_subscribers.append(client_id)
+            # Filter per client; client-independent checks run only once
+            filtered_subscribers = self._filter_service.filter_for_clients(
+                earthquake, self._earthquake_subscribers
+            )
 
             if filtered_subscribers:
                 logger.debug(
@@ -69,23 +72,81 @@ class WebSocketManager:
             # No filtering, broadcast to all
             await self._broadcast_to_subscribers(self._earthquake_subscribers, message)
 
-    async def broadcast_alert(self, message: dict, earthquake=None) -> None:
-        """Broadcast alert with optional filtering."""
-        if earthquake and self._filter_service:
+    async def broadcast_earthquake_batch(
+        self, items: list[tuple[dict, object]]
+    ) -> None:
+        """Broadcast several earthquake updates as one frame per client.
+
+        Each item is a (message, earthquake) pair; the earthquake, when given,
+        is run through the per-client filter like a single update would be.
+        Clients that end up with the same items share one serialized frame.
+        """
+        if not self._earthquake_subscribers or not items:
+            return
+
+        all_items = tuple(range(len(items)))
+        # Items without an earthquake skip filtering and go to every client
+        filtered = [
+            index
+            for index, (_, earthquake) in enumerate(items)
+            if earthquake is not None
+        ]
+        if not self._filter_service or not filtered:
+            groups = {all_items: list(self._earthquake_subscribers)}
+        else:
+            should_broadcast = self._filter_service.should_broadcast_batch
+            earthquakes = [items[index][1] for index in filtered]
+            groups: dict[tuple[int, ...], list[str]] = {}
+            for client_id in self._earthquake_subscribers:
+                passed = [True] * len(items)
+                for index, ok in zip(
+                    filtered, should_broadcast(earthquakes, client_id), strict=True
+                ):
+                    passed[index] = ok
+                selected = tuple(index for index in all_items if passed[index])
+                if selected:
+                    groups.setdefault(selected, []).append(client_id)
+
+        for selected, client_ids in groups.items():
+            if len(selected) == 1:
+                # A lone update is sent as-is rather than wrapped in a batch
+                message = items[selected[0]][0]
+            else:
+                message = {"type": "batch", "items": [items[i][0] for i in selected]}
+            await self._broadcast_to_specific_clients(client_ids, message)
+
+    async def broadcast_alert(self, message: dict, earthquake=None, alert=None) -> None:
+        """Broadcast alert with optional filtering.
+
+        Clients are filtered on the stored earthquake when given, otherwise on
+        the magnitude carried by the alert event.
+        """
+        if not self._alert_subscribers:
+            return
+
+        if self._filter_service and (earthquake or alert):
             # Filter per client for alerts
-            filtered_subscribers = []
-            for client_id in self._alert_subscribers:
-                if self._filter_service.should_broadcast_alert(earthquake, client_id):
-                    filtered_subscribers.append(client_id)
+            if earthquake:
+                earthquake_id = earthquake.id
+                magnitude = earthquake.magnitude.value
+            else:
+                earthquake_id = alert.earthquake_id
+                magnitude = alert.magnitude
+            should_broadcast = self._filter_service.should_broadcast_alert_magnitude
+            filtered_subscribers = [
+                client_id
+                for client_id in self._alert_subscribers
+                if should_broadcast(earthquake_id, magnitude, client_id)
+            ]
 
             if filtered_subscribers:
                 logger.info(
-                    f"Broadcasting alert for earthquake {earthquake.id} to {len(filtered_subscribers)}/{len(self._alert_subscribers)} clients"
+                    f"Broadcasting alert for earthquake {earthquake_id} to {len(filtered_subscribers)}/{len(self._alert_subscribers)} clients"
                 )
                 await self._broadcast_to_specific_clients(filtered_subscribers, message)
             else:
                 logger.debug(
-                    f"Alert for earthquake {earthquake.id} filtered out for all clients"
+                    f"Alert for earthquake {earthquake_id} filtered out for all clients"
                 )
         else:
             # No filtering, broadcast to all
@@ -97,16 +158,7 @@ class WebSocketManager:
         if not subscribers:
             return
 
-        disconnected_clients = []
-        for client_id in subscribers:
-            try:
-                await self._send_to_client(client_id, message)
-            except Exception as e:
-                logger.error(f"Failed to send message to client {client_id}: {e}")
-                disconnected_clients.append(client_id)
-
-        for client_id in disconnected_clients:
-            self.disconnect(client_id)
+        await self._broadcast_to_specific_clients(list(subscribers), message)
 
     async def _broadcast_to_specific_clients(
         self, client_ids: list[str], message: dict
@@ -115,51 +167,63 @@ class WebSocketManager:
         if not client_ids:
             return
 
-        disconnected_clients = []
-        for client_id in client_ids:
-            try:
-                await self._send_to_client(client_id, message)
-            except Exception as e:
-                logger.error(f"Failed to send message to client {client_id}: {e}")
-                disconnected_clients.append(client_id)
-
-        for client_id in disconnected_clients:
-            self.disconnect(client_id)
+        # Serialize once and send the same text to every client; sends run
+        # concurrently so one slow client does not hold up the others
+        message_text = self._encode_message(message)
+        results = await asyncio.gather(
+            *(
+                self._send_text_to_client(client_id, message_text)
+                for client_id in client_ids
+            ),
+            return_exceptions=True,
+        )
+
+        for client_id, result in zip(client_ids, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to send message to client {client_id}: {result}")
+                self.disconnect(client_id)
 
     async def _send_to_client(self, client_id: str, message: dict) -> None:
-        if client_id in self._connections:
-            websocket = self._connections[client_id]
-            message_text = json.dumps(message)
-
-            # Check message size (1MB = 1,048,576 bytes, use conservative 100KB limit for safety)
-            max_size = (
-                100 * 1024
-            )  # 100KB - very conservative for individual earthquake events
-            message_size = len(message_text.encode("utf-8"))
-
-            if message_size > max_size:
-                logger.warning(
-                    f"Message too large for client {client_id}: {message_size} bytes, type: {message.get('type', 'unknown')}"
-                )
-                # Log part of the message for debugging
-                logger.warning(f"Message preview: {message_text[:500]}...")
-
-                # Send error message instead
-                error_message = {
-                    "type": "error",
-                    "message": f"Data payload too large ({message_size} bytes) - using reduced dataset",
-                    "timestamp": message.get("data", {}).get("timestamp", ""),
-                }
-                await websocket.send_text(json.dumps(error_message))
-            else:
-                logger.debug(
-                    f"Sending message to client {client_id}: {message_size} bytes, type: {message.get('type', 'unknown')}"
-                )
-                await websocket.send_text(message_text)
+        websocket = self._connections.get(client_id)
+        if websocket is not None:
+            await websocket.send_text(self._encode_message(message))
+
+    async def _send_text_to_client(self, client_id: str, message_text: str) -> None:
+        websocket = self._connections.get(client_id)
+        if websocket is not None:
+            await websocket.send_text(message_text)
+
+    def _encode_message(self, message: dict) -> str:
+        """Serialize a message, replacing it with an error if it is too large."""
+        message_bytes = orjson.dumps(message)
+        message_size = len(message_bytes)
+
+        if message_size > MAX_MESSAGE_SIZE:
+            logger.warning(
+                f"Message too large: {message_size} bytes, type: {message.get('type', 'unknown')}"
+            )
+            # Log part of the message for debugging
+            logger.warning(
+                "Message preview: %s...",
+                message_bytes[:500].decode(errors="replace"),
+            )
+
+            # Send error message instead
+            error_message = {
+                "type": "error",
+                "message": f"Data payload too large ({message_size} bytes) - using reduced dataset",
+                "timestamp": message.get("data", {}).get("timestamp", ""),
+            }
+            return orjson.dumps(error_message).decode()
+
+        logger.debug(
+            f"Encoded message: {message_size} bytes, type: {message.get('type', 'unknown')}"
+        )
+        return message_bytes.decode()
 
     async def handle_message(self, client_id: str, message: str) -> None:
         try:
-            data = json.loads(message)
+            data = orjson.loads(message)
             action = data.get("action")
 
             if action == "subscribe_earthquakes":
@@ -170,7 +234,7 @@ class WebSocketManager:
                 await self._send_to_client(
                     client_id, {"type": "error", "message": f"Unknown action: {action}"}
                 )
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             await self._send_to_client(
                 client_id, {"type": "error", "message": "Invalid JSON message"}
             )
@@ -2,13 +2,18 @@
 
 import logging
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Annotated
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.repositories.earthquake_repository import EarthquakeRepository
-from src.infrastructure.database.config import get_async_session
+from src.infrastructure.database.config import (
+    get_async_session,
+    get_async_session_for_background,
+)
 from src.infrastructure.di_container import ApplicationDIContainer, DIContainer
 from src.infrastructure.repositories.postgresql_earthquake_repository import (
     PostgreSQLEarthquakeRepository,
@@ -31,6 +36,13 @@ async def create_earthquake_repository(
         return MockEarthquakeRepository()
 
 
+@asynccontextmanager
+async def background_repository_scope() -> AsyncIterator[EarthquakeRepository]:
+    """Yield a repository bound to a session that lives only for this block."""
+    async with get_async_session_for_background() as session:
+        yield await create_earthquake_repository(session)
+
+
 def create_di_container(repository: EarthquakeRepository) -> DIContainer:
     """Create dependency injection container with the given repository."""
     return ApplicationDIContainer(repository)
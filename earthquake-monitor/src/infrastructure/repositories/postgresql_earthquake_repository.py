@@ -1,17 +1,63 @@
 """PostgreSQL implementation of earthquake repository."""
 
-from datetime import datetime
+from datetime import UTC, datetime
 
-from sqlalchemy import and_, func
+from sqlalchemy import and_, bindparam, func, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from src.domain.entities.earthquake import Earthquake
 from src.domain.entities.location import Location
-from src.domain.entities.magnitude import Magnitude, MagnitudeScale
+from src.domain.entities.magnitude import MAGNITUDE_SCALES_BY_VALUE, Magnitude
 from src.domain.repositories.earthquake_repository import EarthquakeRepository
 from src.infrastructure.database.models import EarthquakeModel
 
+# Rows per multi-row INSERT; each chunk is committed on its own
+BULK_INSERT_CHUNK_SIZE = 500
+
+# Chunks at least this large are written with binary COPY instead of INSERT
+COPY_THRESHOLD = 200
+
+# Built once at import; SQLAlchemy's compiled cache and asyncpg's per-connection
+# prepared statement cache then reduce each lookup to bind + execute
+_FIND_BY_ID_STATEMENT = select(EarthquakeModel).where(
+    EarthquakeModel.id == bindparam("earthquake_id")
+)
+
+# Columns written by COPY (location is generated by the database)
+_COPY_COLUMNS = (
+    "id",
+    "latitude",
+    "longitude",
+    "depth",
+    "magnitude_value",
+    "magnitude_scale",
+    "occurred_at",
+    "source",
+    "external_id",
+    "is_reviewed",
+    "raw_data",
+    "title",
+    "created_at",
+    "updated_at",
+)
+
+
+def _within_radius(latitude: float, longitude: float, radius_km: float):
+    """Geodesic radius condition that the geography GiST index can serve.
+
+    geography(location) is the function behind the location::geography cast
+    indexed by migration 005, so the planner matches it to that index; wrapping
+    the column in any other function forces a scan of every row.
+    """
+    search_point = func.ST_SetSRID(func.ST_MakePoint(longitude, latitude), 4326)
+    return func.ST_DWithin(
+        func.geography(EarthquakeModel.location),
+        func.geography(search_point),
+        radius_km * 1000,
+    )
+
 
 class PostgreSQLEarthquakeRepository(EarthquakeRepository):
     """PostgreSQL implementation of earthquake repository."""
@@ -32,38 +78,129 @@ class PostgreSQLEarthquakeRepository(EarthquakeRepository):
             if existing:
                 return str(existing.id)
 
-        # Create new earthquake model with PostGIS geometry
-        earthquake_model = EarthquakeModel(
-            id=earthquake.id,
-            latitude=earthquake.location.latitude,
-            longitude=earthquake.location.longitude,
-            depth=earthquake.location.depth,
-            location=func.ST_SetSRID(
-                func.ST_MakePoint(
-                    earthquake.location.longitude, earthquake.location.latitude
-                ),
-                4326,
-            ),
-            magnitude_value=earthquake.magnitude.value,
-            magnitude_scale=earthquake.magnitude.scale.value,
-            occurred_at=earthquake.occurred_at,
-            source=earthquake.source,
-            external_id=earthquake.external_id,
-            is_reviewed=earthquake.is_reviewed,
-            raw_data=earthquake.raw_data,
-            title=earthquake.title,
-        )
+        # Create new earthquake model (PostGIS location is generated by the database)
+        earthquake_model = EarthquakeModel(**self._entity_to_values(earthquake))
 
         self.session.add(earthquake_model)
-        await self.session.commit()  # Commit the transaction to make data visible
+        try:
+            await self.session.commit()  # Commit the transaction to make data visible
+        except Exception:
+            await self.session.rollback()
+            raise
         await self.session.refresh(earthquake_model)
 
         return str(earthquake_model.id)
 
+    async def save_many(self, earthquakes: list[Earthquake]) -> list[str]:
+        """Save a batch of earthquakes with one multi-row INSERT per chunk."""
+        saved_ids = []
+        for start in range(0, len(earthquakes), BULK_INSERT_CHUNK_SIZE):
+            chunk = earthquakes[start : start + BULK_INSERT_CHUNK_SIZE]
+            saved_ids.extend(await self._save_chunk(chunk))
+        return saved_ids
+
+    async def _save_chunk(self, earthquakes: list[Earthquake]) -> list[str]:
+        """Insert one chunk, skipping rows whose external_id is already stored."""
+        rows = []
+        # external_id -> id of its first occurrence in this batch
+        batch_ids: dict[str, str] = {}
+        for earthquake in earthquakes:
+            external_id = earthquake.external_id
+            if external_id:
+                if external_id in batch_ids:
+                    continue
+                batch_ids[external_id] = str(earthquake.id)
+            rows.append(self._entity_to_values(earthquake))
+
+        try:
+            if len(rows) >= COPY_THRESHOLD:
+                inserted = await self._copy_rows(rows)
+            else:
+                inserted = await self._insert_rows(rows)
+
+            # Rows skipped by ON CONFLICT already exist; look up their ids
+            conflicting = [
+                external_id for external_id in batch_ids if external_id not in inserted
+            ]
+            existing_ids = await self.find_ids_by_external_ids(conflicting)
+            await self.session.commit()
+        except Exception:
+            # Leave the session usable for a per-row retry by the caller
+            await self.session.rollback()
+            raise
+
+        saved_ids = []
+        for earthquake in earthquakes:
+            external_id = earthquake.external_id
+            if external_id:
+                saved_ids.append(
+                    existing_ids.get(external_id) or batch_ids[external_id]
+                )
+            else:
+                saved_ids.append(str(earthquake.id))
+        return saved_ids
+
+    async def _insert_rows(self, rows: list[dict]) -> set[str]:
+        """Multi-row INSERT ... ON CONFLICT DO NOTHING; return inserted external_ids."""
+        result = await self.session.execute(
+            pg_insert(EarthquakeModel)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=[EarthquakeModel.external_id])
+            .returning(EarthquakeModel.external_id)
+        )
+        return {external_id for external_id in result.scalars() if external_id}
+
+    async def _copy_rows(self, rows: list[dict]) -> set[str]:
+        """COPY rows into a staging table, then move them over skipping conflicts."""
+        # Temporary table lives until the surrounding transaction ends
+        await self.session.execute(
+            text(
+                "CREATE TEMP TABLE IF NOT EXISTS earthquakes_staging "
+                "(LIKE earthquakes INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+        )
+
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+
+        # COPY bypasses SQLAlchemy, so fill the Python-side timestamp defaults
+        now = datetime.now(UTC)
+        records = [
+            tuple(row[column] for column in _COPY_COLUMNS[:-2]) + (now, now)
+            for row in rows
+        ]
+        await raw_connection.driver_connection.copy_records_to_table(
+            "earthquakes_staging", records=records, columns=_COPY_COLUMNS
+        )
+
+        columns = ", ".join(_COPY_COLUMNS)
+        result = await self.session.execute(
+            text(
+                f"INSERT INTO earthquakes ({columns}) "
+                f"SELECT {columns} FROM earthquakes_staging "
+                "ON CONFLICT (external_id) DO NOTHING "
+                "RETURNING external_id"
+            )
+        )
+        return {external_id for external_id in result.scalars() if external_id}
+
+    async def find_ids_by_external_ids(
+        self, external_ids: list[str]
+    ) -> dict[str, str]:
+        """Map stored external_ids to their earthquake ids in a single query."""
+        if not external_ids:
+            return {}
+        result = await self.session.execute(
+            select(EarthquakeModel.external_id, EarthquakeModel.id).where(
+                EarthquakeModel.external_id.in_(external_ids)
+            )
+        )
+        return {external_id: str(id_) for external_id, id_ in result}
+
     async def find_by_id(self, earthquake_id: str) -> Earthquake | None:
         """Find an earthquake by its ID."""
         result = await self.session.execute(
-            select(EarthquakeModel).where(EarthquakeModel.id == earthquake_id)
+            _FIND_BY_ID_STATEMENT, {"earthquake_id": earthquake_id}
         )
         earthquake_model = result.scalar_one_or_none()
 
@@ -72,6 +209,17 @@ class PostgreSQLEarthquakeRepository(EarthquakeRepository):
 
         return self._model_to_entity(earthquake_model)
 
+    async def find_by_ids(self, earthquake_ids: list[str]) -> dict[str, Earthquake]:
+        """Find several earthquakes by ID in a single query."""
+        if not earthquake_ids:
+            return {}
+
+        result = await self.session.execute(
+            select(EarthquakeModel).where(EarthquakeModel.id.in_(earthquake_ids))
+        )
+        earthquakes = [self._model_to_entity(model) for model in result.scalars().all()]
+        return {earthquake.id: earthquake for earthquake in earthquakes}
+
     async def find_all(self) -> list[Earthquake]:
         """Find all earthquakes."""
         result = await self.session.execute(
@@ -131,24 +279,9 @@ class PostgreSQLEarthquakeRepository(EarthquakeRepository):
         self, latitude: float, longitude: float, radius_km: float
     ) -> list[Earthquake]:
         """Find earthquakes within a radius of a location using PostGIS ST_DWithin."""
-        # Create a point geometry for the search location
-        search_point = func.ST_SetSRID(func.ST_MakePoint(longitude, latitude), 4326)
-
-        # Use ST_DWithin with geography cast for accurate distance in meters
-        # Convert radius from km to meters
-        radius_meters = radius_km * 1000
-
         result = await self.session.execute(
             select(EarthquakeModel)
-            .where(
-                func.ST_DWithin(
-                    func.ST_Transform(
-                        EarthquakeModel.location, 3857
-                    ),  # Transform to Web Mercator for accurate distance
-                    func.ST_Transform(search_point, 3857),
-                    radius_meters,
-                )
-            )
+            .where(_within_radius(latitude, longitude, radius_km))
             .order_by(EarthquakeModel.occurred_at.desc())
         )
         earthquake_models = result.scalars().all()
@@ -173,120 +306,114 @@ class PostgreSQLEarthquakeRepository(EarthquakeRepository):
         offset: int | None = None,
     ) -> list[Earthquake]:
         """Find earthquakes with complex filters and pagination."""
-        query = select(EarthquakeModel)
+        query = self._apply_filters(select(EarthquakeModel), filters)
+        query = self._paginate(query, limit, offset)
 
-        if filters:
-            conditions = []
+        result = await self.session.execute(query)
+        earthquake_models = result.scalars().all()
 
-            if filters.get("min_magnitude"):
-                conditions.append(
-                    EarthquakeModel.magnitude_value >= filters["min_magnitude"]
-                )
+        return [self._model_to_entity(model) for model in earthquake_models]
 
-            if filters.get("max_magnitude"):
-                conditions.append(
-                    EarthquakeModel.magnitude_value <= filters["max_magnitude"]
-                )
+    async def count_with_filters(self, filters: dict | None = None) -> int:
+        """Count earthquakes matching the given filters."""
+        query = self._apply_filters(select(func.count(EarthquakeModel.id)), filters)
 
-            if filters.get("start_time"):
-                conditions.append(EarthquakeModel.occurred_at >= filters["start_time"])
+        result = await self.session.execute(query)
+        return result.scalar()
 
-            if filters.get("end_time"):
-                conditions.append(EarthquakeModel.occurred_at <= filters["end_time"])
+    async def find_with_filters_and_count(
+        self,
+        filters: dict | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> tuple[list[Earthquake], int]:
+        """Find a page of earthquakes and the total match count in one query."""
+        query = self._apply_filters(
+            select(EarthquakeModel, func.count().over().label("total")), filters
+        )
+        query = self._paginate(query, limit, offset)
 
-            if filters.get("is_reviewed") is not None:
-                conditions.append(EarthquakeModel.is_reviewed == filters["is_reviewed"])
+        result = await self.session.execute(query)
+        rows = result.all()
 
-            if filters.get("source"):
-                conditions.append(EarthquakeModel.source == filters["source"])
+        if not rows:
+            # Past the last page there is no row to carry the window count
+            total = await self.count_with_filters(filters) if offset else 0
+            return [], total
 
-            # Location radius filter using PostGIS
-            if all(key in filters for key in ["latitude", "longitude", "radius_km"]):
-                lat, lng, radius = (
-                    filters["latitude"],
-                    filters["longitude"],
-                    filters["radius_km"],
-                )
-                search_point = func.ST_SetSRID(func.ST_MakePoint(lng, lat), 4326)
-                radius_meters = radius * 1000
-
-                conditions.append(
-                    func.ST_DWithin(
-                        func.ST_Transform(EarthquakeModel.location, 3857),
-                        func.ST_Transform(search_point, 3857),
-                        radius_meters,
-                    )
-                )
+        return [self._model_to_entity(row[0]) for row in rows], rows[0].total
 
-            if conditions:
-                query = query.where(and_(*conditions))
+    def _apply_filters(self, query, filters: dict | None):
+        """Add the WHERE clause for the given filters to a query."""
+        conditions = self._filter_conditions(filters)
+        if conditions:
+            query = query.where(and_(*conditions))
+        return query
 
-        # Order by occurred_at descending (newest first)
+    def _paginate(self, query, limit: int | None = None, offset: int | None = None):
+        """Order newest first and apply pagination."""
         query = query.order_by(EarthquakeModel.occurred_at.desc())
 
-        # Apply pagination
         if offset:
             query = query.offset(offset)
         if limit:
             query = query.limit(limit)
+        return query
 
-        result = await self.session.execute(query)
-        earthquake_models = result.scalars().all()
-
-        return [self._model_to_entity(model) for model in earthquake_models]
-
-    async def count_with_filters(self, filters: dict | None = None) -> int:
-        """Count earthquakes matching the given filters."""
-        query = select(func.count(EarthquakeModel.id))
+    def _filter_conditions(self, filters: dict | None) -> list:
+        """Build SQL conditions for the supported filter keys."""
+        conditions = []
+        if not filters:
+            return conditions
 
-        if filters:
-            conditions = []
-
-            if filters.get("min_magnitude"):
-                conditions.append(
-                    EarthquakeModel.magnitude_value >= filters["min_magnitude"]
-                )
+        if filters.get("min_magnitude"):
+            conditions.append(
+                EarthquakeModel.magnitude_value >= filters["min_magnitude"]
+            )
 
-            if filters.get("max_magnitude"):
-                conditions.append(
-                    EarthquakeModel.magnitude_value <= filters["max_magnitude"]
-                )
+        if filters.get("max_magnitude"):
+            conditions.append(
+                EarthquakeModel.magnitude_value <= filters["max_magnitude"]
+            )
 
-            if filters.get("start_time"):
-                conditions.append(EarthquakeModel.occurred_at >= filters["start_time"])
+        if filters.get("start_time"):
+            conditions.append(EarthquakeModel.occurred_at >= filters["start_time"])
 
-            if filters.get("end_time"):
-                conditions.append(EarthquakeModel.occurred_at <= filters["end_time"])
+        if filters.get("end_time"):
+            conditions.append(EarthquakeModel.occurred_at <= filters["end_time"])
 
-            if filters.get("is_reviewed") is not None:
-                conditions.append(EarthquakeModel.is_reviewed == filters["is_reviewed"])
+        if filters.get("is_reviewed") is not None:
+            conditions.append(EarthquakeModel.is_reviewed == filters["is_reviewed"])
 
-            if filters.get("source"):
-                conditions.append(EarthquakeModel.source == filters["source"])
+        if filters.get("source"):
+            conditions.append(EarthquakeModel.source == filters["source"])
 
-            # Location radius filter using PostGIS
-            if all(key in filters for key in ["latitude", "longitude", "radius_km"]):
-                lat, lng, radius = (
-                    filters["latitude"],
-                    filters["longitude"],
-                    filters["radius_km"],
-                )
-                search_point = func.ST_SetSRID(func.ST_MakePoint(lng, lat), 4326)
-                radius_meters = radius * 1000
-
-                conditions.append(
-                    func.ST_DWithin(
-                        func.ST_Transform(EarthquakeModel.location, 3857),
-                        func.ST_Transform(search_point, 3857),
-                        radius_meters,
-                    )
+        # Location radius filter using PostGIS
+        if all(key in filters for key in ["latitude", "longitude", "radius_km"]):
+            conditions.append(
+                _within_radius(
+                    filters["latitude"], filters["longitude"], filters["radius_km"]
                 )
+            )
 
-            if conditions:
-                query = query.where(and_(*conditions))
-
-        result = await self.session.execute(query)
-        return result.scalar()
+        return conditions
+
+    def _entity_to_values(self, earthquake: Earthquake) -> dict:
+        """Convert domain entity to column values for EarthquakeModel."""
+        return {
+            "id": earthquake.id,
+            "latitude": earthquake.location.latitude,
+            "longitude": earthquake.location.longitude,
+            "depth": earthquake.location.depth,
+            "magnitude_value": earthquake.magnitude.value,
+            "magnitude_scale": earthquake.magnitude.scale,
+            "occurred_at": earthquake.occurred_at,
+            "source": earthquake.source,
+            "external_id": earthquake.external_id,
+            "is_reviewed": earthquake.is_reviewed,
+            "raw_data": earthquake.raw_data,
+            "title": earthquake.title,
+        }
 
     def _model_to_entity(self, model: EarthquakeModel) -> Earthquake:
         """Convert SQLAlchemy model to domain entity."""
@@ -295,7 +422,8 @@ class PostgreSQLEarthquakeRepository(EarthquakeRepository):
         )
 
         magnitude = Magnitude(
-            value=model.magnitude_value, scale=MagnitudeScale(model.magnitude_scale)
+            value=model.magnitude_value,
+            scale=MAGNITUDE_SCALES_BY_VALUE[model.magnitude_scale],
         )
 
         earthquake = Earthquake(
@@ -10,6 +10,7 @@ from src.application.services.earthquake_event_orchestrator import (
 from src.application.use_cases.create_earthquake import CreateEarthquakeUseCase
 from src.application.use_cases.get_earthquake_details import GetEarthquakeDetailsUseCase
 from src.application.use_cases.get_earthquakes import GetEarthquakesUseCase
+from src.domain.entities.location import haversine_km_batch
 from src.domain.repositories.earthquake_reader import EarthquakeReader
 from src.domain.repositories.earthquake_repository import EarthquakeRepository
 from src.domain.repositories.earthquake_search import EarthquakeSearch
@@ -31,9 +32,27 @@ class MockEarthquakeRepository(EarthquakeRepository):
         self._earthquakes[earthquake.id] = earthquake
         return earthquake.id
 
+    async def save_many(self, earthquakes) -> list[str]:
+        return [await self.save(earthquake) for earthquake in earthquakes]
+
     async def find_by_id(self, earthquake_id: str):
         return self._earthquakes.get(earthquake_id)
 
+    async def find_by_ids(self, earthquake_ids: list[str]) -> dict:
+        return {
+            earthquake_id: self._earthquakes[earthquake_id]
+            for earthquake_id in earthquake_ids
+            if earthquake_id in self._earthquakes
+        }
+
+    async def find_ids_by_external_ids(self, external_ids: list[str]) -> dict:
+        wanted = set(external_ids)
+        return {
+            earthquake.external_id: earthquake.id
+            for earthquake in self._earthquakes.values()
+            if earthquake.external_id in wanted
+        }
+
     async def exists(self, earthquake_id: str) -> bool:
         return earthquake_id in self._earthquakes
 
@@ -56,14 +75,18 @@ class MockEarthquakeRepository(EarthquakeRepository):
     async def find_by_location_radius(
         self, latitude: float, longitude: float, radius_km: float
     ):
-        results = []
-        for earthquake in self._earthquakes.values():
-            distance = earthquake.location.distance_to(
-                type(earthquake.location)(latitude, longitude, 0)
-            )
-            if distance <= radius_km:
-                results.append(earthquake)
-        return results
+        earthquakes = list(self._earthquakes.values())
+        distances = haversine_km_batch(
+            latitude,
+            longitude,
+            [earthquake.location.latitude for earthquake in earthquakes],
+            [earthquake.location.longitude for earthquake in earthquakes],
+        )
+        return [
+            earthquake
+            for earthquake, distance in zip(earthquakes, distances, strict=True)
+            if distance <= radius_km
+        ]
 
     async def find_unreviewed(self):
         return [eq for eq in self._earthquakes.values() if not eq.is_reviewed]
@@ -110,6 +133,10 @@ class MockEarthquakeRepository(EarthquakeRepository):
 
         return results
 
+    async def find_with_filters_and_count(self, filters=None, limit=None, offset=None):
+        earthquakes = await self.find_with_filters(filters, limit, offset)
+        return earthquakes, await self.count_with_filters(filters)
+
     async def count_with_filters(self, filters=None):
         results = list(self._earthquakes.values())
 
@@ -10,11 +10,15 @@ from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
 
 from src.application.events.event_handlers import EarthquakeEventHandlers
-from src.application.events.event_publisher import InMemoryEventPublisher
+from src.application.events.event_publisher import (
+    InMemoryEventPublisher,
+    QueuedEventPublisher,
+)
 from src.application.services.websocket_filter_service import WebSocketFilterService
 from src.domain.events.earthquake_detected import EarthquakeDetected
 from src.domain.events.high_magnitude_alert import HighMagnitudeAlert
 from src.domain.exceptions import DomainException
+from src.infrastructure.factory import background_repository_scope
 
 from .auth.router import router as auth_router
 from .auth.security import get_security_service
@@ -29,7 +33,13 @@ logger = logging.getLogger(__name__)
 
 
 # Set up event system early (needed for auto-starting scheduler)
-event_publisher = InMemoryEventPublisher()
+# A positive EVENT_QUEUE_SIZE decouples publishers from handler fan-out
+event_queue_size = int(os.getenv("EVENT_QUEUE_SIZE", "0"))
+event_publisher = (
+    QueuedEventPublisher(maxsize=event_queue_size)
+    if event_queue_size > 0
+    else InMemoryEventPublisher()
+)
 
 
 def get_event_publisher():
@@ -126,6 +136,11 @@ async def lifespan(app):
                 f"Error stopping background scheduler service: {e}", exc_info=True
             )
 
+    if isinstance(event_publisher, QueuedEventPublisher):
+        await event_publisher.close()
+    # After the publisher, so updates from the last queued events are sent too
+    await event_handlers.close()
+
     logger.info("Application shutdown completed")
 
 
@@ -321,10 +336,13 @@ websocket_manager = websocket.get_websocket_manager()
 # Set up WebSocket filtering service
 websocket_filter_service = WebSocketFilterService()
 
-# Note: Event handlers will get repository via dependency injection when needed
+# Event handlers open a short-lived repository per lookup through the provider
 # This avoids sync/async issues during app startup
 event_handlers = EarthquakeEventHandlers(
-    websocket_manager, None, websocket_filter_service
+    websocket_manager,
+    None,
+    websocket_filter_service,
+    repository_provider=background_repository_scope,
 )
 
 # Subscribe event handlers
@@ -212,11 +212,11 @@ class TestSchedulerIntegration:
         assert len(stopped_jobs) == 0
 
         # But we can re-add jobs after shutdown
-        # Note: calling setup_earthquake_ingestion_job again would not add duplicate
-        # due to the _jobs_added flag, so we test the idempotent behavior
+        # Note: calling setup_earthquake_ingestion_job again replaces the existing
+        # job instead of adding a duplicate, so we test the idempotent behavior
         try:
             await scheduler_service.setup_earthquake_ingestion_job()
-            # This should not add a duplicate due to internal flag
+            # This should not add a duplicate since the job is replaced
         except Exception:
             # If it fails due to stopped scheduler, that's also acceptable behavior
             pass
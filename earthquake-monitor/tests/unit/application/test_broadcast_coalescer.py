@@ -0,0 +1,59 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.application.events.broadcast_coalescer import BroadcastCoalescer
+
+
+class TestBroadcastCoalescer:
+    @pytest.fixture
+    def websocket_manager(self):
+        manager = Mock()
+        manager.broadcast_earthquake_batch = AsyncMock()
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_flushes_buffered_updates_after_interval(self, websocket_manager):
+        coalescer = BroadcastCoalescer(websocket_manager, flush_interval=0.01)
+
+        await coalescer.enqueue({"id": "eq-1"})
+        await coalescer.enqueue({"id": "eq-2"}, "earthquake-2")
+        websocket_manager.broadcast_earthquake_batch.assert_not_called()
+
+        await asyncio.sleep(0.05)
+
+        websocket_manager.broadcast_earthquake_batch.assert_called_once_with(
+            [({"id": "eq-1"}, None), ({"id": "eq-2"}, "earthquake-2")]
+        )
+
+    @pytest.mark.asyncio
+    async def test_flushes_immediately_when_full(self, websocket_manager):
+        coalescer = BroadcastCoalescer(
+            websocket_manager, flush_interval=10, max_items=2
+        )
+
+        await coalescer.enqueue({"id": "eq-1"})
+        await coalescer.enqueue({"id": "eq-2"})
+
+        websocket_manager.broadcast_earthquake_batch.assert_called_once()
+        assert coalescer._flush_task is None
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_pending_updates(self, websocket_manager):
+        coalescer = BroadcastCoalescer(websocket_manager, flush_interval=10)
+
+        await coalescer.enqueue({"id": "eq-1"})
+        await coalescer.close()
+        await coalescer.close()
+
+        websocket_manager.broadcast_earthquake_batch.assert_called_once_with(
+            [({"id": "eq-1"}, None)]
+        )
+
+    @pytest.mark.parametrize("flush_interval, max_items", [(0, 1), (1, 0)])
+    def test_rejects_invalid_configuration(self, flush_interval, max_items):
+        with pytest.raises(ValueError):
+            BroadcastCoalescer(
+                Mock(), flush_interval=flush_interval, max_items=max_items
+            )
@@ -8,6 +8,10 @@ from src.application.services.earthquake_event_orchestrator import (
     EarthquakeEventOrchestrator,
 )
 from src.application.use_cases.create_earthquake import CreateEarthquakeUseCase
+from src.domain.exceptions import (
+    EarthquakeBatchWriteError,
+    InvalidEarthquakeDataError,
+)
 from src.domain.repositories.earthquake_writer import EarthquakeWriter
 from src.domain.services.earthquake_factory_service import EarthquakeFactoryService
 from src.domain.services.earthquake_validation_service import (
@@ -20,12 +24,16 @@ class TestCreateEarthquakeUseCase:
     def mock_writer(self):
         writer = Mock(spec=EarthquakeWriter)
         writer.save = AsyncMock()
+        writer.save_many = AsyncMock(
+            side_effect=lambda earthquakes: [eq.id for eq in earthquakes]
+        )
         return writer
 
     @pytest.fixture
     def mock_event_orchestrator(self):
         orchestrator = Mock(spec=EarthquakeEventOrchestrator)
         orchestrator.publish_earthquake_events = AsyncMock()
+        orchestrator.publish_events_for_earthquakes = AsyncMock()
         return orchestrator
 
     @pytest.fixture
@@ -108,6 +116,21 @@ class TestCreateEarthquakeUseCase:
         assert saved_earthquake.source == "USGS"
         assert saved_earthquake.magnitude.scale.value == "moment"
 
+    @pytest.mark.asyncio
+    async def test_unknown_magnitude_scale_is_rejected(self, use_case, mock_writer):
+        request = CreateEarthquakeRequest(
+            latitude=37.7749,
+            longitude=-122.4194,
+            depth=10.5,
+            magnitude_value=5.5,
+            magnitude_scale="unknown",
+        )
+
+        with pytest.raises(InvalidEarthquakeDataError):
+            await use_case.execute(request)
+
+        mock_writer.save.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_create_earthquake_publishes_events(
         self, use_case, mock_writer, mock_event_orchestrator
@@ -136,3 +159,120 @@ class TestCreateEarthquakeUseCase:
         )
         assert published_earthquake.magnitude.value == 6.0
         assert published_earthquake.location.latitude == 37.7749
+
+    @pytest.mark.asyncio
+    async def test_execute_many_uses_single_bulk_save(
+        self, use_case, mock_writer, mock_event_orchestrator, mock_validation_service
+    ):
+        # Arrange
+        requests = [
+            CreateEarthquakeRequest(
+                latitude=37.0 + i,
+                longitude=-122.0,
+                depth=10.0,
+                magnitude_value=4.0 + i,
+                magnitude_scale="moment",
+                occurred_at=datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC),
+                source="USGS",
+            )
+            for i in range(3)
+        ]
+
+        # Act
+        earthquake_ids = await use_case.execute_many(requests)
+
+        # Assert
+        assert len(earthquake_ids) == 3
+        mock_writer.save_many.assert_called_once()
+        mock_writer.save.assert_not_called()
+        assert mock_validation_service.validate_earthquake_data.call_count == 3
+
+        saved_earthquakes = mock_writer.save_many.call_args[0][0]
+        assert [eq.id for eq in saved_earthquakes] == earthquake_ids
+        mock_event_orchestrator.publish_earthquake_events.assert_not_called()
+        mock_event_orchestrator.publish_events_for_earthquakes.assert_awaited_once_with(
+            saved_earthquakes
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_many_skips_already_stored_earthquakes(
+        self, use_case, mock_writer, mock_event_orchestrator
+    ):
+        requests = [
+            CreateEarthquakeRequest(
+                latitude=37.0,
+                longitude=-122.0,
+                depth=10.0,
+                magnitude_value=4.0,
+                magnitude_scale="moment",
+                occurred_at=datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC),
+                source="USGS",
+                external_id=f"us-{i}",
+            )
+            for i in range(2)
+        ]
+        # The first request conflicts with a row stored under another ID
+        mock_writer.save_many.side_effect = lambda earthquakes: [
+            "stored-id",
+            earthquakes[1].id,
+        ]
+
+        earthquake_ids = await use_case.execute_many(requests)
+
+        fresh = mock_writer.save_many.call_args[0][0][1]
+        assert earthquake_ids == [fresh.id]
+        mock_event_orchestrator.publish_events_for_earthquakes.assert_awaited_once_with(
+            [fresh]
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_many_wraps_write_failures(
+        self, use_case, mock_writer, mock_event_orchestrator
+    ):
+        mock_writer.save_many.side_effect = RuntimeError("connection lost")
+
+        with pytest.raises(EarthquakeBatchWriteError, match="connection lost"):
+            await use_case.execute_many([self._request()])
+
+        mock_event_orchestrator.publish_events_for_earthquakes.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_many_propagates_publish_failures(
+        self, mock_writer, mock_validation_service, mock_factory_service
+    ):
+        publisher = Mock()
+        publisher.publish_many = AsyncMock(side_effect=RuntimeError("handler failed"))
+        use_case = CreateEarthquakeUseCase(
+            mock_writer,
+            EarthquakeEventOrchestrator(publisher),
+            mock_validation_service,
+            mock_factory_service,
+        )
+
+        # The rows are committed, so this is not reported as a write failure
+        with pytest.raises(RuntimeError, match="handler failed"):
+            await use_case.execute_many([self._request()])
+
+        mock_writer.save_many.assert_awaited_once()
+        publisher.publish_many.assert_awaited_once()
+
+    @staticmethod
+    def _request() -> CreateEarthquakeRequest:
+        return CreateEarthquakeRequest(
+            latitude=37.0,
+            longitude=-122.0,
+            depth=10.0,
+            magnitude_value=4.0,
+            magnitude_scale="moment",
+            occurred_at=datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC),
+            source="USGS",
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_many_with_no_requests(self, use_case, mock_writer):
+        # Act
+        earthquake_ids = await use_case.execute_many([])
+
+        # Assert
+        assert earthquake_ids == []
+        mock_writer.save_many.assert_not_called()
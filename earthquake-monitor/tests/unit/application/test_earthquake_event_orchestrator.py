@@ -0,0 +1,113 @@
+import asyncio
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.application.services.earthquake_event_orchestrator import (
+    EarthquakeEventOrchestrator,
+)
+from src.domain.entities.earthquake import Earthquake
+from src.domain.entities.location import Location
+from src.domain.entities.magnitude import Magnitude
+from src.domain.events.earthquake_detected import EarthquakeDetected
+from src.domain.events.high_magnitude_alert import HighMagnitudeAlert
+
+
+class TestEarthquakeEventOrchestrator:
+    @pytest.fixture
+    def mock_publisher(self):
+        publisher = Mock()
+        publisher.publish = AsyncMock()
+        publisher.publish_many = AsyncMock()
+        return publisher
+
+    @pytest.fixture
+    def orchestrator(self, mock_publisher):
+        return EarthquakeEventOrchestrator(mock_publisher)
+
+    @staticmethod
+    def _earthquake(magnitude: float) -> Earthquake:
+        return Earthquake(
+            location=Location(latitude=34.0522, longitude=-118.2437, depth=10.0),
+            magnitude=Magnitude(value=magnitude),
+            occurred_at=datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC),
+            source="USGS",
+        )
+
+    @pytest.mark.asyncio
+    async def test_minor_earthquake_publishes_detected_only(
+        self, orchestrator, mock_publisher
+    ):
+        await orchestrator.publish_earthquake_events(self._earthquake(3.0))
+
+        mock_publisher.publish.assert_called_once()
+        event = mock_publisher.publish.call_args[0][0]
+        assert isinstance(event, EarthquakeDetected)
+
+    @pytest.mark.asyncio
+    async def test_significant_earthquake_publishes_events_concurrently(
+        self, orchestrator, mock_publisher
+    ):
+        started = []
+        release = asyncio.Event()
+
+        async def publish(event):
+            started.append(type(event))
+            await release.wait()
+
+        mock_publisher.publish.side_effect = publish
+
+        task = asyncio.create_task(
+            orchestrator.publish_earthquake_events(self._earthquake(7.5))
+        )
+        await asyncio.sleep(0.01)
+        # Both publishes are in flight before either has finished
+        assert started == [EarthquakeDetected, HighMagnitudeAlert]
+
+        release.set()
+        await task
+
+    @pytest.mark.asyncio
+    async def test_alert_checks_populated_areas_once(
+        self, orchestrator, mock_publisher
+    ):
+        earthquake = self._earthquake(7.5)
+
+        with patch.object(
+            Location, "is_near_populated_area", autospec=True, return_value=True
+        ) as mock_check:
+            await orchestrator.publish_earthquake_events(earthquake)
+
+        assert mock_check.call_count == 1
+        alert = mock_publisher.publish.call_args_list[1][0][0]
+        assert alert.requires_immediate_response is True
+        assert alert.affected_radius_km == earthquake.calculate_affected_radius_km()
+        assert alert.alert_level == earthquake.magnitude.get_alert_level()
+
+    @pytest.mark.asyncio
+    async def test_batch_events_are_published_together(
+        self, orchestrator, mock_publisher
+    ):
+        minor = self._earthquake(3.0)
+        major = self._earthquake(7.5)
+
+        with patch.object(
+            Location, "is_near_populated_area", autospec=True, return_value=True
+        ):
+            await orchestrator.publish_events_for_earthquakes([minor, major])
+
+        mock_publisher.publish.assert_not_called()
+        mock_publisher.publish_many.assert_awaited_once()
+        events = mock_publisher.publish_many.call_args[0][0]
+        assert [(type(event), event.earthquake_id) for event in events] == [
+            (EarthquakeDetected, minor.id),
+            (EarthquakeDetected, major.id),
+            (HighMagnitudeAlert, major.id),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_publishes_nothing(self, orchestrator, mock_publisher):
+        await orchestrator.publish_events_for_earthquakes([])
+
+        mock_publisher.publish_many.assert_not_called()
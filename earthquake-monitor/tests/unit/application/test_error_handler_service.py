@@ -0,0 +1,72 @@
+import pytest
+
+from src.application.exceptions import (
+    ResourceConflictError,
+    ResourceNotFoundError,
+    UseCaseExecutionError,
+)
+from src.application.services.error_handler_service import ErrorHandlerService
+from src.domain.exceptions import (
+    EarthquakeAlreadyExistsError,
+    EarthquakeNotFoundError,
+    InvalidMagnitudeError,
+)
+from src.infrastructure.exceptions import (
+    DatabaseOperationError,
+    ExternalServiceError,
+    InfrastructureException,
+)
+
+
+class DuplicateUsgsEventError(EarthquakeAlreadyExistsError):
+    pass
+
+
+class TestErrorHandlerService:
+    @pytest.fixture
+    def service(self):
+        return ErrorHandlerService()
+
+    @pytest.mark.parametrize(
+        "domain_exception, expected_type",
+        [
+            (EarthquakeNotFoundError("missing"), ResourceNotFoundError),
+            (EarthquakeAlreadyExistsError("duplicate"), ResourceConflictError),
+            (DuplicateUsgsEventError("duplicate"), ResourceConflictError),
+            (InvalidMagnitudeError("bad magnitude"), UseCaseExecutionError),
+        ],
+    )
+    def test_maps_domain_exceptions(self, service, domain_exception, expected_type):
+        mapped = service._map_domain_exception(domain_exception)
+
+        assert isinstance(mapped, expected_type)
+
+    def test_resolved_handler_is_cached_per_type(self, service):
+        service._map_domain_exception(DuplicateUsgsEventError("duplicate"))
+
+        assert (
+            service._handler_cache[DuplicateUsgsEventError]
+            == service._handle_conflict_error
+        )
+
+    @pytest.mark.parametrize(
+        "operation, exception, expected_type",
+        [
+            ("Database insert", RuntimeError("boom"), DatabaseOperationError),
+            ("save", RuntimeError("SQL syntax error"), DatabaseOperationError),
+            ("fetch", RuntimeError("HTTP 503"), ExternalServiceError),
+            ("fetch", RuntimeError("Network unreachable"), ExternalServiceError),
+            ("fetch", RuntimeError("boom"), InfrastructureException),
+        ],
+    )
+    def test_classifies_infrastructure_errors(
+        self, service, operation, exception, expected_type
+    ):
+        wrapped = service.handle_infrastructure_error(operation, exception)
+
+        assert type(wrapped) is expected_type
+
+    def test_infrastructure_exceptions_pass_through(self, service):
+        exception = ExternalServiceError("usgs")
+
+        assert service.handle_infrastructure_error("fetch", exception) is exception
@@ -1,9 +1,13 @@
-from datetime import UTC, datetime
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 
 from src.application.events.event_handlers import EarthquakeEventHandlers
+from src.domain.entities.earthquake import Earthquake
+from src.domain.entities.location import Location
+from src.domain.entities.magnitude import Magnitude
 from src.domain.events.earthquake_detected import EarthquakeDetected
 from src.domain.events.high_magnitude_alert import HighMagnitudeAlert
 
@@ -74,3 +78,222 @@ class TestEarthquakeEventHandlers:
         assert call_args["data"]["longitude"] == -118.0
         assert call_args["data"]["affected_radius_km"] == 150.0
         assert call_args["data"]["requires_immediate_response"] is True
+
+    @pytest.fixture
+    def stored_earthquake(self):
+        return Earthquake(
+            location=Location(latitude=37.7749, longitude=-122.4194, depth=10.5),
+            magnitude=Magnitude(value=5.5),
+            occurred_at=datetime.now(UTC) - timedelta(hours=1),
+        )
+
+    @pytest.fixture
+    def mock_repository(self, stored_earthquake):
+        repository = Mock()
+        repository.find_by_id = AsyncMock(return_value=stored_earthquake)
+        return repository
+
+    @pytest.mark.asyncio
+    async def test_repeated_events_reuse_cached_earthquake(
+        self, mock_websocket_manager, mock_repository, stored_earthquake
+    ):
+        handlers = EarthquakeEventHandlers(mock_websocket_manager, mock_repository)
+        event = EarthquakeDetected(
+            earthquake_id=stored_earthquake.id,
+            occurred_at=stored_earthquake.occurred_at,
+            magnitude=5.5,
+            latitude=37.7749,
+            longitude=-122.4194,
+            depth=10.5,
+            source="USGS",
+        )
+
+        await handlers.handle_earthquake_detected(event)
+        await handlers.handle_earthquake_detected(event)
+
+        mock_repository.find_by_id.assert_called_once_with(stored_earthquake.id)
+        assert mock_websocket_manager.broadcast_earthquake_update.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_attached_earthquake_skips_repository(
+        self, mock_websocket_manager, mock_repository, stored_earthquake
+    ):
+        handlers = EarthquakeEventHandlers(mock_websocket_manager, mock_repository)
+        event = EarthquakeDetected(
+            earthquake_id=stored_earthquake.id,
+            occurred_at=stored_earthquake.occurred_at,
+            magnitude=5.5,
+            latitude=37.7749,
+            longitude=-122.4194,
+            depth=10.5,
+            source="USGS",
+            earthquake=stored_earthquake,
+        )
+
+        await handlers.handle_earthquake_detected(event)
+
+        mock_repository.find_by_id.assert_not_called()
+        mock_websocket_manager.broadcast_earthquake_update.assert_called_once()
+        assert (
+            mock_websocket_manager.broadcast_earthquake_update.call_args[0][1]
+            is stored_earthquake
+        )
+
+    @pytest.mark.asyncio
+    async def test_repository_error_falls_back_to_single_event_broadcast(
+        self, mock_websocket_manager
+    ):
+        repository = Mock()
+        repository.find_by_id = AsyncMock(side_effect=RuntimeError("db down"))
+        handlers = EarthquakeEventHandlers(mock_websocket_manager, repository)
+        event = EarthquakeDetected(
+            earthquake_id="test-789",
+            occurred_at=datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC),
+            magnitude=4.5,
+            latitude=10.0,
+            longitude=20.0,
+            depth=5.0,
+            source="USGS",
+        )
+
+        await handlers.handle_earthquake_detected(event)
+
+        mock_websocket_manager.broadcast_earthquake_update.assert_called_once()
+        message, earthquake = (
+            mock_websocket_manager.broadcast_earthquake_update.call_args[0]
+        )
+        assert message["data"]["id"] == "test-789"
+        assert "alert_level" not in message["data"]
+        assert earthquake is None
+
+    @pytest.fixture
+    def alert_event(self, stored_earthquake):
+        return HighMagnitudeAlert(
+            earthquake_id=stored_earthquake.id,
+            magnitude=7.2,
+            alert_level="CRITICAL",
+            latitude=35.0,
+            longitude=-118.0,
+            affected_radius_km=150.0,
+            requires_immediate_response=True,
+            depth=12.0,
+            occurred_at=datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC),
+            source="USGS",
+        )
+
+    @pytest.mark.asyncio
+    async def test_alert_is_broadcast_from_event_without_repository(
+        self, mock_websocket_manager, mock_repository, alert_event
+    ):
+        handlers = EarthquakeEventHandlers(mock_websocket_manager, mock_repository)
+
+        await handlers.handle_high_magnitude_alert(alert_event)
+
+        mock_repository.find_by_id.assert_not_called()
+        call = mock_websocket_manager.broadcast_alert.call_args
+        assert call.kwargs["alert"] is alert_event
+        message = call.args[0]
+        assert message["data"]["affected_radius_km"] == 150.0
+        assert message["data"]["depth"] == 12.0
+        assert message["data"]["occurred_at"] == "2024-01-01T12:00:00+00:00"
+        assert message["data"]["source"] == "USGS"
+
+    @pytest.mark.asyncio
+    async def test_alert_verified_against_repository_when_enabled(
+        self, monkeypatch, mock_websocket_manager, mock_repository, alert_event
+    ):
+        monkeypatch.setenv("VERIFY_ALERTS_AGAINST_DB", "true")
+        handlers = EarthquakeEventHandlers(mock_websocket_manager, mock_repository)
+
+        await handlers.handle_high_magnitude_alert(alert_event)
+
+        mock_repository.find_by_id.assert_called_once_with(alert_event.earthquake_id)
+        mock_websocket_manager.broadcast_alert.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_batched_lookups_use_find_by_ids(
+        self, mock_websocket_manager, stored_earthquake, monkeypatch
+    ):
+        monkeypatch.setenv("EVENT_LOOKUP_BATCH_MS", "10")
+        repository = Mock()
+        repository.find_by_ids = AsyncMock(
+            return_value={stored_earthquake.id: stored_earthquake}
+        )
+        handlers = EarthquakeEventHandlers(mock_websocket_manager, repository)
+
+        earthquake = await handlers._find_earthquake(stored_earthquake.id)
+
+        assert earthquake is stored_earthquake
+        repository.find_by_ids.assert_called_once_with([stored_earthquake.id])
+
+    @pytest.mark.asyncio
+    async def test_stored_earthquake_payload_uses_event_timestamp(
+        self, mock_websocket_manager, stored_earthquake
+    ):
+        handlers = EarthquakeEventHandlers(mock_websocket_manager)
+        event = EarthquakeDetected(
+            earthquake_id=stored_earthquake.id,
+            occurred_at=stored_earthquake.occurred_at,
+            magnitude=5.5,
+            latitude=37.7749,
+            longitude=-122.4194,
+            depth=10.5,
+            source="USGS",
+            earthquake=stored_earthquake,
+            timestamp=datetime(2024, 1, 1, 12, 0, 5, tzinfo=UTC),
+        )
+
+        await handlers.handle_earthquake_detected(event)
+
+        message = mock_websocket_manager.broadcast_earthquake_update.call_args[0][0]
+        assert message["data"]["timestamp"] == "2024-01-01T12:00:05+00:00"
+
+    @pytest.mark.asyncio
+    async def test_repository_provider_is_used_for_lookups(
+        self, mock_websocket_manager, mock_repository, stored_earthquake
+    ):
+        opened = []
+
+        @asynccontextmanager
+        async def provider():
+            opened.append(True)
+            yield mock_repository
+
+        handlers = EarthquakeEventHandlers(
+            mock_websocket_manager, repository_provider=provider
+        )
+
+        earthquake = await handlers._find_earthquake(stored_earthquake.id)
+
+        assert earthquake is stored_earthquake
+        assert opened == [True]
+        mock_repository.find_by_id.assert_called_once_with(stored_earthquake.id)
+
+    @pytest.mark.asyncio
+    async def test_close_sends_coalesced_updates(
+        self, monkeypatch, mock_websocket_manager
+    ):
+        monkeypatch.setenv("WEBSOCKET_COALESCE_MS", "10000")
+        mock_websocket_manager.broadcast_earthquake_batch = AsyncMock()
+        handlers = EarthquakeEventHandlers(mock_websocket_manager)
+        event = EarthquakeDetected(
+            earthquake_id="eq-1",
+            occurred_at=datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC),
+            magnitude=5.5,
+            latitude=37.7749,
+            longitude=-122.4194,
+            depth=10.5,
+            source="USGS",
+        )
+
+        await handlers.handle_earthquake_detected(event)
+        mock_websocket_manager.broadcast_earthquake_batch.assert_not_called()
+
+        await handlers.close()
+
+        items = mock_websocket_manager.broadcast_earthquake_batch.call_args[0][0]
+        assert [message["data"]["id"] for message, _ in items] == ["eq-1"]
+        assert handlers._coalescer._flush_task is None
+
+    def test_handlers_use_slots(self, event_handlers):
+        assert not hasattr(event_handlers, "__dict__")
@@ -1,8 +1,12 @@
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
 
-from src.application.events.event_publisher import InMemoryEventPublisher
+from src.application.events.event_publisher import (
+    InMemoryEventPublisher,
+    QueuedEventPublisher,
+)
 from src.domain.events.earthquake_detected import EarthquakeDetected
 
 
@@ -76,3 +80,120 @@ class TestInMemoryEventPublisher:
 
         handler1.assert_called_once_with(event)
         handler2.assert_called_once_with(event)
+
+    @pytest.mark.asyncio
+    async def test_multiple_handlers_run_concurrently(self):
+        publisher = InMemoryEventPublisher()
+        started = []
+        release = asyncio.Event()
+
+        def make_handler(name):
+            async def handler(event):
+                started.append(name)
+                await release.wait()
+
+            return handler
+
+        publisher.subscribe(EarthquakeDetected, make_handler("first"))
+        publisher.subscribe(EarthquakeDetected, make_handler("second"))
+
+        event = EarthquakeDetected(
+            earthquake_id="test-123",
+            occurred_at=None,
+            magnitude=5.5,
+            latitude=37.7749,
+            longitude=-122.4194,
+            depth=10.5,
+            source="USGS",
+        )
+
+        task = asyncio.create_task(publisher.publish(event))
+        await asyncio.sleep(0.01)
+        # The second handler starts while the first is still waiting
+        assert started == ["first", "second"]
+
+        release.set()
+        await task
+
+    @pytest.mark.asyncio
+    async def test_publish_many_dispatches_every_event(self):
+        publisher = InMemoryEventPublisher()
+        handler = AsyncMock()
+        publisher.subscribe(EarthquakeDetected, handler)
+        events = [
+            EarthquakeDetected(
+                earthquake_id=earthquake_id,
+                occurred_at=None,
+                magnitude=5.5,
+                latitude=37.7749,
+                longitude=-122.4194,
+                depth=10.5,
+                source="USGS",
+            )
+            for earthquake_id in ("a", "b")
+        ]
+
+        await publisher.publish_many(events)
+
+        assert [call.args[0] for call in handler.call_args_list] == events
+
+
+class TestQueuedEventPublisher:
+    @staticmethod
+    def _event(earthquake_id: str) -> EarthquakeDetected:
+        return EarthquakeDetected(
+            earthquake_id=earthquake_id,
+            occurred_at=None,
+            magnitude=5.5,
+            latitude=37.7749,
+            longitude=-122.4194,
+            depth=10.5,
+            source="USGS",
+        )
+
+    @pytest.mark.asyncio
+    async def test_publish_returns_before_handler_runs(self):
+        publisher = QueuedEventPublisher()
+        handled = []
+        release = asyncio.Event()
+
+        async def handler(event):
+            await release.wait()
+            handled.append(event.earthquake_id)
+
+        publisher.subscribe(EarthquakeDetected, handler)
+
+        await publisher.publish(self._event("a"))
+        await publisher.publish(self._event("b"))
+        assert handled == []
+
+        release.set()
+        await publisher.close()
+        assert handled == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_handler_error_does_not_stop_worker(self):
+        publisher = QueuedEventPublisher()
+        handler = AsyncMock(side_effect=[RuntimeError("boom"), None])
+        publisher.subscribe(EarthquakeDetected, handler)
+
+        await publisher.publish(self._event("a"))
+        await publisher.publish(self._event("b"))
+        await publisher.close()
+
+        assert handler.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_publish_many_keeps_order(self):
+        publisher = QueuedEventPublisher()
+        handled = []
+
+        async def handler(event):
+            handled.append(event.earthquake_id)
+
+        publisher.subscribe(EarthquakeDetected, handler)
+
+        await publisher.publish_many([self._event("a"), self._event("b")])
+        await publisher.close()
+
+        assert handled == ["a", "b"]
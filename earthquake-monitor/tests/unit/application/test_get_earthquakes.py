@@ -0,0 +1,63 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.application.dto.earthquake_dto import EarthquakeFilters, PaginationParams
+from src.application.use_cases.get_earthquakes import GetEarthquakesUseCase
+
+
+class TestEarthquakeFilters:
+    def test_empty_filters_convert_to_none(self):
+        assert EarthquakeFilters().to_repository_dict() is None
+
+    def test_only_set_filters_are_included(self):
+        filters = EarthquakeFilters(
+            min_magnitude=4.0,
+            is_reviewed=False,
+            latitude=35.5,
+            longitude=-120.0,
+            radius_km=100.0,
+        )
+
+        assert filters.to_repository_dict() == {
+            "min_magnitude": 4.0,
+            "is_reviewed": False,
+            "latitude": 35.5,
+            "longitude": -120.0,
+            "radius_km": 100.0,
+        }
+
+
+class TestGetEarthquakesUseCase:
+    @pytest.fixture
+    def mock_search(self):
+        search = Mock()
+        search.find_with_filters_and_count = AsyncMock(
+            return_value=(["eq-1", "eq-2"], 3)
+        )
+        return search
+
+    @pytest.mark.asyncio
+    async def test_passes_filters_and_pagination_to_repository(self, mock_search):
+        use_case = GetEarthquakesUseCase(mock_search)
+
+        result = await use_case.execute(
+            EarthquakeFilters(source="USGS"), PaginationParams(page=2, size=2)
+        )
+
+        mock_search.find_with_filters_and_count.assert_awaited_once_with(
+            filters={"source": "USGS"}, limit=2, offset=2
+        )
+        assert result.items == ["eq-1", "eq-2"]
+        assert result.total == 3
+        assert result.pages == 2
+
+    @pytest.mark.asyncio
+    async def test_without_filters_passes_none(self, mock_search):
+        use_case = GetEarthquakesUseCase(mock_search)
+
+        await use_case.execute()
+
+        mock_search.find_with_filters_and_count.assert_awaited_once_with(
+            filters=None, limit=50, offset=0
+        )
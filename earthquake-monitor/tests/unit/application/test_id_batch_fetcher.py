@@ -0,0 +1,85 @@
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.application.events.id_batch_fetcher import IdBatchFetcher
+
+
+class TestIdBatchFetcher:
+    @pytest.fixture
+    def mock_repository(self):
+        repository = Mock()
+        repository.find_by_ids = AsyncMock(
+            side_effect=lambda ids: {i: f"earthquake-{i}" for i in ids if i != "gone"}
+        )
+        return repository
+
+    @pytest.fixture
+    def repository_scope(self, mock_repository):
+        @asynccontextmanager
+        async def scope():
+            yield mock_repository
+
+        return scope
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_query(
+        self, repository_scope, mock_repository
+    ):
+        fetcher = IdBatchFetcher(repository_scope, window=0.01)
+
+        results = await asyncio.gather(
+            fetcher.get("a"), fetcher.get("b"), fetcher.get("a"), fetcher.get("gone")
+        )
+
+        assert results == ["earthquake-a", "earthquake-b", "earthquake-a", None]
+        mock_repository.find_by_ids.assert_called_once_with(["a", "b", "gone"])
+
+    @pytest.mark.asyncio
+    async def test_full_batch_is_loaded_without_waiting(
+        self, repository_scope, mock_repository
+    ):
+        fetcher = IdBatchFetcher(repository_scope, window=10, max_batch=1)
+
+        assert await fetcher.get("a") == "earthquake-a"
+        mock_repository.find_by_ids.assert_called_once_with(["a"])
+
+    @pytest.mark.asyncio
+    async def test_query_error_is_raised_to_every_caller(
+        self, repository_scope, mock_repository
+    ):
+        mock_repository.find_by_ids.side_effect = RuntimeError("db down")
+        fetcher = IdBatchFetcher(repository_scope, window=0.01)
+
+        results = await asyncio.gather(
+            fetcher.get("a"), fetcher.get("b"), return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_flush_releases_every_caller(
+        self, repository_scope, mock_repository
+    ):
+        query_started = asyncio.Event()
+
+        async def find_by_ids(ids):
+            query_started.set()
+            await asyncio.Event().wait()
+
+        mock_repository.find_by_ids.side_effect = find_by_ids
+        fetcher = IdBatchFetcher(repository_scope, window=0.01)
+
+        callers = [asyncio.create_task(fetcher.get(i)) for i in ("a", "b")]
+        await asyncio.sleep(0)
+        flush_task = fetcher._flush_task
+        await query_started.wait()
+        flush_task.cancel()
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*callers, return_exceptions=True), timeout=1
+        )
+
+        assert all(isinstance(result, asyncio.CancelledError) for result in results)
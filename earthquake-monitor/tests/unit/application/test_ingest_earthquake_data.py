@@ -0,0 +1,131 @@
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.application.use_cases.ingest_earthquake_data import (
+    IngestEarthquakeDataUseCase,
+)
+from src.domain.entities.earthquake import Earthquake
+from src.domain.entities.location import Location
+from src.domain.entities.magnitude import Magnitude
+from src.domain.events.earthquake_detected import EarthquakeDetected
+from src.domain.events.high_magnitude_alert import HighMagnitudeAlert
+
+
+class TestIngestEarthquakeDataUseCase:
+    @pytest.fixture
+    def mock_repository(self):
+        repository = Mock()
+        repository.find_ids_by_external_ids = AsyncMock(return_value={})
+        repository.save = AsyncMock(side_effect=lambda earthquake: earthquake.id)
+        repository.save_many = AsyncMock(
+            side_effect=lambda earthquakes: [eq.id for eq in earthquakes]
+        )
+        return repository
+
+    @pytest.fixture
+    def mock_publisher(self):
+        publisher = Mock()
+        publisher.publish_many = AsyncMock()
+        return publisher
+
+    @pytest.fixture
+    def use_case(self, mock_repository, mock_publisher):
+        return IngestEarthquakeDataUseCase(mock_repository, mock_publisher)
+
+    @staticmethod
+    def _earthquake(external_id: str, magnitude: float = 3.0) -> Earthquake:
+        return Earthquake(
+            location=Location(latitude=34.0522, longitude=-118.2437, depth=10.0),
+            magnitude=Magnitude(value=magnitude),
+            occurred_at=datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC),
+            source="USGS",
+            external_id=external_id,
+        )
+
+    @pytest.mark.asyncio
+    async def test_existing_earthquakes_are_checked_in_one_query(
+        self, use_case, mock_repository, mock_publisher
+    ):
+        known = self._earthquake("us-1")
+        fresh = self._earthquake("us-2")
+        mock_repository.find_ids_by_external_ids.return_value = {"us-1": "stored-id"}
+
+        result = await use_case.execute([known, fresh])
+
+        mock_repository.find_ids_by_external_ids.assert_awaited_once()
+        assert sorted(mock_repository.find_ids_by_external_ids.call_args[0][0]) == [
+            "us-1",
+            "us-2",
+        ]
+        mock_repository.save_many.assert_awaited_once_with([fresh])
+        mock_repository.save.assert_not_called()
+        assert result.new_earthquakes == 1
+        assert result.updated_earthquakes == 1
+        assert result.earthquake_ids == [fresh.id]
+
+        mock_publisher.publish_many.assert_awaited_once()
+        (published,) = mock_publisher.publish_many.call_args[0][0]
+        assert isinstance(published, EarthquakeDetected)
+        assert published.earthquake_id == fresh.id
+
+    @pytest.mark.asyncio
+    async def test_events_for_the_batch_are_published_together(
+        self, use_case, mock_publisher
+    ):
+        minor = self._earthquake("us-1", magnitude=3.0)
+        major = self._earthquake("us-2", magnitude=6.5)
+
+        await use_case.execute([minor, major])
+
+        mock_publisher.publish_many.assert_awaited_once()
+        events = mock_publisher.publish_many.call_args[0][0]
+        assert [type(event) for event in events] == [
+            EarthquakeDetected,
+            EarthquakeDetected,
+            HighMagnitudeAlert,
+        ]
+        assert len({event.timestamp for event in events}) == 1
+
+    @pytest.mark.asyncio
+    async def test_conflicting_rows_in_bulk_save_count_as_updated(
+        self, use_case, mock_repository
+    ):
+        first = self._earthquake("us-1")
+        second = self._earthquake("us-2")
+        mock_repository.save_many.side_effect = None
+        mock_repository.save_many.return_value = [first.id, "stored-id"]
+
+        result = await use_case.execute([first, second])
+
+        assert result.new_earthquakes == 1
+        assert result.updated_earthquakes == 1
+        assert result.earthquake_ids == [first.id]
+
+    @pytest.mark.asyncio
+    async def test_failed_bulk_save_retries_per_row_and_counts_errors(
+        self, use_case, mock_repository
+    ):
+        mock_repository.save_many.side_effect = RuntimeError("bulk failed")
+        mock_repository.save.side_effect = [RuntimeError("db down"), "other-id"]
+
+        result = await use_case.execute(
+            [self._earthquake("us-1"), self._earthquake("us-2")]
+        )
+
+        assert result.errors == 1
+        assert result.new_earthquakes == 0
+        assert result.updated_earthquakes == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_existence_check_falls_back_to_save(
+        self, use_case, mock_repository
+    ):
+        mock_repository.find_ids_by_external_ids.side_effect = RuntimeError("boom")
+        earthquake = self._earthquake("us-1")
+
+        result = await use_case.execute([earthquake])
+
+        mock_repository.save_many.assert_awaited_once_with([earthquake])
+        assert result.new_earthquakes == 1
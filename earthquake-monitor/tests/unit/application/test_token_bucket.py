@@ -0,0 +1,41 @@
+import asyncio
+
+import pytest
+
+from src.application.events.token_bucket import TokenBucket
+
+
+class TestTokenBucket:
+    @pytest.mark.asyncio
+    async def test_burst_within_capacity_does_not_wait(self):
+        bucket = TokenBucket(capacity=5, refill_rate=1)
+        loop = asyncio.get_running_loop()
+
+        started = loop.time()
+        for _ in range(5):
+            await bucket.acquire()
+
+        assert loop.time() - started < 0.5
+
+    @pytest.mark.asyncio
+    async def test_waits_for_refill_when_empty(self):
+        bucket = TokenBucket(capacity=1, refill_rate=20)
+        loop = asyncio.get_running_loop()
+
+        await bucket.acquire()
+        started = loop.time()
+        await bucket.acquire()
+
+        assert loop.time() - started >= 0.04
+
+    @pytest.mark.asyncio
+    async def test_rejects_request_larger_than_capacity(self):
+        bucket = TokenBucket(capacity=2, refill_rate=1)
+
+        with pytest.raises(ValueError):
+            await bucket.acquire(3)
+
+    @pytest.mark.parametrize("capacity, refill_rate", [(0, 1), (1, 0)])
+    def test_rejects_invalid_configuration(self, capacity, refill_rate):
+        with pytest.raises(ValueError):
+            TokenBucket(capacity=capacity, refill_rate=refill_rate)
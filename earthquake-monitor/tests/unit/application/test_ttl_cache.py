@@ -0,0 +1,64 @@
+import pytest
+
+from src.application.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache:
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    def test_get_returns_stored_value(self, clock):
+        cache = TTLCache(maxsize=2, ttl=10, timer=clock)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert "a" in cache
+        assert cache.get("missing") is None
+
+    def test_entries_expire_after_ttl(self, clock):
+        cache = TTLCache(maxsize=2, ttl=10, timer=clock)
+        cache.set("a", 1)
+
+        clock.now = 10.0
+
+        assert cache.get("a", "expired") == "expired"
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self, clock):
+        cache = TTLCache(maxsize=2, ttl=10, timer=clock)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+
+    def test_invalidate_and_clear(self, clock):
+        cache = TTLCache(maxsize=4, ttl=10, timer=clock)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.invalidate("a")
+        cache.invalidate("unknown")
+        assert "a" not in cache
+        assert len(cache) == 1
+
+        cache.clear()
+        assert len(cache) == 0
+
+    @pytest.mark.parametrize("maxsize, ttl", [(0, 10), (2, 0)])
+    def test_rejects_invalid_configuration(self, maxsize, ttl):
+        with pytest.raises(ValueError):
+            TTLCache(maxsize=maxsize, ttl=ttl)
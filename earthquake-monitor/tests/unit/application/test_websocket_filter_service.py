@@ -0,0 +1,132 @@
+import time
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.application.services.websocket_filter_service import WebSocketFilterService
+from src.domain.entities.earthquake import Earthquake
+from src.domain.entities.location import Location
+from src.domain.entities.magnitude import Magnitude
+
+
+class TestWebSocketFilterService:
+    @pytest.fixture
+    def filter_service(self, monkeypatch):
+        monkeypatch.setenv("WEBSOCKET_MIN_MAGNITUDE", "2.0")
+        monkeypatch.setenv("WEBSOCKET_MAX_PER_MINUTE", "2")
+        monkeypatch.setenv("WEBSOCKET_THROTTLE_SECONDS", "0")
+        monkeypatch.setenv("WEBSOCKET_MAX_AGE_MINUTES", "60")
+        return WebSocketFilterService()
+
+    @staticmethod
+    def _earthquake(magnitude: float = 4.0, age: timedelta = timedelta(minutes=5)):
+        return Earthquake(
+            location=Location(latitude=37.7749, longitude=-122.4194, depth=10.0),
+            magnitude=Magnitude(value=magnitude),
+            occurred_at=datetime.now(UTC) - age,
+            source="USGS",
+        )
+
+    def test_rate_limit_resets_in_next_minute(self, filter_service):
+        minute = 1_000 * 60.0
+
+        filter_service._update_client_tracking("client-1", minute)
+        filter_service._update_client_tracking("client-1", minute + 1)
+
+        assert not filter_service._passes_rate_limit_filter("client-1", minute + 2)
+        assert filter_service._passes_rate_limit_filter("client-1", minute + 60)
+        # Three minutes later the same ring cell is reused for the new minute
+        filter_service._update_client_tracking("client-1", minute + 180)
+        assert filter_service._passes_rate_limit_filter("client-1", minute + 181)
+
+    def test_unknown_client_passes_rate_limit(self, filter_service):
+        assert filter_service._passes_rate_limit_filter("new-client", 60.0)
+
+    def test_should_broadcast_earthquake_applies_rate_limit(self, filter_service):
+        earthquake = self._earthquake()
+
+        results = [
+            filter_service.should_broadcast_earthquake(earthquake, "client-1")
+            for _ in range(3)
+        ]
+
+        assert results == [True, True, False]
+        assert filter_service.should_broadcast_earthquake(earthquake, "client-2")
+
+    def test_rejects_small_and_old_earthquakes(self, filter_service):
+        assert not filter_service.should_broadcast_earthquake(
+            self._earthquake(magnitude=1.5), "client-1"
+        )
+        assert not filter_service.should_broadcast_earthquake(
+            self._earthquake(age=timedelta(hours=2)), "client-1"
+        )
+
+    def test_filter_for_clients_selects_clients_under_their_limit(
+        self, filter_service
+    ):
+        earthquake = self._earthquake()
+        filter_service._update_client_tracking("busy", time.time())
+        filter_service._update_client_tracking("busy", time.time())
+
+        selected = filter_service.filter_for_clients(
+            earthquake, ["client-1", "busy", "client-2"]
+        )
+
+        assert selected == ["client-1", "client-2"]
+        assert filter_service.filter_for_clients(
+            self._earthquake(magnitude=1.5), ["client-1"]
+        ) == []
+
+    def test_alerts_do_not_use_up_the_rate_limit(self, filter_service):
+        earthquake = self._earthquake(magnitude=6.0)
+
+        assert not filter_service.should_broadcast_alert(
+            self._earthquake(magnitude=3.0), "client-1"
+        )
+        for _ in range(3):
+            assert filter_service.should_broadcast_alert(earthquake, "client-1")
+
+        assert filter_service.should_broadcast_earthquake(earthquake, "client-1")
+        assert filter_service.get_filter_stats()["stats"]["alert_clients"] == 1
+
+    def test_alert_magnitude_filter_tracks_alert_clients(self, filter_service):
+        assert not filter_service.should_broadcast_alert_magnitude(
+            "eq-1", 3.5, "client-1"
+        )
+        assert filter_service.should_broadcast_alert_magnitude("eq-1", 6.0, "client-1")
+
+        assert filter_service.get_filter_stats()["stats"]["alert_clients"] == 1
+
+    def test_throttle_blocks_rapid_broadcasts(self, filter_service):
+        filter_service.throttle_interval_seconds = 60.0
+        earthquake = self._earthquake()
+
+        assert filter_service.should_broadcast_earthquake(earthquake, "client-1")
+        assert not filter_service.should_broadcast_earthquake(earthquake, "client-1")
+
+    def test_idle_client_state_is_dropped(self, filter_service):
+        filter_service._update_client_tracking("idle", 0.0)
+        filter_service._update_client_tracking("active", 0.0)
+
+        # Each rotation keeps only clients touched since the previous one
+        filter_service._update_client_tracking("active", 61.0)
+        assert filter_service.get_filter_stats()["stats"]["active_clients"] == 2
+
+        filter_service._update_client_tracking("active", 122.0)
+        assert filter_service.get_filter_stats()["stats"]["active_clients"] == 1
+        assert filter_service._client_last_broadcast.get("idle") is None
+        assert filter_service._client_last_broadcast.get("active") == 122.0
+
+    def test_batch_matches_sequential_checks(self, filter_service):
+        earthquakes = [
+            self._earthquake(magnitude=1.0),
+            self._earthquake(),
+            self._earthquake(age=timedelta(hours=2)),
+            self._earthquake(),
+            self._earthquake(),
+        ]
+
+        results = filter_service.should_broadcast_batch(earthquakes, "client-1")
+
+        # Small and old earthquakes fail; the third recent one hits the limit of 2
+        assert results == [False, True, False, True, False]
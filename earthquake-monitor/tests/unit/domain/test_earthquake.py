@@ -1,4 +1,5 @@
 from datetime import UTC, datetime, timedelta
+from uuid import UUID
 
 import pytest
 
@@ -24,6 +25,25 @@ class TestEarthquake:
         assert earthquake.source == "USGS"
         assert earthquake.is_reviewed is False
 
+    def test_generated_ids_are_unique_uuid4_strings(self):
+        location = Location(latitude=37.7749, longitude=-122.4194, depth=10.5)
+        occurred_at = datetime.now(UTC) - timedelta(hours=1)
+
+        ids = {
+            Earthquake(
+                location=location,
+                magnitude=Magnitude(value=5.5),
+                occurred_at=occurred_at,
+            ).id
+            for _ in range(100)
+        }
+
+        assert len(ids) == 100
+        for earthquake_id in ids:
+            parsed = UUID(earthquake_id)
+            assert parsed.version == 4
+            assert str(parsed) == earthquake_id
+
     def test_mark_as_reviewed(self):
         location = Location(latitude=37.7749, longitude=-122.4194, depth=10.5)
         magnitude = Magnitude(value=5.5)
@@ -36,6 +56,18 @@ class TestEarthquake:
         earthquake.mark_as_reviewed()
         assert earthquake.is_reviewed is True
 
+    def test_occurred_ts_matches_occurred_at(self):
+        occurred_at = datetime(2024, 1, 1, 12, 0, 0)
+
+        earthquake = Earthquake(
+            location=Location(latitude=37.7749, longitude=-122.4194, depth=10.5),
+            magnitude=Magnitude(value=5.5),
+            occurred_at=occurred_at,
+        )
+
+        # Naive datetimes are treated as UTC
+        assert earthquake.occurred_ts == occurred_at.replace(tzinfo=UTC).timestamp()
+
     def test_calculate_affected_radius(self):
         location = Location(latitude=37.7749, longitude=-122.4194, depth=20.0)
         magnitude = Magnitude(value=6.0)
@@ -48,6 +80,38 @@ class TestEarthquake:
         radius = earthquake.calculate_affected_radius_km()
         assert radius > 0
 
+    def test_alert_context_matches_individual_checks(self):
+        earthquake = Earthquake(
+            location=Location(latitude=34.0522, longitude=-118.2437, depth=10.0),
+            magnitude=Magnitude(value=6.5),
+            occurred_at=datetime.now(UTC) - timedelta(hours=1),
+        )
+
+        context = earthquake.compute_alert_context()
+
+        assert context.requires_alert == earthquake.requires_immediate_alert()
+        assert context.alert_level == earthquake.magnitude.get_alert_level()
+        assert context.affected_radius_km == earthquake.calculate_affected_radius_km()
+        assert earthquake.get_impact_assessment()["requires_immediate_alert"] is (
+            context.requires_alert
+        )
+
+    def test_alert_context_is_cached_until_inputs_change(self):
+        earthquake = Earthquake(
+            location=Location(latitude=34.0522, longitude=-118.2437, depth=10.0),
+            magnitude=Magnitude(value=6.5),
+            occurred_at=datetime.now(UTC) - timedelta(hours=1),
+        )
+
+        context = earthquake.compute_alert_context()
+        assert earthquake.compute_alert_context() is context
+
+        earthquake.location = Location(latitude=0.0, longitude=0.0, depth=10.0)
+        updated = earthquake.compute_alert_context()
+
+        assert updated is not context
+        assert updated.requires_alert is False
+
     def test_create_earthquake_future_date_raises_error(self):
         """Test that creating an earthquake with future date raises InvalidDateTimeError."""
         location = Location(latitude=37.7749, longitude=-122.4194, depth=10.5)
@@ -24,6 +24,43 @@ class TestEarthquakeDetected:
         assert event.source == "USGS"
         assert event.timestamp is not None
 
+    def test_attached_earthquake_is_ignored_in_equality(self):
+        fields = dict(
+            earthquake_id="test-123",
+            occurred_at=datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC),
+            magnitude=5.5,
+            latitude=37.7749,
+            longitude=-122.4194,
+            depth=10.5,
+            source="USGS",
+            timestamp=datetime(2024, 1, 1, 12, 0, 1, tzinfo=UTC),
+        )
+
+        plain = EarthquakeDetected(**fields)
+        with_entity = EarthquakeDetected(**fields, earthquake=object())
+
+        assert plain.earthquake is None
+        assert plain == with_entity
+        assert "earthquake=" not in repr(with_entity)
+
+    def test_timestamp_keeps_its_positional_slot(self):
+        timestamp = datetime(2024, 1, 1, 12, 0, 1, tzinfo=UTC)
+
+        event = EarthquakeDetected(
+            "test-123",
+            datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC),
+            5.5,
+            37.7749,
+            -122.4194,
+            10.5,
+            "USGS",
+            "M 5.5",
+            timestamp,
+        )
+
+        assert event.timestamp == timestamp
+        assert event.earthquake is None
+
 
 class TestHighMagnitudeAlert:
     def test_create_high_magnitude_alert(self):
@@ -1,6 +1,8 @@
+from unittest.mock import patch
+
 import pytest
 
-from src.domain.entities.location import Location
+from src.domain.entities.location import Location, haversine_km_batch
 from src.domain.exceptions import InvalidLocationError
 
 
@@ -51,6 +53,35 @@ class TestLocation:
         distance = location.distance_to(location)
         assert distance == 0.0
 
+    def test_cached_distance_terms_do_not_affect_equality(self):
+        location = Location(latitude=37.7749, longitude=-122.4194, depth=10.5)
+        other = Location(latitude=34.0522, longitude=-118.2437, depth=0)
+
+        first = location.distance_to(other)
+
+        assert location.distance_to(other) == first
+        assert location == Location(latitude=37.7749, longitude=-122.4194, depth=10.5)
+        assert "terms" not in repr(location)
+
+    def test_batch_distances_match_distance_to(self):
+        origin = Location(latitude=37.7749, longitude=-122.4194, depth=0)
+        points = [
+            Location(latitude=34.0522, longitude=-118.2437, depth=0),
+            Location(latitude=-33.8688, longitude=151.2093, depth=0),
+            origin,
+        ]
+
+        distances = haversine_km_batch(
+            origin.latitude,
+            origin.longitude,
+            [point.latitude for point in points],
+            [point.longitude for point in points],
+        )
+
+        assert distances == pytest.approx(
+            [origin.distance_to(point) for point in points]
+        )
+
     def test_is_near_populated_area_true(self):
         # Location near San Francisco
         location = Location(latitude=37.8, longitude=-122.4, depth=10.0)
@@ -61,6 +92,39 @@ class TestLocation:
         location = Location(latitude=0.0, longitude=-150.0, depth=10.0)
         assert location.is_near_populated_area() is False
 
+    def test_is_near_populated_area_uses_center_radius(self):
+        new_york = Location(latitude=40.7128, longitude=-74.0060, depth=0.0)
+        # 0.44 and 0.46 degrees of latitude are about 49 km and 51 km
+        inside = Location(latitude=40.7128 + 0.44, longitude=-74.0060, depth=10.0)
+        outside = Location(latitude=40.7128 + 0.46, longitude=-74.0060, depth=10.0)
+
+        assert inside.distance_to(new_york) < 50 < outside.distance_to(new_york)
+        assert inside.is_near_populated_area() is True
+        assert outside.is_near_populated_area() is False
+
+    def test_is_near_populated_area_bounding_box_edges(self):
+        new_york = Location(latitude=40.7128, longitude=-74.0060, depth=0.0)
+        # 0.58 degrees of longitude at this latitude is about 49 km
+        east = Location(latitude=40.7128, longitude=-74.0060 + 0.58, depth=10.0)
+        # Inside the bounding box but outside the circle
+        corner = Location(latitude=40.7128 + 0.4, longitude=-74.0060 + 0.5, depth=10.0)
+
+        assert east.distance_to(new_york) < 50 < corner.distance_to(new_york)
+        assert east.is_near_populated_area() is True
+        assert corner.is_near_populated_area() is False
+
+    def test_is_near_populated_area_is_computed_once(self):
+        location = Location(latitude=37.8, longitude=-122.4, depth=10.0)
+
+        with patch.object(
+            Location, "_check_population_centers", autospec=True, return_value=True
+        ) as mock_check:
+            assert location.is_near_populated_area() is True
+            assert location.is_near_populated_area() is True
+
+        assert mock_check.call_count == 1
+        assert location == Location(latitude=37.8, longitude=-122.4, depth=10.0)
+
     def test_location_immutability(self):
         location = Location(latitude=37.7749, longitude=-122.4194, depth=10.5)
 
@@ -14,6 +14,11 @@ class TestMagnitude:
         magnitude = Magnitude(value=4.0)
         assert magnitude.scale == MagnitudeScale.MOMENT
 
+    def test_scale_members_are_plain_strings(self):
+        assert MagnitudeScale.RICHTER == "richter"
+        assert "moment" in {MagnitudeScale.MOMENT}
+        assert f"{MagnitudeScale.BODY_WAVE}" == "body_wave"
+
     def test_negative_value_raises_error(self):
         with pytest.raises(
             InvalidMagnitudeError, match="Magnitude value must be non-negative"
@@ -0,0 +1,139 @@
+import pytest
+
+from src.domain.entities.location import Location, haversine_km
+from src.domain.services.population_config import (
+    PopulationCenter,
+    PopulationCenterConfig,
+)
+from src.domain.services.population_service import PopulationServiceImpl
+from src.domain.services.population_service_impl import (
+    ConfigurablePopulationService,
+)
+
+CENTERS = [
+    PopulationCenter("San Francisco", 37.7749, -122.4194, 100.0),
+    PopulationCenter("Tokyo", 35.6762, 139.6503, 150.0),
+    PopulationCenter("Smallville", 10.0, 10.0, 20.0),
+]
+
+
+class TestPopulationCenterConfig:
+    def test_as_columns_keeps_center_order(self):
+        columns = PopulationCenterConfig.as_columns(CENTERS)
+
+        assert columns.names == ("San Francisco", "Tokyo", "Smallville")
+        assert columns.latitudes == (37.7749, 35.6762, 10.0)
+        assert columns.longitudes == (-122.4194, 139.6503, 10.0)
+        assert columns.thresholds_km == (100.0, 150.0, 20.0)
+
+    def test_from_env_string_parses_centers(self):
+        centers = PopulationCenterConfig.from_env_string("A,1.5,2.5,30;B,3,4")
+
+        assert centers == [
+            PopulationCenter("A", 1.5, 2.5, 30.0),
+            PopulationCenter("B", 3.0, 4.0, 100.0),
+        ]
+
+    def test_from_env_string_returns_fresh_lists(self):
+        first = PopulationCenterConfig.from_env_string("A,1.5,2.5,30")
+        first.append(PopulationCenter("B", 3.0, 4.0))
+
+        assert PopulationCenterConfig.from_env_string("A,1.5,2.5,30") == [
+            PopulationCenter("A", 1.5, 2.5, 30.0)
+        ]
+
+    @pytest.mark.parametrize("env_string", ["", "  ", "not-a-center"])
+    def test_from_env_string_falls_back_to_defaults(self, env_string):
+        assert PopulationCenterConfig.from_env_string(env_string) == (
+            PopulationCenterConfig.get_default_population_centers()
+        )
+
+
+class TestPopulationServiceImpl:
+    @pytest.fixture
+    def service(self):
+        return PopulationServiceImpl(CENTERS)
+
+    @pytest.mark.parametrize(
+        "latitude, longitude, expected",
+        [
+            (37.8, -122.3, True),  # next to San Francisco
+            (36.5, 139.6, True),  # about 90 km from Tokyo
+            (10.1, 10.1, True),  # about 16 km from Smallville
+            (10.3, 10.0, False),  # about 33 km from Smallville
+            (0.0, -150.0, False),  # open Pacific
+        ],
+    )
+    def test_is_near_populated_area(self, service, latitude, longitude, expected):
+        location = Location(latitude=latitude, longitude=longitude, depth=10.0)
+
+        assert service.is_near_populated_area(location) is expected
+
+    def test_is_near_populated_area_matches_center_distances(self, service):
+        for latitude in range(-80, 81, 5):
+            for longitude in range(-180, 181, 10):
+                location = Location(latitude=latitude, longitude=longitude, depth=0.0)
+                expected = any(
+                    location.distance_to(Location(c.latitude, c.longitude, 0))
+                    < c.proximity_threshold_km
+                    for c in CENTERS
+                )
+
+                assert service.is_near_populated_area(location) is expected
+
+    def test_large_catalog_matches_brute_force(self):
+        centers = [
+            PopulationCenter(f"Town {lat},{lng}", lat + 0.3, lng + 0.7, 60.0 + lat % 7)
+            for lat in range(-60, 61, 10)
+            for lng in range(-165, 180, 30)
+        ]
+        service = PopulationServiceImpl(centers)
+        # Probe points around every center, on both sides of its threshold
+        probes = [
+            (c.latitude + dlat, c.longitude + dlng)
+            for c in centers
+            for dlat in (-0.7, -0.4, 0.0, 0.5)
+            for dlng in (-0.9, 0.0, 0.6)
+        ]
+
+        for latitude, longitude in probes:
+            location = Location(latitude=latitude, longitude=longitude, depth=0.0)
+            expected = any(
+                haversine_km(latitude, longitude, c.latitude, c.longitude)
+                < c.proximity_threshold_km
+                for c in centers
+            )
+
+            assert service.is_near_populated_area(location) is expected
+
+    def test_affected_population_estimate(self, service):
+        tokyo = Location(latitude=35.6762, longitude=139.6503, depth=10.0)
+        ocean = Location(latitude=0.0, longitude=-150.0, depth=10.0)
+
+        assert service.get_affected_population_estimate(tokyo, 50.0) == 37_400_000
+        assert service.get_affected_population_estimate(ocean, 500.0) == 0
+
+    def test_affected_population_scales_with_distance(self, service):
+        center = Location(latitude=10.0, longitude=10.45, depth=10.0)
+        distance = center.distance_to(Location(10.0, 10.0, 0))
+
+        estimate = service.get_affected_population_estimate(center, 100.0)
+
+        assert estimate == pytest.approx(1_000_000 * (1 - distance / 100.0), abs=1)
+
+
+class TestConfigurablePopulationService:
+    @pytest.mark.parametrize(
+        "latitude, longitude, expected",
+        [
+            (37.8, -122.3, True),
+            (10.1, 10.1, True),
+            (10.3, 10.0, False),
+            (0.0, -150.0, False),
+        ],
+    )
+    def test_is_location_near_populated_area(self, latitude, longitude, expected):
+        service = ConfigurablePopulationService(CENTERS)
+        location = Location(latitude=latitude, longitude=longitude, depth=10.0)
+
+        assert service.is_location_near_populated_area(location) is expected
@@ -2,11 +2,12 @@
 
 import os
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
+from src.application.interfaces.job_scheduler import JobScheduler
 from src.application.services.scheduled_job_service import ScheduledJobService
 from src.domain.entities.earthquake import Earthquake
 from src.domain.entities.location import Location
@@ -319,6 +320,43 @@ class TestScheduledJobService:
         # The trigger should reflect the 5-minute interval
         assert "0:05:00" in str(job.trigger)
 
+    @patch.dict(
+        os.environ,
+        {"USGS_INGESTION_PERIOD": "day", "USGS_INGESTION_MAX_EARTHQUAKES": "25"},
+    )
+    async def test_ingestion_settings_are_read_at_setup(self):
+        """Test that job ticks reuse the request built during setup."""
+        mock_scheduler = Mock(spec=JobScheduler)
+        use_case = Mock()
+        use_case.execute = AsyncMock()
+        service = ScheduledJobService(
+            job_scheduler=mock_scheduler, scheduled_ingestion_use_case=use_case
+        )
+
+        await service.setup_earthquake_ingestion_job()
+        job_func = mock_scheduler.add_job.call_args.kwargs["func"]
+
+        with patch.dict(os.environ, {"USGS_INGESTION_PERIOD": "week"}):
+            await job_func()
+
+        request = use_case.execute.call_args[0][0]
+        assert request.period == "day"
+        assert request.limit == 25
+
+    async def test_setup_replaces_existing_job(self):
+        """Test that repeated setup asks the scheduler to replace the job."""
+        mock_scheduler = Mock(spec=JobScheduler)
+        service = ScheduledJobService(
+            job_scheduler=mock_scheduler, scheduled_ingestion_use_case=Mock()
+        )
+
+        await service.setup_earthquake_ingestion_job()
+        await service.setup_earthquake_ingestion_job()
+
+        assert mock_scheduler.add_job.call_count == 2
+        for call in mock_scheduler.add_job.call_args_list:
+            assert call.kwargs["replace_existing"] is True
+
 
 class TestSchedulerIntegration:
     """Integration tests for scheduler behavior."""
@@ -0,0 +1,33 @@
+"""Unit tests for USGS feed parsing helpers."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from src.domain.entities.magnitude import MagnitudeScale
+from src.infrastructure.external.usgs_service import (
+    magnitude_scale_from_usgs,
+    usgs_timestamp_to_datetime,
+)
+
+
+class TestUSGSParsingHelpers:
+    def test_timestamp_is_converted_to_utc_with_milliseconds(self):
+        occurred_at = usgs_timestamp_to_datetime(1704110400123)
+
+        assert occurred_at == datetime(2024, 1, 1, 12, 0, 0, 123000, tzinfo=UTC)
+        assert occurred_at.tzinfo is UTC
+
+    @pytest.mark.parametrize(
+        "mag_type, expected",
+        [
+            ("mww", MagnitudeScale.MOMENT),
+            ("Mw", MagnitudeScale.MOMENT),
+            ("ml", MagnitudeScale.RICHTER),
+            ("ML", MagnitudeScale.RICHTER),
+            ("md", MagnitudeScale.MOMENT),
+            (None, MagnitudeScale.MOMENT),
+        ],
+    )
+    def test_magnitude_scale_mapping(self, mag_type, expected):
+        assert magnitude_scale_from_usgs(mag_type) == expected
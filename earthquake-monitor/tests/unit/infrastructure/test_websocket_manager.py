@@ -0,0 +1,187 @@
+"""Unit tests for WebSocket manager broadcasting."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import orjson
+import pytest
+
+from src.infrastructure.external.websocket_manager import (
+    MAX_MESSAGE_SIZE,
+    WebSocketManager,
+)
+
+
+class TestWebSocketManager:
+    @pytest.fixture
+    def manager(self):
+        manager = WebSocketManager()
+        for client_id in ("client-1", "client-2"):
+            websocket = Mock()
+            websocket.send_text = AsyncMock()
+            manager._connections[client_id] = websocket
+            manager._earthquake_subscribers.add(client_id)
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_broadcast_serializes_once_for_all_clients(self, manager):
+        message = {"type": "earthquake_detected", "data": {"id": "eq-1"}}
+
+        with patch(
+            "src.infrastructure.external.websocket_manager.orjson.dumps",
+            wraps=orjson.dumps,
+        ) as mock_dumps:
+            await manager.broadcast_earthquake_update(message)
+
+        mock_dumps.assert_called_once()
+        for websocket in manager._connections.values():
+            websocket.send_text.assert_called_once()
+            sent = websocket.send_text.call_args[0][0]
+            assert isinstance(sent, str)
+            assert json.loads(sent) == message
+
+    @pytest.mark.asyncio
+    async def test_oversized_message_is_replaced_with_error(self, manager):
+        message = {
+            "type": "earthquake_detected",
+            "data": {"payload": "x" * MAX_MESSAGE_SIZE, "timestamp": "now"},
+        }
+
+        await manager.broadcast_earthquake_update(message)
+
+        websocket = manager._connections["client-1"]
+        sent = json.loads(websocket.send_text.call_args[0][0])
+        assert sent["type"] == "error"
+        assert sent["timestamp"] == "now"
+
+    @pytest.mark.asyncio
+    async def test_failed_client_is_disconnected(self, manager):
+        manager._connections["client-1"].send_text.side_effect = RuntimeError("gone")
+
+        await manager.broadcast_earthquake_update({"type": "earthquake_detected"})
+
+        assert "client-1" not in manager._connections
+        assert "client-1" not in manager._earthquake_subscribers
+        manager._connections["client-2"].send_text.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_sends_to_clients_concurrently(self, manager):
+        # Each send waits until every client's send has started, which only
+        # completes if the sends are not awaited one after another
+        started = 0
+        all_started = asyncio.Event()
+
+        async def send_text(text):
+            nonlocal started
+            started += 1
+            if started == len(manager._connections):
+                all_started.set()
+            await all_started.wait()
+
+        for websocket in manager._connections.values():
+            websocket.send_text.side_effect = send_text
+
+        await asyncio.wait_for(
+            manager.broadcast_earthquake_update({"type": "x"}), timeout=1
+        )
+
+        assert "client-1" in manager._connections
+        assert "client-2" in manager._connections
+
+    @pytest.mark.asyncio
+    async def test_broadcast_without_subscribers_skips_filtering(self):
+        manager = WebSocketManager()
+        filter_service = Mock()
+        manager.set_filter_service(filter_service)
+
+        await manager.broadcast_earthquake_update({"type": "x"}, Mock())
+        await manager.broadcast_alert({"type": "y"}, Mock())
+
+        filter_service.filter_for_clients.assert_not_called()
+        filter_service.should_broadcast_alert_magnitude.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_alert_filters_clients_on_event_magnitude(self, manager):
+        manager._alert_subscribers.update(("client-1", "client-2"))
+        filter_service = Mock()
+        filter_service.should_broadcast_alert_magnitude.side_effect = (
+            lambda earthquake_id, magnitude, client_id: client_id == "client-2"
+        )
+        manager.set_filter_service(filter_service)
+        alert = Mock(earthquake_id="eq-1", magnitude=6.5)
+
+        await manager.broadcast_alert({"type": "y"}, alert=alert)
+
+        filter_service.should_broadcast_alert_magnitude.assert_any_call(
+            "eq-1", 6.5, "client-2"
+        )
+        manager._connections["client-1"].send_text.assert_not_called()
+        manager._connections["client-2"].send_text.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_filtered_broadcast_sends_to_selected_clients(self, manager):
+        filter_service = Mock()
+        filter_service.filter_for_clients.return_value = ["client-2"]
+        manager.set_filter_service(filter_service)
+        earthquake = Mock()
+
+        await manager.broadcast_earthquake_update({"type": "x"}, earthquake)
+
+        filter_service.filter_for_clients.assert_called_once_with(
+            earthquake, manager._earthquake_subscribers
+        )
+        manager._connections["client-1"].send_text.assert_not_called()
+        manager._connections["client-2"].send_text.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_batch_groups_clients_by_filtered_items(self, manager):
+        filter_service = Mock()
+
+        def should_broadcast_batch(earthquakes, client_id):
+            return [
+                earthquake == "big" or client_id == "client-1"
+                for earthquake in earthquakes
+            ]
+
+        filter_service.should_broadcast_batch.side_effect = should_broadcast_batch
+        manager.set_filter_service(filter_service)
+        items = [({"id": "eq-big"}, "big"), ({"id": "eq-small"}, "small")]
+
+        await manager.broadcast_earthquake_batch(items)
+
+        sent = {
+            client_id: json.loads(websocket.send_text.call_args[0][0])
+            for client_id, websocket in manager._connections.items()
+        }
+        assert sent["client-1"] == {
+            "type": "batch",
+            "items": [{"id": "eq-big"}, {"id": "eq-small"}],
+        }
+        assert sent["client-2"] == {"id": "eq-big"}
+
+    @pytest.mark.asyncio
+    async def test_invalid_json_message_returns_error(self, manager):
+        await manager.handle_message("client-1", "{not json")
+
+        websocket = manager._connections["client-1"]
+        sent = json.loads(websocket.send_text.call_args[0][0])
+        assert sent == {"type": "error", "message": "Invalid JSON message"}
+
+    @pytest.mark.asyncio
+    async def test_subscribe_message_is_parsed(self, manager):
+        manager._alert_subscribers.clear()
+
+        await manager.handle_message("client-1", '{"action": "subscribe_alerts"}')
+
+        assert "client-1" in manager._alert_subscribers
+
+    @pytest.mark.asyncio
+    async def test_messages_to_unknown_clients_are_dropped(self, manager):
+        manager.disconnect("client-1")
+        manager.disconnect("client-1")
+
+        await manager.handle_message("client-1", '{"action": "unknown"}')
+
+        assert "client-1" not in manager._connections
+        manager._connections["client-2"].send_text.assert_not_called()